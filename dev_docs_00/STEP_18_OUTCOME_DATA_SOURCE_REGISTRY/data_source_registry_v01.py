@@ -2,6 +2,10 @@
 # Created: 2025-12-16
 # Version Notes:
 # - v01: Data source registry skeleton
+# - v01.1: Batch fetch path (fetch_many) with partial per-symbol fallback and provenance
+# - v01.2: Health-aware routing (provider_health_v01.py): latency/error tracking, circuit breakers, metrics
+# - v01.3: Optional hedged fetches (second provider fired after the first one's p95 latency)
+# - v01.3.1: A cancelled (never started) hedge call releases its health claim
 
 """
 DATA SOURCE REGISTRY (MARKET DATA PROVIDERS)
@@ -16,6 +20,43 @@ The registry:
 - exposes a unified fetch interface
 - reports data quality and provenance
 
+BATCH FETCH
+-----------
+`fetch_many(symbols)` requests a whole symbol list from each provider in
+one call (chunked by the provider's `max_batch_size`). Fallback is partial:
+only the symbols the primary could not serve are retried against the next
+provider, and every result records which provider served it.
+
+HEALTH-AWARE ROUTING
+--------------------
+Every provider call is timed and recorded in the provider's ProviderHealth
+(provider_health_v01.py). Each fetch orders providers by health instead of
+registration order alone:
+- HEALTHY providers first, in registration (priority) order
+- DEGRADED providers (p95 latency above the policy's slow threshold) next,
+  fastest first
+- providers with an open circuit breaker are skipped; once the cooldown
+  elapses one half-open probe call decides whether they come back
+
+The returned dicts keep their provenance ("provider" = who served the
+data). `health_metrics()` exposes per-provider state, latency percentiles
+and error rates.
+
+HEDGED REQUESTS
+---------------
+With `hedging=True`, fetch_market_data runs the first provider's call on a
+worker thread. If it has not answered within that provider's observed p95
+latency, the same request goes to the next routable provider; the first
+valid answer wins and the other call is cancelled (dropped if it already
+started: a blocking provider call cannot be interrupted). If both fail, the
+remaining providers are tried in order as usual.
+
+A provider is only hedged once it has `min_samples` latency samples, so the
+p95 is meaningful. By construction ~5% of fetches are hedged; the extra load
+and the gain are in `hedge_metrics()` (hedge rate, hedge wins, latency saved
+= losing primary's latency - winner's latency, measured when the primary
+finally answers). Batch fetches (fetch_many) are not hedged.
+
 SOURCE OF TRUTH
 ---------------
 Derived strictly from:
@@ -34,7 +75,14 @@ Data access only.
 # 1. Imports & Setup
 # ================================
 
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from provider_health_v01 import DEFAULT_HEALTH_POLICY, HealthPolicy, ProviderHealth
+
+DEFAULT_HEDGE_WORKERS = 16
 
 # ================================
 # 2. Provider Base Contract
@@ -49,12 +97,31 @@ class MarketDataProvider:
 
     provider_name: str = "UNKNOWN"
 
+    # Largest symbol list accepted by one fetch_many call (None = no limit)
+    max_batch_size: Optional[int] = None
+
     def fetch(self, symbol: str) -> Dict:
         """
         Fetch market data for a symbol.
         """
         raise NotImplementedError
 
+    def fetch_many(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch market data for several symbols.
+
+        Returns {symbol: data} for the symbols that succeeded; a symbol that
+        is absent failed. The default loops over fetch() — providers with a
+        bulk endpoint override this with a single request.
+        """
+        results = {}
+        for symbol in symbols:
+            try:
+                results[symbol] = self.fetch(symbol)
+            except Exception:
+                continue
+        return results
+
 # ================================
 # 3. Data Source Registry
 # ================================
@@ -66,8 +133,27 @@ class DataSourceRegistry:
     Maintains prioritized market data providers.
     """
 
-    def __init__(self):
+    def __init__(self,
+                 health_policy: HealthPolicy = DEFAULT_HEALTH_POLICY,
+                 clock: Callable[[], float] = time.monotonic,
+                 hedging: bool = False,
+                 hedge_max_workers: int = DEFAULT_HEDGE_WORKERS):
         self.providers: List[MarketDataProvider] = []
+        self.health_policy = health_policy
+        self.clock = clock
+        self.health: Dict[str, ProviderHealth] = {}
+
+        self.hedging = hedging
+        self.hedge_max_workers = hedge_max_workers
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+
+        # Hedge metrics
+        self.hedge_candidates = 0  # fetches that ran with a hedge timer
+        self.hedges_fired = 0
+        self.hedge_wins = 0  # hedges that answered first
+        self.latency_saved_seconds = 0.0
+        self.latency_saved_samples = 0
 
     # ================================
     # 4. Registry Management
@@ -78,41 +164,365 @@ class DataSourceRegistry:
         Register a data provider.
         """
         self.providers.append(provider)
+        self.health[provider.provider_name] = ProviderHealth(provider.provider_name, self.health_policy, self.clock)
 
     def list_providers(self) -> List[str]:
         """Return provider names in priority order."""
         return [p.provider_name for p in self.providers]
 
+    def routing_order(self) -> List[MarketDataProvider]:
+        """
+        Providers to try for the next fetch: healthy ones in priority order,
+        then degraded ones fastest first. Open circuits are left out.
+        """
+        now = self.clock()
+        ranked = []
+        for priority, provider in enumerate(self.providers):
+            health = self.health[provider.provider_name]
+            tier = health.tier(now)
+            if tier is None:
+                health.note_skipped()
+                continue
+            p95 = health.latency_percentile(95) if tier else 0.0
+            ranked.append((tier, p95, priority, provider))
+        ranked.sort(key=lambda entry: entry[:3])
+        return [entry[3] for entry in ranked]
+
+    def health_metrics(self) -> Dict[str, Dict]:
+        """Per-provider health (state, tier, latency percentiles, error rate, counters)."""
+        return {name: health.metrics() for name, health in self.health.items()}
+
     # ================================
     # 5. Unified Fetch Interface
     # ================================
 
     def fetch_market_data(self, symbol: str) -> Dict:
         """
-        Attempt to fetch data using registered providers.
-        Falls back on failure.
+        Attempt to fetch data using registered providers, healthiest first.
+        Falls back on failure; hedges a slow first provider when enabled.
         """
-        for provider in self.providers:
+        order = self.routing_order()
+        tried: Set[str] = set()
+        if self.hedging and len(order) > 1:
+            result = self._fetch_hedged(symbol, order, tried)
+            if result is not None:
+                return result
+
+        for provider in order:
+            if provider.provider_name in tried or not self.health[provider.provider_name].begin():
+                continue
             try:
-                data = provider.fetch(symbol)
-                return {
-                    "symbol": symbol,
-                    "data": data,
-                    "provider": provider.provider_name,
-                }
+                data, _ = self._timed_fetch(provider, symbol)
             except Exception as exc:
                 print(f"[DATA][WARN] Provider {provider.provider_name} failed: {exc}")
+                continue
+            return self._result(symbol, data, provider)
 
         raise RuntimeError("All data providers failed")
 
+    def _timed_fetch(self, provider: MarketDataProvider, symbol: str) -> Tuple[Dict, float]:
+        """provider.fetch with its outcome recorded in the provider's health (after begin())."""
+        health = self.health[provider.provider_name]
+        started = time.perf_counter()
+        try:
+            data = provider.fetch(symbol)
+        except Exception as exc:
+            health.record_failure(exc)
+            raise
+        elapsed = time.perf_counter() - started
+        health.record_success(elapsed)
+        return data, elapsed
+
+    @staticmethod
+    def _result(symbol: str, data: Dict, provider: MarketDataProvider) -> Dict:
+        return {
+            "symbol": symbol,
+            "data": data,
+            "provider": provider.provider_name,
+        }
+
+    # ================================
+    # 6. Hedged Fetch
+    # ================================
+
+    def hedge_delay(self, provider: MarketDataProvider) -> Optional[float]:
+        """Seconds to wait for `provider` before hedging (its p95); None = not enough samples."""
+        health = self.health[provider.provider_name]
+        if health.latency_samples() < self.health_policy.min_samples:
+            return None
+        return health.latency_percentile(95)
+
+    def _fetch_hedged(self, symbol: str, order: List[MarketDataProvider], tried: Set[str]) -> Optional[Dict]:
+        """
+        Race the first provider against the next one once its p95 has passed.
+        Returns None when hedging does not apply or both calls failed; the
+        providers used are added to `tried`.
+        """
+        primary = order[0]
+        delay = self.hedge_delay(primary)
+        if delay is None or not self.health[primary.provider_name].begin():
+            return None
+        tried.add(primary.provider_name)
+        with self._hedge_lock:
+            self.hedge_candidates += 1
+
+        started = time.perf_counter()
+        executor = self._executor()
+        primary_future = executor.submit(self._timed_fetch, primary, symbol)
+        futures: Dict[Future, MarketDataProvider] = {primary_future: primary}
+
+        done, _ = wait(futures, timeout=delay)
+        if not done:
+            backup = next((p for p in order[1:]
+                           if p.provider_name not in tried and self.health[p.provider_name].begin()), None)
+            if backup is not None:
+                tried.add(backup.provider_name)
+                futures[executor.submit(self._timed_fetch, backup, symbol)] = backup
+                with self._hedge_lock:
+                    self.hedges_fired += 1
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Simultaneous answers: the higher-priority provider wins
+            for future in sorted(done, key=lambda f: order.index(futures[f])):
+                provider = futures[future]
+                try:
+                    data, _ = future.result()
+                except Exception as exc:
+                    print(f"[DATA][WARN] Provider {provider.provider_name} failed: {exc}")
+                    continue
+                for loser in pending:
+                    if loser.cancel():
+                        # Never started: release its begin() claim (half-open probe)
+                        self.health[futures[loser].provider_name].abandon()
+                if provider is not primary:
+                    self._record_hedge_win(primary_future, time.perf_counter() - started)
+                return self._result(symbol, data, provider)
+        return None
+
+    def _record_hedge_win(self, primary_future: Future, winner_seconds: float) -> None:
+        with self._hedge_lock:
+            self.hedge_wins += 1
+
+        def record_saved(future: Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            _, primary_seconds = future.result()
+            with self._hedge_lock:
+                self.latency_saved_seconds += max(0.0, primary_seconds - winner_seconds)
+                self.latency_saved_samples += 1
+
+        primary_future.add_done_callback(record_saved)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=self.hedge_max_workers,
+                                                          thread_name_prefix="data-hedge")
+            return self._hedge_executor
+
+    def hedge_metrics(self) -> Dict:
+        """Hedge rate, wins and latency saved (to tune the extra provider load)."""
+        with self._hedge_lock:
+            candidates = self.hedge_candidates
+            return {
+                "eligible_fetches": candidates,
+                "hedges_fired": self.hedges_fired,
+                "hedge_rate": round(self.hedges_fired / candidates, 3) if candidates else 0.0,
+                "hedge_wins": self.hedge_wins,
+                "latency_saved_ms_total": round(self.latency_saved_seconds * 1000, 1),
+                "latency_saved_ms_avg": (round(self.latency_saved_seconds * 1000 / self.latency_saved_samples, 1)
+                                         if self.latency_saved_samples else None),
+            }
+
+    def close(self) -> None:
+        """Release the hedge worker threads (calls still running are abandoned)."""
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ================================
+    # 7. Batch Fetch
+    # ================================
+
+    def fetch_many(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Batch version of fetch_market_data.
+
+        Each provider is asked only for the symbols still unresolved, so a
+        primary that misses a few symbols sends just those to the fallbacks.
+
+        Returns
+        -------
+        dict[str, dict]
+            {symbol: {"symbol", "data", "provider"}} — same shape as
+            fetch_market_data. Symbols every provider failed on are absent.
+        """
+        results: Dict[str, Dict] = {}
+        remaining = list(dict.fromkeys(symbols))
+
+        for provider in self.routing_order():
+            if not remaining:
+                break
+
+            health = self.health[provider.provider_name]
+            batch_size = provider.max_batch_size or len(remaining)
+            for start in range(0, len(remaining), batch_size):
+                chunk = remaining[start:start + batch_size]
+                if not health.begin():
+                    continue
+                try:
+                    fetched = provider.fetch_many(chunk)
+                except Exception as exc:
+                    health.record_failure(exc)
+                    print(f"[DATA][WARN] Provider {provider.provider_name} batch of {len(chunk)} failed: {exc}")
+                    continue
+                health.record_success()
+
+                for symbol in chunk:
+                    if symbol in fetched:
+                        results[symbol] = {
+                            "symbol": symbol,
+                            "data": fetched[symbol],
+                            "provider": provider.provider_name,
+                        }
+
+            missed = [symbol for symbol in remaining if symbol not in results]
+            if missed and len(missed) < len(remaining):
+                print(f"[DATA][WARN] Provider {provider.provider_name} missed {len(missed)} symbol(s); trying fallback")
+            remaining = missed
+
+        if remaining:
+            print(f"[DATA][WARN] All data providers failed for: {remaining}")
+
+        return results
+
 # ================================
-# 6. Standalone Execution
+# 8. Standalone Execution
 # ================================
 
 if __name__ == "__main__":
+    import contextlib
+    import io
+    import time
+
     registry = DataSourceRegistry()
     print(registry.list_providers())
 
+    # Benchmark: per-symbol vs batch path against providers that charge a
+    # fixed round-trip per request (like a snapshot or HTTP quote endpoint)
+    class DemoRoundTripProvider(MarketDataProvider):
+        round_trip_seconds = 0.002
+
+        def __init__(self, name: str, unavailable: set = frozenset()):
+            self.provider_name = name
+            self.unavailable = unavailable
+            self.requests = 0
+
+        def _quote(self, symbol: str) -> Dict:
+            return {"symbol": symbol, "current_price": 4.25}
+
+        def fetch(self, symbol: str) -> Dict:
+            self.requests += 1
+            time.sleep(self.round_trip_seconds)
+            if symbol in self.unavailable:
+                raise LookupError(f"no data for {symbol}")
+            return self._quote(symbol)
+
+        def fetch_many(self, symbols: List[str]) -> Dict[str, Dict]:
+            self.requests += 1
+            time.sleep(self.round_trip_seconds)
+            return {s: self._quote(s) for s in symbols if s not in self.unavailable}
+
+    symbols = [f"SYM{i:03d}" for i in range(300)]
+    primary = DemoRoundTripProvider("DEMO_PRIMARY", unavailable=set(symbols[::25]))
+    fallback = DemoRoundTripProvider("DEMO_FALLBACK")
+    registry.register_provider(primary)
+    registry.register_provider(fallback)
+
+    started = time.perf_counter()
+    per_symbol = {}
+    with contextlib.redirect_stdout(io.StringIO()):  # silence per-symbol fallback warnings
+        for s in symbols:
+            per_symbol[s] = registry.fetch_market_data(s)
+    per_symbol_seconds = time.perf_counter() - started
+    per_symbol_requests = primary.requests + fallback.requests
+
+    primary.requests = fallback.requests = 0
+    started = time.perf_counter()
+    batch = registry.fetch_many(symbols)
+    batch_seconds = time.perf_counter() - started
+
+    print(f"Per-symbol: {per_symbol_seconds * 1000:.1f} ms, {per_symbol_requests} requests")
+    print(f"Batch:      {batch_seconds * 1000:.1f} ms, {primary.requests + fallback.requests} requests")
+    print(f"Same results + provenance: {batch == per_symbol}")
+    print(f"Served by fallback: {sorted(s for s, r in batch.items() if r['provider'] == 'DEMO_FALLBACK')[:4]} ...")
+
+    # Health-aware routing: a primary that is slow but never fails, then one that flaps
+    policy = HealthPolicy(min_samples=10, slow_p95_seconds=0.010, degraded_probe_seconds=0.5, open_seconds=0.5)
+    routed = DataSourceRegistry(health_policy=policy)
+    slow_primary = DemoRoundTripProvider("SLOW_PRIMARY")
+    slow_primary.round_trip_seconds = 0.020
+    routed.register_provider(slow_primary)
+    routed.register_provider(DemoRoundTripProvider("DEMO_FALLBACK"))
+
+    started = time.perf_counter()
+    served_by = [routed.fetch_market_data(s)["provider"] for s in symbols[:100]]
+    routed_ms = (time.perf_counter() - started) * 1000
+    print(f"Slow primary: 100 symbols in {routed_ms:.0f} ms (strict order: ~{100 * 20} ms) | "
+          f"primary served {served_by.count('SLOW_PRIMARY')}, fallback {served_by.count('DEMO_FALLBACK')}")
+
+    # Failing primary: breaker opens after 5 failures, a half-open probe brings it back
+    flapping = DemoRoundTripProvider("FLAPPING_PRIMARY", unavailable=set(symbols))
+    breaker = DataSourceRegistry(health_policy=policy)
+    breaker.register_provider(flapping)
+    breaker.register_provider(DemoRoundTripProvider("DEMO_FALLBACK"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for s in symbols[:100]:
+            breaker.fetch_market_data(s)
+    print(f"Failing primary: {flapping.requests} of 100 calls reached it | "
+          f"routing order: {[p.provider_name for p in breaker.routing_order()]}")
+
+    flapping.unavailable = set()
+    time.sleep(policy.open_seconds)
+    print("After cooldown:", breaker.fetch_market_data(symbols[0])["provider"])
+    for name, metrics in breaker.health_metrics().items():
+        print(f"  {name}: {metrics}")
+
+    # Hedged requests: a primary with a latency tail vs a steady fallback
+    import random
+
+    class TailLatencyProvider(DemoRoundTripProvider):
+        def fetch(self, symbol: str) -> Dict:
+            self.requests += 1
+            time.sleep(0.060 if random.random() < 0.02 else 0.003)
+            return self._quote(symbol)
+
+    random.seed(25)
+    for hedging in (False, True):
+        hedged = DataSourceRegistry(health_policy=HealthPolicy(slow_p95_seconds=1.0), hedging=hedging)
+        tail_primary = TailLatencyProvider("TAIL_PRIMARY")
+        steady = DemoRoundTripProvider("STEADY_FALLBACK")
+        steady.round_trip_seconds = 0.008
+        hedged.register_provider(tail_primary)
+        hedged.register_provider(steady)
+        for s in symbols[:50]:  # warm up the primary's p95
+            hedged.fetch_market_data(s)
+
+        latencies = []
+        for s in symbols[50:]:
+            started = time.perf_counter()
+            hedged.fetch_market_data(s)
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+        time.sleep(0.1)  # let losing primaries finish so latency saved is recorded
+        print(f"Hedging={hedging}: mean {sum(latencies) / len(latencies) * 1000:.1f} ms, "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms | "
+              f"fallback requests {steady.requests} | {hedged.hedge_metrics()}")
+        hedged.close()
+
 # ================================
 # END OF FILE
 # ================================
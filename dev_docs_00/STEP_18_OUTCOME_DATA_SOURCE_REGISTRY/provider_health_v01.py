@@ -0,0 +1,330 @@
+# File: provider_health_v01.py
+# Created: 2025-12-18
+# Version Notes:
+# - v01: Per-provider health (rolling latency percentiles, error rate) + circuit breaker with half-open probing
+# - v01.1: latency_samples() for the registry's hedge delay
+# - v01.2: abandon() releases a claim whose call never ran (cancelled hedge)
+
+"""
+PROVIDER HEALTH + CIRCUIT BREAKER
+---------------------------------
+
+GLOBAL CONTEXT
+--------------
+DataSourceRegistry tried providers strictly in registration order. A primary
+that is slow but not failing stalled every symbol, and a flapping one was
+retried on every call.
+
+ProviderHealth tracks one provider over a rolling window of its last
+`window_size` calls:
+- latency percentiles (p50 / p95 / p99) of calls that returned
+- error rate and consecutive failures
+
+and runs a circuit breaker on top:
+
+    CLOSED ──(failure_threshold consecutive failures, or error rate
+              >= error_rate_threshold over >= min_samples calls)──> OPEN
+    OPEN ──(open_seconds elapsed)──> HALF_OPEN
+    HALF_OPEN ──(one probe call succeeds)──> CLOSED (window cleared)
+    HALF_OPEN ──(probe fails)──> OPEN (cooldown restarts)
+
+Routing tiers (`tier(now)`), used by the registry to order providers:
+- HEALTHY  : breaker closed, p95 <= slow_p95_seconds
+- DEGRADED : breaker closed but p95 is slow; tried after healthy providers.
+             Every `degraded_probe_seconds` one call is routed to it in its
+             normal slot; a fast answer restarts its latency window, so a
+             recovered primary is back at once.
+- None     : breaker open, or half-open with its probe already in flight
+
+All methods are thread-safe (the concurrent fetcher calls the registry from
+a thread pool).
+
+SOURCE OF TRUTH
+---------------
+Derived strictly from:
+- STEP_18_OUTCOME_DATA_SOURCE_REGISTRY.md
+- data_source_registry_v01.py
+
+STANDALONE GUARANTEE
+-------------------
+No external dependencies; demo uses a manual clock.
+
+TRADING MODE
+------------
+Data access only.
+"""
+
+# ================================
+# 1. Imports
+# ================================
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+HEALTHY = 0
+DEGRADED = 1
+
+# ================================
+# 2. Health Policy
+# ================================
+
+@dataclass(frozen=True)
+class HealthPolicy:
+    """
+    HealthPolicy
+    ------------
+    Thresholds shared by every provider of a registry.
+    """
+
+    window_size: int = 100
+    min_samples: int = 20
+
+    failure_threshold: int = 5
+    error_rate_threshold: float = 0.5
+    open_seconds: float = 30.0
+
+    slow_p95_seconds: float = 1.0
+    degraded_probe_seconds: float = 10.0
+
+
+DEFAULT_HEALTH_POLICY = HealthPolicy()
+
+# ================================
+# 3. Provider Health
+# ================================
+
+class ProviderHealth:
+    """
+    ProviderHealth
+    --------------
+    Rolling health window + circuit breaker for one provider.
+    """
+
+    def __init__(self,
+                 name: str,
+                 policy: HealthPolicy = DEFAULT_HEALTH_POLICY,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.policy = policy
+        self.clock = clock
+        self._lock = threading.Lock()
+
+        self._latencies: Deque[float] = deque(maxlen=policy.window_size)
+        self._outcomes: Deque[bool] = deque(maxlen=policy.window_size)
+        self._sorted_latencies: Optional[list] = None  # cache, cleared on record
+
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.probe_in_flight = False
+        self.last_attempt_at: Optional[float] = None
+        self.consecutive_failures = 0
+
+        # Lifetime counters (metrics)
+        self.requests = 0
+        self.failures = 0
+        self.skipped = 0
+        self.times_opened = 0
+        self.last_error: Optional[str] = None
+
+    # ----------------------------
+    # Rolling Statistics
+    # ----------------------------
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Latency (seconds) at `percentile` over the window; None without samples."""
+        with self._lock:
+            return self._percentile(percentile)
+
+    def _percentile(self, percentile: float) -> Optional[float]:
+        if not self._latencies:
+            return None
+        if self._sorted_latencies is None:
+            self._sorted_latencies = sorted(self._latencies)
+        ordered = self._sorted_latencies
+        # Nearest-rank percentile
+        rank = max(1, -(-len(ordered) * percentile // 100))
+        return ordered[int(rank) - 1]
+
+    def latency_samples(self) -> int:
+        with self._lock:
+            return len(self._latencies)
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return self._error_rate()
+
+    def _error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    # ----------------------------
+    # Routing
+    # ----------------------------
+
+    def tier(self, now: Optional[float] = None) -> Optional[int]:
+        """HEALTHY, DEGRADED or None (do not route). Read-only: no probe is claimed."""
+        now = self.clock() if now is None else now
+        with self._lock:
+            return self._tier(now)
+
+    def _tier(self, now: float) -> Optional[int]:
+        if self.state == OPEN:
+            if now - self.opened_at < self.policy.open_seconds:
+                return None
+            return HEALTHY  # cooldown over: next call is the half-open probe
+        if self.state == HALF_OPEN:
+            return None if self.probe_in_flight else HEALTHY
+        if len(self._latencies) >= self.policy.min_samples:
+            p95 = self._percentile(95)
+            if p95 > self.policy.slow_p95_seconds:
+                probe_due = (self.last_attempt_at is None
+                             or now - self.last_attempt_at >= self.policy.degraded_probe_seconds)
+                return HEALTHY if probe_due else DEGRADED
+        return HEALTHY
+
+    def note_skipped(self) -> None:
+        """Routing left this provider out of a fetch (breaker open / probe busy)."""
+        with self._lock:
+            self.skipped += 1
+
+    def begin(self, now: Optional[float] = None) -> bool:
+        """
+        Claim the right to call the provider now.
+
+        False when the breaker is open or another thread holds the half-open
+        probe; the caller skips the provider.
+        """
+        now = self.clock() if now is None else now
+        with self._lock:
+            if self.state == OPEN:
+                if now - self.opened_at < self.policy.open_seconds:
+                    self.skipped += 1
+                    return False
+                self._transition(HALF_OPEN, "cooldown elapsed, probing")
+            if self.state == HALF_OPEN:
+                if self.probe_in_flight:
+                    self.skipped += 1
+                    return False
+                self.probe_in_flight = True
+            self.last_attempt_at = now
+            self.requests += 1
+            return True
+
+    def abandon(self) -> None:
+        """
+        Release a begin() claim whose call never ran (e.g. a hedge cancelled
+        before it started), so a half-open probe does not stay in flight.
+        """
+        with self._lock:
+            self.requests -= 1
+            if self.state == HALF_OPEN:
+                self.probe_in_flight = False
+
+    # ----------------------------
+    # Outcomes
+    # ----------------------------
+
+    def record_success(self, latency_seconds: Optional[float] = None) -> None:
+        """A call returned. Batch calls pass latency None (not comparable to single fetches)."""
+        with self._lock:
+            if latency_seconds is not None:
+                if (latency_seconds <= self.policy.slow_p95_seconds
+                        and len(self._latencies) >= self.policy.min_samples
+                        and self._percentile(95) > self.policy.slow_p95_seconds):
+                    # A fast call of a degraded provider restarts its latency window,
+                    # otherwise the sparse probes could never outvote the slow history
+                    self._latencies.clear()
+                self._latencies.append(latency_seconds)
+                self._sorted_latencies = None
+            if self.state == HALF_OPEN:
+                self.probe_in_flight = False
+                # Old errors must not reopen the breaker right away
+                self._outcomes.clear()
+                self._transition(CLOSED, "probe succeeded")
+            self._outcomes.append(True)
+            self.consecutive_failures = 0
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self._outcomes.append(False)
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+            if self.state == HALF_OPEN:
+                self.probe_in_flight = False
+                self._open("probe failed")
+            elif self.state == CLOSED:
+                if self.consecutive_failures >= self.policy.failure_threshold:
+                    self._open(f"{self.consecutive_failures} consecutive failures")
+                elif (len(self._outcomes) >= self.policy.min_samples
+                      and self._error_rate() >= self.policy.error_rate_threshold):
+                    self._open(f"error rate {self._error_rate():.0%} over {len(self._outcomes)} calls")
+
+    def _open(self, reason: str) -> None:
+        self.opened_at = self.clock()
+        self.times_opened += 1
+        self._transition(OPEN, reason)
+
+    def _transition(self, state: str, reason: str) -> None:
+        if state != self.state:
+            print(f"[DATA][HEALTH] Provider {self.name}: {self.state} -> {state} ({reason})")
+            self.state = state
+
+    # ----------------------------
+    # Metrics
+    # ----------------------------
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            now = self.clock()
+            tier = self._tier(now)
+            return {
+                "state": self.state,
+                "tier": {HEALTHY: "HEALTHY", DEGRADED: "DEGRADED", None: "UNAVAILABLE"}[tier],
+                "p50_ms": self._ms(self._percentile(50)),
+                "p95_ms": self._ms(self._percentile(95)),
+                "p99_ms": self._ms(self._percentile(99)),
+                "error_rate": round(self._error_rate(), 3),
+                "window_calls": len(self._outcomes),
+                "requests": self.requests,
+                "failures": self.failures,
+                "skipped": self.skipped,
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "last_error": self.last_error,
+            }
+
+    @staticmethod
+    def _ms(seconds: Optional[float]) -> Optional[float]:
+        return None if seconds is None else round(seconds * 1000, 1)
+
+# ================================
+# 4. Standalone Demo
+# ================================
+
+if __name__ == "__main__":
+    now = [0.0]
+    health = ProviderHealth("DEMO", HealthPolicy(open_seconds=5.0), clock=lambda: now[0])
+
+    for _ in range(5):
+        health.begin()
+        health.record_failure(TimeoutError("no response"))
+    print("After 5 failures:", health.state, "| routable:", health.tier() is not None)
+
+    now[0] = 6.0
+    print("Cooldown over, tier:", health.tier(), "| probe claimed:", health.begin(),
+          "| second caller:", health.begin())
+    health.record_success(0.050)
+    print("Metrics:", health.metrics())
+
+# ================================
+# END OF FILE
+# ================================
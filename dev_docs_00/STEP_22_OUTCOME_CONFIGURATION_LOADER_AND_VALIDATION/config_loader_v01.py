@@ -2,6 +2,7 @@
 # Created: 2025-12-16
 # Version Notes:
 # - v01: Configuration loader and validation skeleton
+# - v01.1: Optional scanner.scoring section (ScoringConfig weights/thresholds, STEP_35)
 
 """
 CONFIGURATION LOADER & VALIDATION ENGINE
@@ -13,6 +14,12 @@ This file loads and validates configuration before the system starts.
 
 If configuration is invalid, the system MUST NOT run.
 
+Optional sections:
+- scanner.scoring: scanner scoring weights and thresholds, keyed by the
+  ScoringConfig field names (STEP_35 scanner_scoring_config_v01.py).
+  FinalScannerEngine.from_config (STEP_38) builds its scoring engine from it;
+  missing keys keep their defaults.
+
 SOURCE OF TRUTH
 ---------------
 Derived strictly from:
@@ -109,6 +116,15 @@ class ConfigValidator:
         if phase not in ("TEST", "LIVE"):
             raise ValueError("risk.phase_mode must be TEST or LIVE")
 
+        # Optional: scanner scoring weights/thresholds (key names are checked
+        # by ScoringConfig.from_dict when the scanner is built)
+        scoring = config["scanner"].get("scoring", {})
+        if not isinstance(scoring, dict):
+            raise ValueError("scanner.scoring must be a mapping of weights/thresholds")
+        for key, value in scoring.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"scanner.scoring.{key} must be a number")
+
 # ================================
 # 4. Standalone Execution
 # ================================
@@ -118,7 +134,14 @@ if __name__ == "__main__":
     validator = ConfigValidator()
 
     # Placeholder example
-    cfg = {"system": {}, "scanner": {}, "strategy": {}, "risk": {"phase_mode": "TEST"}, "execution": {}, "storage": {}}
+    cfg = {
+        "system": {},
+        "scanner": {"scoring": {"gap_weight": 25.0}},
+        "strategy": {},
+        "risk": {"phase_mode": "TEST"},
+        "execution": {},
+        "storage": {},
+    }
     validator.validate(cfg)
     print("Config valid")
 
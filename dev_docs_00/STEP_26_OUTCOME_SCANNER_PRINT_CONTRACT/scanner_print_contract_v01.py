@@ -2,6 +2,7 @@
 # Created: 2025-12-16
 # Version Notes:
 # - v01: Frozen scanner print contract constants + lightweight validation helpers
+# - v01.1: ScannerPayload — __slots__ record generated from the contract (all fields present by construction)
 
 """
 SCANNER PRINT CONTRACT (FROZEN FIELDS)
@@ -13,6 +14,7 @@ This file encodes the **frozen scanner print contract** as:
 - ordered field names
 - brief descriptions
 - lightweight validation helpers
+- ScannerPayload, a slot-backed record generated from the ordered fields
 
 This ensures the printed output remains stable across refactors.
 
@@ -148,17 +150,124 @@ def validate_scanner_print_payload(payload: dict) -> list[str]:
     This is a *contract validator*, not a type validator.
     We only ensure that the system prints consistent fields.
     """
+    if isinstance(payload, ScannerPayload):
+        return []  # complete by construction
     return [f for f in SCANNER_PRINT_FIELDS_ORDERED if f not in payload]
 
 # ================================
-# 4. Standalone Demo
+# 4. Compiled Payload Record
+# ================================
+
+def build_payload_record_class(fields, class_name: str = "ScannerPayload", default="N/A"):
+    """
+    Generate a __slots__ record class with one slot per contract field.
+
+    The __init__ is compiled from source with one keyword argument per
+    field (like dataclasses do), so every field is set in a single call and
+    anything not passed is `default`. A record can therefore never be
+    missing a contract field: no normalization or validation pass needed.
+
+    Records are read like the payload dicts they replace (.get, [], in,
+    keys) and convert with to_dict() for storage.
+    """
+    fields = tuple(fields)
+    field_set = frozenset(fields)
+
+    params = ", ".join(f"{f}=_default" for f in fields)
+    body = "\n".join(f"    self.{f} = {f}" for f in fields)
+    namespace = {"_default": default}
+    exec(f"def __init__(self, *, {params}):\n{body}\n", namespace)
+
+    def get(self, field, fallback=None):
+        return getattr(self, field) if field in field_set else fallback
+
+    def __getitem__(self, field):
+        if field not in field_set:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        if field not in field_set:
+            raise KeyError(f"{field} is not a scanner print contract field")
+        setattr(self, field, value)
+
+    def __contains__(self, field):
+        return field in field_set
+
+    def __iter__(self):
+        return iter(fields)
+
+    def __len__(self):
+        return len(fields)
+
+    def __eq__(self, other):
+        if isinstance(other, record_class):
+            return all(getattr(self, f) == getattr(other, f) for f in fields)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{class_name}(symbol={self.symbol!r})" if "symbol" in field_set else f"{class_name}()"
+
+    def keys(self):
+        return fields
+
+    def to_dict(self):
+        return {f: getattr(self, f) for f in fields}
+
+    record_class = type(class_name, (), {
+        "__slots__": fields,
+        "__init__": namespace["__init__"],
+        "__hash__": None,
+        "FIELDS": fields,
+        "get": get,
+        "keys": keys,
+        "to_dict": to_dict,
+        "__getitem__": __getitem__,
+        "__setitem__": __setitem__,
+        "__contains__": __contains__,
+        "__iter__": __iter__,
+        "__len__": __len__,
+        "__eq__": __eq__,
+        "__repr__": __repr__,
+    })
+    return record_class
+
+
+ScannerPayload = build_payload_record_class(SCANNER_PRINT_FIELDS_ORDERED)
+
+# ================================
+# 5. Standalone Demo
 # ================================
 
 if __name__ == "__main__":
+    import timeit
+
     demo_payload = {"symbol": "DEMO"}
     missing_fields = validate_scanner_print_payload(demo_payload)
     print("Missing fields:", missing_fields)
 
+    record = ScannerPayload(symbol="DEMO", current_price=4.25)
+    print("Record:", record, "| missing:", validate_scanner_print_payload(record),
+          "| sector:", record.get("sector"))
+
+    # Per-symbol cost: dict + normalize + validate vs compiled record
+    def dict_path():
+        payload = {"symbol": "DEMO", "current_price": 4.25, "gap_percent": 12.4}
+        normalized = dict(payload)
+        for field in SCANNER_PRINT_FIELDS_ORDERED:
+            if field not in normalized:
+                normalized[field] = "N/A"
+        return validate_scanner_print_payload(normalized)
+
+    def record_path():
+        return validate_scanner_print_payload(
+            ScannerPayload(symbol="DEMO", current_price=4.25, gap_percent=12.4))
+
+    runs = 100_000
+    dict_us = timeit.timeit(dict_path, number=runs) / runs * 1e6
+    record_us = timeit.timeit(record_path, number=runs) / runs * 1e6
+    print(f"dict+normalize+validate: {dict_us:.2f} us/symbol | ScannerPayload: {record_us:.2f} us/symbol")
+
 # ================================
 # END OF FILE
 # ================================
@@ -0,0 +1,284 @@
+# File: scanner_live_display_v01.py
+# Created: 2025-12-18
+# Version Notes:
+# - v01: Diff-based live scanner table (ANSI), rate-capped, rendered on a background thread
+# - v01.1: Demo states when stdout is not a terminal (no diff savings)
+
+"""
+SCANNER LIVE DISPLAY
+--------------------
+
+GLOBAL CONTEXT
+--------------
+ScannerPrintFormatter prints the full contract block for every symbol on
+every cycle. At hundreds of symbols this floods the terminal and spends
+real CPU on text nobody can read.
+
+ScannerLiveDisplay is the watchlist view instead:
+- one table row per symbol, only the top-N visible rows
+- a frame redraws only the cells whose text changed since the last frame
+  (ANSI cursor moves), so a quiet market costs almost nothing to display
+- refresh is capped at `max_fps`; frames published faster than that are
+  coalesced and only the latest one is drawn
+- formatting and writing happen on a background thread; `publish()` only
+  copies the visible cell values and returns, so it never blocks the scan
+
+When the output is not a terminal (pipe, file), ANSI codes are skipped and
+each rendered frame is written as a plain table.
+
+SOURCE OF TRUTH
+---------------
+Derived strictly from:
+- STEP_27_OUTCOME_SCANNER_PRINT_FORMATTER.md
+- scanner_print_contract_v01.py (field names)
+
+STANDALONE GUARANTEE
+-------------------
+Runs with synthetic payloads; no market data needed.
+
+TRADING MODE
+------------
+Presentation only.
+"""
+
+# ================================
+# 1. Imports
+# ================================
+
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
+
+# (payload field, header, width)
+DEFAULT_COLUMNS: List[Tuple[str, str, int]] = [
+    ("scanner_rank", "#", 4),
+    ("symbol", "SYMBOL", 8),
+    ("alert_priority_level", "ALERT", 5),
+    ("current_price", "PRICE", 9),
+    ("gap_percent", "GAP%", 7),
+    ("relative_volume", "RVOL", 6),
+    ("scanner_score", "SCORE", 6),
+    ("news_velocity_10m", "NEWS10", 6),
+    ("headline_age_minutes", "AGE", 4),
+    ("signal_bias", "BIAS", 7),
+]
+
+ESC = "\x1b["
+
+# ================================
+# 2. Live Display
+# ================================
+
+class ScannerLiveDisplay:
+    """
+    ScannerLiveDisplay
+    ------------------
+    Background-rendered, diff-based top-N scanner table.
+    """
+
+    def __init__(self,
+                 top_n: int = 20,
+                 max_fps: float = 4.0,
+                 columns: Sequence[Tuple[str, str, int]] = DEFAULT_COLUMNS,
+                 stream: Optional[TextIO] = None,
+                 ansi: Optional[bool] = None):
+        self.top_n = top_n
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.columns = list(columns)
+        self.stream = stream or sys.stdout
+        self.ansi = self.stream.isatty() if ansi is None else ansi
+
+        # Column start positions (1-based terminal columns)
+        self._offsets = []
+        position = 1
+        for _, _, width in self.columns:
+            self._offsets.append(position)
+            position += width + 1
+
+        # Latest unrendered frame (single slot: newer frames replace older ones)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending: Optional[List[Tuple]] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Render-thread state
+        self._screen: List[List[str]] = []
+        self._header_drawn = False
+        self._last_render = 0.0
+
+        # Metrics
+        self.frames_published = 0
+        self.frames_rendered = 0
+        self.frames_dropped = 0
+        self.cells_written = 0
+
+    # ----------------------------
+    # Lifecycle
+    # ----------------------------
+
+    def start(self) -> "ScannerLiveDisplay":
+        if not self._running:
+            self._running = True
+            self._thread = threading.Thread(target=self._render_loop, name="scanner-display", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Render the last published frame (if any) and stop the thread."""
+        if self._running:
+            self._running = False
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+            if self.ansi and self._header_drawn:
+                self.stream.write(f"{ESC}{len(self._screen) + 3};1H")
+                self.stream.flush()
+
+    # ----------------------------
+    # Scan-thread API
+    # ----------------------------
+
+    def publish(self, ranked_payloads: Sequence[Dict]) -> None:
+        """
+        Hand the next frame to the render thread.
+
+        Only the visible top-N rows are copied (raw values, no formatting):
+        payload dicts may be mutated by the next scan cycle while the
+        render thread is still drawing.
+        """
+        fields = [field for field, _, _ in self.columns]
+        frame = [tuple(p.get(field) for field in fields) for p in ranked_payloads[:self.top_n]]
+
+        with self._lock:
+            if self._pending is not None:
+                self.frames_dropped += 1
+            self._pending = frame
+            self.frames_published += 1
+        self._wakeup.set()
+
+    # ----------------------------
+    # Render thread
+    # ----------------------------
+
+    def _render_loop(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+            # Cap the refresh rate; frames arriving meanwhile replace each other
+            wait = self._last_render + self.min_interval - time.monotonic()
+            if wait > 0 and self._running:
+                time.sleep(wait)
+
+            with self._lock:
+                frame, self._pending = self._pending, None
+
+            if frame is not None:
+                self._render(frame)
+                self._last_render = time.monotonic()
+
+            if not self._running:
+                return
+
+    def _render(self, frame: List[Tuple]) -> None:
+        cells = [[self._format_cell(value, width) for value, (_, _, width) in zip(row, self.columns)]
+                 for row in frame]
+        out = []
+
+        if not self.ansi:
+            out.append(self._header_line() + "\n")
+            out.extend(" ".join(row) + "\n" for row in cells)
+            out.append("\n")
+            self.cells_written += sum(len(row) for row in cells)
+        else:
+            if not self._header_drawn:
+                out.append(f"{ESC}2J{ESC}1;1H{self._header_line()}")
+                out.append(f"{ESC}2;1H{'-' * (self._offsets[-1] + self.columns[-1][2])}")
+                self._header_drawn = True
+
+            blank_row = [" " * width for _, _, width in self.columns]
+            for index in range(max(len(cells), len(self._screen))):
+                new_row = cells[index] if index < len(cells) else blank_row
+                old_row = self._screen[index] if index < len(self._screen) else None
+                for column, text in enumerate(new_row):
+                    if old_row is not None and old_row[column] == text:
+                        continue
+                    out.append(f"{ESC}{index + 3};{self._offsets[column]}H{text}")
+                    self.cells_written += 1
+            self._screen = cells
+
+        if out:
+            self.stream.write("".join(out))
+            self.stream.flush()
+        self.frames_rendered += 1
+
+    def _header_line(self) -> str:
+        return " ".join(header.ljust(width) for _, header, width in self.columns)
+
+    @staticmethod
+    def _format_cell(value, width: int) -> str:
+        if value is None:
+            text = "N/A"
+        elif isinstance(value, float):
+            text = f"{value:.2f}"
+        else:
+            text = str(value)
+        return text[:width].ljust(width)
+
+# ================================
+# 3. Standalone Demo
+# ================================
+
+if __name__ == "__main__":
+    import io
+    import random
+
+    rng = random.Random(3)
+    universe = [
+        {"symbol": f"SYM{i:03d}", "scanner_score": round(rng.uniform(0, 100), 2), "current_price": 5.0,
+         "alert_priority_level": "NONE", "signal_bias": "NEUTRAL"}
+        for i in range(300)
+    ]
+
+    def ranked() -> List[Dict]:
+        board = sorted(universe, key=lambda p: (-p["scanner_score"], p["symbol"]))
+        for rank, payload in enumerate(board, start=1):
+            payload["scanner_rank"] = rank
+        return board
+
+    # Full reprint baseline: every symbol, every cycle
+    started = time.perf_counter()
+    sink = io.StringIO()
+    for _ in range(40):
+        for payload in ranked():
+            sink.write("\n".join(f"{k}: {v}" for k, v in payload.items()) + "\n")
+    full_ms = (time.perf_counter() - started) * 1000
+
+    display = ScannerLiveDisplay(top_n=15, max_fps=10).start()
+    publish_seconds = 0.0
+    started = time.perf_counter()
+    for cycle in range(40):
+        for payload in rng.sample(universe, 10):
+            payload["scanner_score"] = round(rng.uniform(0, 100), 2)
+            payload["current_price"] = round(payload["current_price"] + rng.uniform(-0.1, 0.1), 2)
+        board = ranked()
+        t0 = time.perf_counter()
+        display.publish(board)
+        publish_seconds += time.perf_counter() - t0
+        time.sleep(0.025)  # 40 scan cycles/sec, display capped at 10 fps
+    display.stop()
+
+    print(f"Full reprint of {len(universe)} symbols x 40 cycles: {full_ms:.1f} ms")
+    print(f"Live display publish (scan thread): {publish_seconds * 1000 / 40:.3f} ms/cycle")
+    print(f"Frames published={display.frames_published} rendered={display.frames_rendered} "
+          f"coalesced={display.frames_dropped} cells written={display.cells_written} "
+          f"(full redraw would be {display.frames_rendered * 15 * len(DEFAULT_COLUMNS)})")
+    if not display.ansi:
+        # Diffing needs cursor moves: piped/redirected output gets a full table per frame
+        print("stdout is not a terminal: plain full-table frames, no diff savings")
+
+# ================================
+# END OF FILE
+# ================================
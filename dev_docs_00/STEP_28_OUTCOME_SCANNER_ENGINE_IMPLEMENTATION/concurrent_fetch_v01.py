@@ -0,0 +1,238 @@
+# File: concurrent_fetch_v01.py
+# Created: 2025-12-18
+# Version Notes:
+# - v01: Bounded thread-pool fan-out of market + news fetches with per-call timeouts
+
+"""
+CONCURRENT SYMBOL FETCHER
+-------------------------
+
+GLOBAL CONTEXT
+--------------
+The scanners (ScannerEngineImpl, FinalScannerEngine) fetch market data and
+news one symbol at a time. Both registry calls block on provider I/O, so a
+scan costs roughly symbols × 2 × provider latency.
+
+This helper fans the two fetches for every symbol out to a bounded thread
+pool:
+- at most `max_workers` provider calls run at once
+- each call gets `timeout_seconds` from the moment it starts running
+- `on_ready(index, result)` fires as soon as BOTH fetches of a symbol are
+  done (on the calling thread), so payloads are assembled while other
+  symbols are still in flight
+- the returned list is always in input symbol order (deterministic output)
+
+A call that times out or raises is reported in `result["errors"]` and its
+part of the result is None. The scanner then prints N/A instead of guessing.
+
+SOURCE OF TRUTH
+---------------
+Derived strictly from:
+- STEP_28_OUTCOME_SCANNER_ENGINE_IMPLEMENTATION.md
+- data_source_registry_v01.py
+- news_source_registry_v01.py
+
+STANDALONE GUARANTEE
+-------------------
+Runs without live data (demo uses in-file slow providers).
+
+TRADING MODE
+------------
+Observation only.
+
+TEACHING NOTE
+-------------
+Threads fit here because the work is waiting on I/O, not computing.
+A timed-out call cannot be killed; its result is discarded and the worker
+thread is freed when the provider finally returns.
+"""
+
+# ================================
+# 1. Imports
+# ================================
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from data_source_registry_v01 import DataSourceRegistry
+from news_source_registry_v01 import NewsSourceRegistry
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_TIMEOUT_SECONDS = 2.0
+
+# ================================
+# 2. Concurrent Fetcher
+# ================================
+
+class ConcurrentSymbolFetcher:
+    """
+    ConcurrentSymbolFetcher
+    -----------------------
+    Fetches market + news for many symbols with bounded concurrency.
+    """
+
+    def __init__(self,
+                 data_registry: DataSourceRegistry,
+                 news_registry: NewsSourceRegistry,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS):
+        self.data_registry = data_registry
+        self.news_registry = news_registry
+        self.max_workers = max(1, max_workers)
+        self.timeout_seconds = timeout_seconds
+        self.timeouts = 0
+        self.failures = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ----------------------------
+    # Public API
+    # ----------------------------
+
+    def fetch(self,
+              symbols: List[str],
+              on_ready: Optional[Callable[[int, Dict], None]] = None) -> List[Dict]:
+        """
+        Fetch market data and news for every symbol concurrently.
+
+        Returns
+        -------
+        list[dict]
+            One result per symbol, in input order:
+            {"symbol", "market", "news", "errors"}
+        """
+        executor = self._ensure_executor()
+        results = [{"symbol": s, "market": None, "news": None, "errors": []} for s in symbols]
+        outstanding = [2] * len(symbols)
+        started_at: Dict[Tuple[int, str], float] = {}
+
+        futures: Dict[Future, Tuple[int, str]] = {}
+        for index, symbol in enumerate(symbols):
+            for kind, call in (("market", self.data_registry.fetch_market_data),
+                               ("news", self.news_registry.fetch_news)):
+                key = (index, kind)
+                futures[executor.submit(self._timed_call, started_at, key, call, symbol)] = key
+
+        def settle(key: Tuple[int, str], value: Optional[Dict], error: Optional[str]) -> None:
+            index, kind = key
+            results[index][kind] = value
+            if error:
+                results[index]["errors"].append(f"{kind}: {error}")
+            outstanding[index] -= 1
+            if outstanding[index] == 0 and on_ready is not None:
+                on_ready(index, results[index])
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=self._next_wait(pending, futures, started_at),
+                                 return_when=FIRST_COMPLETED)
+
+            for future in done:
+                key = futures[future]
+                try:
+                    settle(key, future.result(), None)
+                except Exception as exc:
+                    self.failures += 1
+                    settle(key, None, str(exc))
+
+            # Abandon calls that have been running longer than the timeout
+            now = time.monotonic()
+            for future in list(pending):
+                key = futures[future]
+                started = started_at.get(key)
+                if started is not None and now - started >= self.timeout_seconds:
+                    pending.discard(future)
+                    future.cancel()
+                    self.timeouts += 1
+                    self._log(f"[WARN] {key[1]} fetch for {symbols[key[0]]} timed out "
+                              f"after {self.timeout_seconds:.2f}s")
+                    settle(key, None, f"timeout after {self.timeout_seconds:.2f}s")
+
+        return results
+
+    def close(self) -> None:
+        """Stop the worker threads (waits for calls still running)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    # ----------------------------
+    # Internals
+    # ----------------------------
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        # Kept across scans so cycles reuse warm threads
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="scanner-fetch")
+        return self._executor
+
+    @staticmethod
+    def _timed_call(started_at: Dict, key: Tuple[int, str], call: Callable, symbol: str) -> Dict:
+        # The timeout clock starts when a worker picks the call up, not when
+        # it was queued, so bounded concurrency does not eat into it.
+        started_at[key] = time.monotonic()
+        return call(symbol)
+
+    def _next_wait(self, pending, futures: Dict, started_at: Dict) -> float:
+        """Seconds until the earliest running call hits its timeout."""
+        now = time.monotonic()
+        deadlines = [started_at[futures[f]] + self.timeout_seconds
+                     for f in pending if futures[f] in started_at]
+        if not deadlines:
+            return self.timeout_seconds
+        return max(0.0, min(deadlines) - now)
+
+    def _log(self, msg: str) -> None:
+        ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[FETCH][{ts}] {msg}")
+
+# ================================
+# 3. Standalone Demo
+# ================================
+
+if __name__ == "__main__":
+    from data_source_registry_v01 import MarketDataProvider
+    from news_source_registry_v01 import NewsProvider
+
+    class SlowMarketProvider(MarketDataProvider):
+        provider_name = "DEMO_SLOW_MARKET"
+
+        def fetch(self, symbol):
+            time.sleep(0.5 if symbol == "HANG" else 0.02)
+            return {"symbol": symbol, "current_price": 4.25, "previous_close_price": 3.78}
+
+    class SlowNewsProvider(NewsProvider):
+        provider_name = "DEMO_SLOW_NEWS"
+
+        def fetch(self, symbol):
+            time.sleep(0.02)
+            return []
+
+    data_registry = DataSourceRegistry()
+    data_registry.register_provider(SlowMarketProvider())
+    news_registry = NewsSourceRegistry()
+    news_registry.register_provider(SlowNewsProvider())
+    symbols = [f"SYM{i:02d}" for i in range(40)] + ["HANG"]
+
+    started = time.perf_counter()
+    for s in symbols[:-1]:
+        data_registry.fetch_market_data(s)
+        news_registry.fetch_news(s)
+    sequential = time.perf_counter() - started
+
+    fetcher = ConcurrentSymbolFetcher(data_registry, news_registry, max_workers=16, timeout_seconds=0.2)
+    started = time.perf_counter()
+    results = fetcher.fetch(symbols)
+    concurrent = time.perf_counter() - started
+    fetcher.close()
+
+    print(f"Sequential ({len(symbols) - 1} symbols, no HANG): {sequential * 1000:.0f} ms")
+    print(f"Concurrent ({len(symbols)} symbols incl. HANG): {concurrent * 1000:.0f} ms")
+    print(f"Order preserved: {[r['symbol'] for r in results] == symbols}")
+    print(f"HANG errors: {results[-1]['errors']}")
+
+# ================================
+# END OF FILE
+# ================================
@@ -0,0 +1,359 @@
+# File: reference_data_cache_v01.py
+# Created: 2025-12-18
+# Version Notes:
+# - v01: Session-scoped reference data cache (disk TTL, concurrent prefetch, background refresh)
+# - v01.1: Trading-day rollover drops yesterday's entries; failure counter is thread-safe
+
+"""
+REFERENCE DATA CACHE
+--------------------
+
+GLOBAL CONTEXT
+--------------
+Previous close, float and sector/industry/subcategory change at most once
+per trading day, yet the scanner read previous close and float from the
+market snapshot every cycle and left the sector fields empty.
+
+ReferenceDataCache holds them for the session:
+- `load(symbols)` at session start: entries still valid on disk are reused,
+  everything else is prefetched concurrently (bounded thread pool)
+- the cache file is rewritten after each load/refresh (atomic replace)
+- an entry is valid while it is younger than `ttl_seconds` AND belongs to
+  the current session date (ET); yesterday's previous close is never reused.
+  On a rollover every entry is dropped before the refetch, so a symbol whose
+  refetch fails reads as missing instead of keeping yesterday's data
+- `start_background_refresh(interval)` refetches on a daemon thread and
+  swaps the new entries in; readers never wait on a fetch
+- `get(symbol)` is a dict lookup — O(1), never touches a provider
+
+A symbol whose fetch fails keeps its previous entry from the same session
+(if any) and the scanner falls back to the market snapshot, then N/A.
+
+SOURCE OF TRUTH
+---------------
+Derived strictly from:
+- STEP_28_OUTCOME_SCANNER_ENGINE_IMPLEMENTATION.md
+- data_source_registry_v01.py
+- scanner_print_contract_v01.py (previous_close_price, float_shares, sector, industry, subcategory)
+
+STANDALONE GUARANTEE
+-------------------
+Runs without live data (demo uses an in-file slow loader).
+
+TRADING MODE
+------------
+Observation only.
+"""
+
+# ================================
+# 1. Imports
+# ================================
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+from data_source_registry_v01 import DataSourceRegistry
+
+REFERENCE_FIELDS = ("previous_close_price", "float_shares", "sector", "industry", "subcategory")
+
+EXCHANGE_TIMEZONE = ZoneInfo("America/New_York")
+DEFAULT_TTL_SECONDS = 12 * 60 * 60
+DEFAULT_PREFETCH_WORKERS = 8
+CACHE_FILE_VERSION = 1
+
+ReferenceLoader = Callable[[str], Optional[Dict]]
+
+
+def registry_reference_loader(data_registry: DataSourceRegistry) -> ReferenceLoader:
+    """Loader that takes the reference fields from a market snapshot."""
+
+    def load(symbol: str) -> Dict:
+        data = data_registry.fetch_market_data(symbol)["data"]
+        return {field: data.get(field) for field in REFERENCE_FIELDS}
+
+    return load
+
+
+def current_session_date() -> date:
+    return datetime.now(EXCHANGE_TIMEZONE).date()
+
+# ================================
+# 2. Reference Data Cache
+# ================================
+
+class ReferenceDataCache:
+    """
+    ReferenceDataCache
+    ------------------
+    Once-per-session reference fields with O(1) lookups.
+    """
+
+    def __init__(self,
+                 loader: ReferenceLoader,
+                 path: Optional[str] = None,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_workers: int = DEFAULT_PREFETCH_WORKERS,
+                 session_date: Optional[date] = None):
+        self.loader = loader
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max(1, max_workers)
+        self.session_date = session_date or current_session_date()
+
+        # symbol → {"fetched_at": epoch seconds, "data": {field: value}}
+        # Replaced wholesale on refresh, so readers never see a half-built dict
+        self._entries: Dict[str, Dict] = {}
+        self._write_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()  # fetch_one runs on pool threads
+
+        self._refresh_stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        # Metrics
+        self.disk_hits = 0
+        self.fetched = 0
+        self.failures = 0
+
+    # ----------------------------
+    # Scanner API (O(1), never fetches)
+    # ----------------------------
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        entry = self._entries.get(symbol)
+        return entry["data"] if entry is not None else None
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ----------------------------
+    # Session Load / Refresh
+    # ----------------------------
+
+    def load(self, symbols: Iterable[str]) -> int:
+        """
+        Session start: reuse valid disk entries, prefetch the rest.
+
+        Returns the number of symbols fetched from the loader.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        self._roll_session()
+        on_disk = self._read_disk()
+        now = time.time()
+        valid = {s: on_disk[s] for s in symbols if s in on_disk and self._is_fresh(on_disk[s], now)}
+        self.disk_hits += len(valid)
+
+        missing = [s for s in symbols if s not in valid]
+        fetched = self._fetch_all(missing)
+        with self._write_lock:
+            self._entries = {**self._entries, **valid, **fetched}
+        self._log(f"Loaded {len(symbols)} symbol(s): {len(valid)} from disk, "
+                  f"{len(fetched)} fetched, {len(missing) - len(fetched)} failed")
+        self.save()
+        return len(fetched)
+
+    def refresh(self, symbols: Optional[Iterable[str]] = None, stale_only: bool = True) -> int:
+        """
+        Refetch entries (all known symbols by default; only expired ones
+        unless stale_only=False) and swap them in.
+        """
+        known = list(self._entries)
+        if self._roll_session():
+            stale_only = False
+
+        symbols = known if symbols is None else list(symbols)
+        if stale_only:
+            now = time.time()
+            symbols = [s for s in symbols if not self._is_fresh(self._entries.get(s), now)]
+        if not symbols:
+            return 0
+
+        fetched = self._fetch_all(symbols)
+        with self._write_lock:
+            self._entries = {**self._entries, **fetched}
+        self.save()
+        return len(fetched)
+
+    def _roll_session(self) -> bool:
+        """
+        On a new trading day drop every entry from the previous one.
+
+        Returns True on rollover. Entries are not kept until their refetch
+        succeeds: a failed refetch would otherwise serve (and save under the
+        new session date) yesterday's previous close.
+        """
+        today = current_session_date()
+        if self.session_date == today:
+            return False
+        with self._write_lock:
+            self.session_date = today
+            self._entries = {}
+        self._log(f"Session rolled over to {today}: reference entries dropped")
+        return True
+
+    def start_background_refresh(self, interval_seconds: float) -> None:
+        if self._refresh_thread is not None:
+            return
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, args=(interval_seconds,),
+                                                name="reference-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def stop(self) -> None:
+        if self._refresh_thread is not None:
+            self._refresh_stop.set()
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+    def _refresh_loop(self, interval_seconds: float) -> None:
+        while not self._refresh_stop.wait(interval_seconds):
+            try:
+                self.refresh()
+            except Exception as exc:
+                self._log(f"[WARN] Background refresh failed: {exc}")
+
+    # ----------------------------
+    # Fetching
+    # ----------------------------
+
+    def _fetch_all(self, symbols: List[str]) -> Dict[str, Dict]:
+        if not symbols:
+            return {}
+
+        def fetch_one(symbol: str) -> Optional[Dict]:
+            try:
+                data = self.loader(symbol)
+            except Exception as exc:
+                with self._metrics_lock:
+                    self.failures += 1
+                self._log(f"[WARN] Reference fetch failed for {symbol}: {exc}")
+                return None
+            if data is None:
+                with self._metrics_lock:
+                    self.failures += 1
+                return None
+            return {"fetched_at": time.time(), "data": {field: data.get(field) for field in REFERENCE_FIELDS}}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(symbols)),
+                                thread_name_prefix="reference-prefetch") as executor:
+            entries = dict(zip(symbols, executor.map(fetch_one, symbols)))
+
+        fetched = {s: entry for s, entry in entries.items() if entry is not None}
+        self.fetched += len(fetched)
+        return fetched
+
+    def _is_fresh(self, entry: Optional[Dict], now: float) -> bool:
+        return entry is not None and now - entry["fetched_at"] < self.ttl_seconds
+
+    # ----------------------------
+    # Disk Persistence
+    # ----------------------------
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._write_lock:
+            payload = {
+                "v": CACHE_FILE_VERSION,
+                "session_date": self.session_date.isoformat(),
+                "entries": self._entries,
+            }
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+
+    def _read_disk(self) -> Dict[str, Dict]:
+        if self.path is None or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError) as exc:
+            self._log(f"[WARN] Ignoring unreadable cache file {self.path}: {exc}")
+            return {}
+        if payload.get("v") != CACHE_FILE_VERSION or payload.get("session_date") != self.session_date.isoformat():
+            return {}
+        return payload.get("entries", {})
+
+    # ----------------------------
+    # Logging Helper
+    # ----------------------------
+
+    def _log(self, msg: str) -> None:
+        ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[REFDATA][{ts}] {msg}")
+
+# ================================
+# 3. Standalone Demo
+# ================================
+
+if __name__ == "__main__":
+    import tempfile
+
+    SECTORS = ["Technology", "Healthcare", "Energy", "Financials"]
+
+    def slow_loader(symbol: str) -> Dict:
+        time.sleep(0.01)  # reference endpoint round trip
+        n = int(symbol[3:])
+        return {
+            "previous_close_price": 2.0 + n % 18,
+            "float_shares": 5_000_000 + n * 10_000,
+            "sector": SECTORS[n % len(SECTORS)],
+            "industry": "Demo Industry",
+            "subcategory": None,
+        }
+
+    symbols = [f"SYM{i:03d}" for i in range(200)]
+    path = os.path.join(tempfile.mkdtemp(), "reference_cache.json")
+
+    started = time.perf_counter()
+    for s in symbols:
+        slow_loader(s)
+    sequential_ms = (time.perf_counter() - started) * 1000
+
+    cache = ReferenceDataCache(slow_loader, path=path, max_workers=16)
+    started = time.perf_counter()
+    cache.load(symbols)
+    prefetch_ms = (time.perf_counter() - started) * 1000
+
+    # Next run, same session: served from disk
+    restarted = ReferenceDataCache(slow_loader, path=path, max_workers=16)
+    started = time.perf_counter()
+    restarted.load(symbols)
+    disk_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    for _ in range(100):
+        for s in symbols:
+            restarted.get(s)
+    lookup_us = (time.perf_counter() - started) * 1e6 / (100 * len(symbols))
+
+    print(f"Sequential fetch: {sequential_ms:.0f} ms | concurrent prefetch: {prefetch_ms:.0f} ms | "
+          f"restart from disk: {disk_ms:.1f} ms ({restarted.disk_hits} hits, {restarted.fetched} fetched)")
+    print(f"Lookup: {lookup_us:.3f} us/symbol | SYM007: {restarted.get('SYM007')}")
+
+    # Trading-day rollover: SYM007's refetch fails, so it must not keep yesterday's entry
+    def flaky_loader(symbol: str) -> Optional[Dict]:
+        return None if symbol == "SYM007" else slow_loader(symbol)
+
+    restarted.loader = flaky_loader
+    restarted.session_date = date(2000, 1, 3)
+    refetched = restarted.refresh()
+    print(f"Rollover: {refetched} refetched, {len(restarted)} cached, SYM007: {restarted.get('SYM007')}, "
+          f"failures={restarted.failures}")
+
+# ================================
+# END OF FILE
+# ================================
@@ -2,6 +2,12 @@
 # Created: 2025-12-16
 # Version Notes:
 # - v01: Minimal working Scanner implementation using registries + print contract + formatter.
+# - v01.1: Optional concurrent scan mode (bounded thread pool, per-call timeouts, deterministic order).
+# - v01.2: Optional live display (scanner_live_display_v01.py) instead of full per-symbol reprints.
+# - v01.3: Payloads are ScannerPayload records (contract-generated __slots__), so normalization/validation is free.
+# - v01.4: Optional time-of-day rVol from precomputed baselines (relative_volume_baselines_v01.py).
+# - v01.5: Optional session reference data cache (previous close, float, sector fields).
+# - v01.6: Optional indicator trend context (trend_direction, trend_strength, volatility_risk_flag).
 
 """
 SCANNER ENGINE IMPLEMENTATION (MINIMAL WORKING, DRY-RUN SAFE)
@@ -39,6 +45,10 @@ DEPENDENCIES
 - news_source_registry_v01.py
 - scanner_print_contract_v01.py
 - scanner_print_formatter_v01.py
+- concurrent_fetch_v01.py (concurrent mode only)
+- scanner_live_display_v01.py (live display mode only)
+- relative_volume_baselines_v01.py (rVol baselines only)
+- reference_data_cache_v01.py (reference cache only)
 
 INPUTS / OUTPUTS
 ----------------
@@ -46,7 +56,43 @@ Inputs:
 - list of symbols (demo list by default)
 Outputs:
 - prints per symbol
-- returns list[dict] payloads for downstream modules
+- builds ScannerPayload records internally and returns plain dicts (record.to_dict()) to downstream modules
+
+CONCURRENT MODE
+---------------
+With `concurrent=True`, market and news fetches for all symbols are fanned
+out to a bounded thread pool (ConcurrentSymbolFetcher). Each payload is
+built as soon as its two fetches land; printing and the returned list still
+follow the input symbol order. A fetch that fails or times out leaves its
+fields as None instead of stopping the scan.
+
+LIVE DISPLAY MODE
+-----------------
+Pass a started ScannerLiveDisplay as `display` and each scan publishes its
+payloads to it instead of printing every contract block. The display
+redraws only changed cells on its own thread; the caller owns start/stop.
+
+RVOL BASELINES
+--------------
+Pass a RelativeVolumeEngine as `rvol_engine` and `relative_volume` /
+`volume_spike` are computed from the snapshot's cumulative `volume`
+against the symbol's time-of-day baseline (one memory-mapped array read).
+Symbols without a baseline or live volume keep the provider's values.
+
+REFERENCE DATA CACHE
+--------------------
+Pass a ReferenceDataCache (loaded once at session start) as
+`reference_cache` and previous close, float and sector / industry /
+subcategory come from it with a dict lookup. Fields the cache does not
+have fall back to the market snapshot.
+
+TREND CONTEXT
+-------------
+Pass an indicator engine as `indicator_engine` (anything with
+`trend_context(symbol)` returning trend_direction / trend_strength /
+volatility_risk_flag, e.g. the runtime's market_data.indicators
+IndicatorEngine fed by closed bars) and those fields are filled from its
+streaming EMA / VWAP / ATR state. Without one they stay N/A.
 
 TRADING MODE
 ------------
@@ -71,9 +117,18 @@ from news_source_registry_v01 import NewsSourceRegistry, NewsProvider
 
 from scanner_print_contract_v01 import (
     SCANNER_PRINT_FIELDS_ORDERED,
+    ScannerPayload,
     validate_scanner_print_payload,
 )
 from scanner_print_formatter_v01 import ScannerPrintFormatter
+from scanner_live_display_v01 import ScannerLiveDisplay
+from relative_volume_baselines_v01 import RelativeVolumeEngine
+from reference_data_cache_v01 import ReferenceDataCache
+from concurrent_fetch_v01 import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_TIMEOUT_SECONDS,
+    ConcurrentSymbolFetcher,
+)
 
 
 # ================================
@@ -162,10 +217,25 @@ class ScannerEngineImpl:
         self,
         data_registry: Optional[DataSourceRegistry] = None,
         news_registry: Optional[NewsSourceRegistry] = None,
+        concurrent: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        fetch_timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        display: Optional[ScannerLiveDisplay] = None,
+        rvol_engine: Optional[RelativeVolumeEngine] = None,
+        reference_cache: Optional[ReferenceDataCache] = None,
+        indicator_engine=None,
     ):
         self.data_registry = data_registry or self._build_default_data_registry()
         self.news_registry = news_registry or self._build_default_news_registry()
         self.formatter = ScannerPrintFormatter()
+        self.display = display
+        self.rvol_engine = rvol_engine
+        self.reference_cache = reference_cache
+        self.indicator_engine = indicator_engine
+        self.fetcher = (
+            ConcurrentSymbolFetcher(self.data_registry, self.news_registry, max_workers, fetch_timeout_seconds)
+            if concurrent else None
+        )
 
     # ----------------------------
     # Registry Builders
@@ -197,15 +267,22 @@ class ScannerEngineImpl:
         Returns
         -------
         list[dict]
-            Contract-compliant scanner payloads (one per symbol).
+            Contract-compliant scanner payloads (one per symbol). Records are
+            converted at this boundary: rankers, alerting and json.dumps all
+            expect real dicts (extra keys, setdefault, serialization).
         """
         symbols = symbols or ["DEMO", "RYM"]
         results: List[Dict] = []
 
-        self._log(f"Starting scan for {len(symbols)} symbol(s)")
+        if self.display is None:
+            self._log(f"Starting scan for {len(symbols)} symbol(s)")
+
+        if self.fetcher is not None:
+            payloads = self._build_payloads_concurrently(symbols)
+        else:
+            payloads = [self._build_symbol_payload(sym) for sym in symbols]
 
-        for sym in symbols:
-            payload = self._build_symbol_payload(sym)
+        for sym, payload in zip(symbols, payloads):
             payload = self._normalize_payload(payload)
 
             missing = validate_scanner_print_payload(payload)
@@ -213,34 +290,80 @@ class ScannerEngineImpl:
                 # We do NOT hide this. Missing contract fields means our pipeline is wrong.
                 self._log(f"[WARN] Contract missing fields for {sym}: {missing}")
 
-            print(self.formatter.format(payload))
-            print()  # visual separation between symbols
+            if self.display is None:
+                print(self.formatter.format(payload))
+                print()  # visual separation between symbols
 
-            results.append(payload)
+            results.append(payload.to_dict() if isinstance(payload, ScannerPayload) else payload)
 
-        self._log("Scan finished")
+        if self.display is not None:
+            # Non-blocking: formatting happens on the display thread
+            self.display.publish(results)
+        else:
+            self._log("Scan finished")
         return results
 
+    def close(self) -> None:
+        """Release the concurrent fetch threads (no-op in sequential mode)."""
+        if self.fetcher is not None:
+            self.fetcher.close()
+
+    def _build_payloads_concurrently(self, symbols: List[str]) -> List[Dict]:
+        """
+        Fetch all symbols through the thread pool, building each payload on arrival.
+
+        Payloads land in a slot per input position, so completion order never
+        leaks into the output order.
+        """
+        payloads: List[Optional[Dict]] = [None] * len(symbols)
+
+        def on_ready(index: int, fetched: Dict) -> None:
+            if fetched["errors"]:
+                self._log(f"[WARN] Partial data for {fetched['symbol']}: {fetched['errors']}")
+            payloads[index] = self._build_symbol_payload(
+                fetched["symbol"],
+                market=fetched["market"] or {"symbol": fetched["symbol"], "data": {}, "provider": None},
+                news=fetched["news"] or {},
+            )
+
+        self.fetcher.fetch(symbols, on_ready=on_ready)
+        return payloads
+
     # ----------------------------
     # Payload Construction
     # ----------------------------
 
-    def _build_symbol_payload(self, symbol: str) -> Dict:
+    def _build_symbol_payload(self, symbol: str, market: Optional[Dict] = None, news: Optional[Dict] = None) -> ScannerPayload:
         """
-        Build the raw payload from market + news.
+        Build the payload record from market + news.
+
+        Already-fetched snapshots can be passed in (concurrent mode);
+        otherwise they are fetched here.
 
         TEACHING NOTE:
         This is where "market reality" becomes "structured observation".
         """
-        market = self.data_registry.fetch_market_data(symbol)
-        news = self.news_registry.fetch_news(symbol)
+        if market is None:
+            market = self.data_registry.fetch_market_data(symbol)
+        if news is None:
+            news = self.news_registry.fetch_news(symbol)
 
         # Minimal derived metrics (safe, deterministic)
         bid = market["data"].get("bid_price")
         ask = market["data"].get("ask_price")
-        prev_close = market["data"].get("previous_close_price")
+        reference = (self.reference_cache.get(symbol) if self.reference_cache is not None else None) or {}
+        trend = self.indicator_engine.trend_context(symbol) if self.indicator_engine is not None else {}
+        prev_close = self._reference_value(reference, market["data"], "previous_close_price")
         last = market["data"].get("current_price")
 
+        rvol = market["data"].get("relative_volume")
+        volume_spike = market["data"].get("volume_spike")
+        if self.rvol_engine is not None:
+            baseline_rvol = self.rvol_engine.lookup(symbol, market["data"].get("volume"), datetime.utcnow())
+            if baseline_rvol["relative_volume"] is not None:
+                rvol = baseline_rvol["relative_volume"]
+                volume_spike = baseline_rvol["volume_spike"]
+
         spread = (ask - bid) if (isinstance(ask, (int, float)) and isinstance(bid, (int, float))) else None
         gap_pct = None
         if isinstance(prev_close, (int, float)) and prev_close != 0 and isinstance(last, (int, float)):
@@ -255,58 +378,63 @@ class ScannerEngineImpl:
 
         # Alert level placeholder (later: use score + velocity + spread + credibility)
         alert = "NONE"
-        if market["data"].get("volume_spike") and (market["data"].get("relative_volume") or 0) >= 5:
+        if volume_spike and (rvol or 0) >= 5:
             alert = "🔥"
 
-        return {
+        return ScannerPayload(
             # Core identification
-            "symbol": symbol,
-            "alert_priority_level": alert,
+            symbol=symbol,
+            alert_priority_level=alert,
 
             # Price & liquidity context
-            "current_price": last,
-            "previous_close_price": prev_close,
-            "gap_percent": gap_pct,
-            "bid_price": bid,
-            "ask_price": ask,
-            "spread": spread,
-            "float_shares": market["data"].get("float_shares"),
-            "relative_volume": market["data"].get("relative_volume"),
-            "volume_spike": bool(market["data"].get("volume_spike")),
+            current_price=last,
+            previous_close_price=prev_close,
+            gap_percent=gap_pct,
+            bid_price=bid,
+            ask_price=ask,
+            spread=spread,
+            float_shares=self._reference_value(reference, market["data"], "float_shares"),
+            relative_volume=rvol,
+            volume_spike=bool(volume_spike),
 
             # Momentum & ranking
-            "scanner_score": scanner_score,
-            "scanner_rank": scanner_rank,
-            "scoring_rationale": "Placeholder scoring rationale (Step 28: minimal run)",
+            scanner_score=scanner_score,
+            scanner_rank=scanner_rank,
+            scoring_rationale="Placeholder scoring rationale (Step 28: minimal run)",
 
             # News & catalyst context
-            "news_velocity_10m": None,  # will be computed in Step 29+ when we have real time windows
-            "headline_age_minutes": headline_age_minutes,
-            "total_news_events": news.get("total_news_events"),
-            "unique_headline_count": news.get("unique_headline_count"),
-            "repeated_headline_count": None,  # placeholder until we implement dedup by headline text
-            "unique_region_count": news.get("unique_region_count"),
-            "sentiment_score": None,  # explicit None until we implement sentiment
-            "breaking_news_urls": [h.get("url") for h in news.get("headlines", []) if h.get("url")],
-            "earnings_links": [],
-            "sec_filing_links": [],
-
-            # Structural context (placeholders until we add symbol metadata providers)
-            "corporate_actions_detected": None,
-            "sector": None,
-            "industry": None,
-            "subcategory": None,
+            news_velocity_10m=None,  # will be computed in Step 29+ when we have real time windows
+            headline_age_minutes=headline_age_minutes,
+            total_news_events=news.get("total_news_events"),
+            unique_headline_count=news.get("unique_headline_count"),
+            repeated_headline_count=None,  # placeholder until we implement dedup by headline text
+            unique_region_count=news.get("unique_region_count"),
+            sentiment_score=None,  # explicit None until we implement sentiment
+            breaking_news_urls=[h.get("url") for h in news.get("headlines", []) if h.get("url")],
+            earnings_links=[],
+            sec_filing_links=[],
+
+            # Structural context (reference data cache when configured)
+            corporate_actions_detected=None,
+            sector=reference.get("sector"),
+            industry=reference.get("industry"),
+            subcategory=reference.get("subcategory"),
 
             # Strategy context (scanner-level only)
-            "trend_direction": None,
-            "trend_strength": None,
-            "signal_bias": "NEUTRAL",
+            trend_direction=trend.get("trend_direction"),
+            trend_strength=trend.get("trend_strength"),
+            signal_bias="NEUTRAL",
 
             # Risk pre-checks (scanner-level hints only)
-            "liquidity_risk_flag": None,
-            "volatility_risk_flag": None,
-            "max_position_size_hint": None,
-        }
+            liquidity_risk_flag=None,
+            volatility_risk_flag=trend.get("volatility_risk_flag"),
+            max_position_size_hint=None,
+        )
+
+    @staticmethod
+    def _reference_value(reference: Dict, market_data: Dict, field: str):
+        value = reference.get(field)
+        return value if value is not None else market_data.get(field)
 
     def _normalize_payload(self, payload: Dict) -> Dict:
         """
@@ -315,7 +443,11 @@ class ScannerEngineImpl:
         TEACHING NOTE:
         This is the key lesson: printing is a contract.
         If a field is missing, we fill it as N/A instead of crashing or hiding it.
+        ScannerPayload records already hold every field (default N/A), so
+        only plain dicts need the walk.
         """
+        if isinstance(payload, ScannerPayload):
+            return payload
         normalized = dict(payload)
         for field in SCANNER_PRINT_FIELDS_ORDERED:
             if field not in normalized:
@@ -344,6 +476,11 @@ if __name__ == "__main__":
     scanner = ScannerEngineImpl()
     scanner.run_scan()
 
+    # Same scan with concurrent fetching: identical output, order preserved
+    concurrent_scanner = ScannerEngineImpl(concurrent=True)
+    concurrent_scanner.run_scan()
+    concurrent_scanner.close()
+
 # ================================
 # END OF FILE
 # ================================
@@ -2,6 +2,7 @@
 # Created: 2025-12-16
 # Version Notes:
 # - v01: IBKR and Yahoo market data provider stubs
+# - v01.1: fetch_many batch stubs (IBKR snapshot batches capped by max_batch_size)
 
 """
 MARKET DATA PROVIDERS (IBKR + YAHOO STUBS)
@@ -36,10 +37,23 @@ Data access only (stubbed).
 # ================================
 
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 
 from data_source_registry_v01 import MarketDataProvider
 
+def _empty_snapshot(symbol: str, provider_name: str, timestamp: str) -> Dict:
+    """Stub snapshot shared by the batch paths (same fields as fetch())."""
+    return {
+        "symbol": symbol,
+        "current_price": None,
+        "bid_price": None,
+        "ask_price": None,
+        "previous_close_price": None,
+        "volume": None,
+        "timestamp": timestamp,
+        "provider_name": provider_name,
+    }
+
 # ================================
 # 2. IBKR Market Data Provider (Stub)
 # ================================
@@ -53,6 +67,9 @@ class IBKRMarketDataProvider(MarketDataProvider):
 
     provider_name = "IBKR"
 
+    # IBKR caps simultaneous market data lines; snapshot requests are batched under it
+    max_batch_size = 50
+
     def fetch(self, symbol: str) -> Dict:
         """
         Fetch market data for a symbol (stub).
@@ -68,6 +85,13 @@ class IBKRMarketDataProvider(MarketDataProvider):
             "provider_name": self.provider_name,
         }
 
+    def fetch_many(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch snapshots for a batch of symbols in one request (stub).
+        """
+        timestamp = datetime.utcnow().isoformat()
+        return {symbol: _empty_snapshot(symbol, self.provider_name, timestamp) for symbol in symbols}
+
 # ================================
 # 3. Yahoo Market Data Provider (Stub)
 # ================================
@@ -96,6 +120,13 @@ class YahooMarketDataProvider(MarketDataProvider):
             "provider_name": self.provider_name,
         }
 
+    def fetch_many(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch quotes for many symbols with one multi-symbol quote request (stub).
+        """
+        timestamp = datetime.utcnow().isoformat()
+        return {symbol: _empty_snapshot(symbol, self.provider_name, timestamp) for symbol in symbols}
+
 # ================================
 # 4. Standalone Demo
 # ================================
@@ -106,6 +137,7 @@ if __name__ == "__main__":
 
     print(ibkr.fetch("AAPL"))
     print(yahoo.fetch("AAPL"))
+    print(ibkr.fetch_many(["AAPL", "TSLA"]))
 
 # ================================
 # END OF FILE
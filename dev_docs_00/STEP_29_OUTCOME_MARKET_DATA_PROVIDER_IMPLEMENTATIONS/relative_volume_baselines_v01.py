@@ -0,0 +1,296 @@
+# File: relative_volume_baselines_v01.py
+# Created: 2025-12-18
+# Version Notes:
+# - v01: Time-of-day cumulative volume baselines (memory-mapped) + O(1) rVol lookup
+
+"""
+RELATIVE VOLUME BASELINES (TIME-OF-DAY RVOL)
+--------------------------------------------
+
+GLOBAL CONTEXT
+--------------
+Relative volume compares today's cumulative volume with what the symbol
+normally has traded *by the same time of day*:
+
+    rVol = cumulative volume so far today / average cumulative volume
+           at this minute over the last N sessions
+
+Until now `relative_volume` was copied from whatever the provider sent.
+Computing it properly at scan time would mean a history query per symbol
+per cycle. This file splits the work in two:
+
+1. PRECOMPUTE (once, before the session)
+   `build_rvol_baselines(history, path)` turns historical 1-minute bars into
+   one cumulative-volume curve per symbol (one value per session minute,
+   averaged over the sessions given) and writes them to a `.npy` matrix
+   [symbol, minute] plus a small JSON index (symbol → row).
+
+2. RUNTIME (every cycle)
+   `RelativeVolumeEngine(path)` memory-maps the matrix. `lookup(symbol,
+   cumulative_volume, ts)` is a dict lookup for the row, arithmetic for the
+   column and one array read: no history, no allocation, and pages the
+   scanner never touches are never loaded.
+
+Session minutes run from SESSION_START (04:00 ET, premarket included —
+small-cap momentum starts there) for SESSION_MINUTES. Naive timestamps are
+treated as UTC, like the providers' `datetime.utcnow()` snapshots.
+
+SOURCE OF TRUTH
+---------------
+Derived strictly from:
+- STEP_29_OUTCOME_MARKET_DATA_PROVIDER_IMPLEMENTATIONS.md
+- scanner_print_contract_v01.py (relative_volume, volume_spike)
+
+STANDALONE GUARANTEE
+-------------------
+Runs with synthetic bars; no market data needed.
+
+TRADING MODE
+------------
+Data derivation only.
+"""
+
+# ================================
+# 1. Imports
+# ================================
+
+import json
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+EXCHANGE_TIMEZONE = ZoneInfo("America/New_York")
+SESSION_START = time(4, 0)
+SESSION_MINUTES = 16 * 60  # 04:00 → 20:00 ET
+
+DEFAULT_SPIKE_THRESHOLD = 5.0
+
+# ================================
+# 2. Time Helpers
+# ================================
+
+def _exchange_time(ts: datetime) -> datetime:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(EXCHANGE_TIMEZONE)
+
+
+def session_minute(ts: datetime, minutes: int = SESSION_MINUTES) -> Optional[int]:
+    """
+    Minute index of `ts` inside its session (0 = first minute).
+
+    None before the session opens; clamped to the last minute after it closes
+    (the day's cumulative volume is final by then).
+    """
+    local = _exchange_time(ts)
+    elapsed = (local.hour * 60 + local.minute) - (SESSION_START.hour * 60 + SESSION_START.minute)
+    if elapsed < 0:
+        return None
+    return min(elapsed, minutes - 1)
+
+
+def _baseline_paths(path: str) -> Tuple[str, str]:
+    root = path[:-4] if path.endswith(".npy") else path
+    return root + ".npy", root + ".json"
+
+# ================================
+# 3. Precompute: Baseline Builder
+# ================================
+
+def cumulative_volume_curve(bars: Iterable[Mapping], minutes: int = SESSION_MINUTES) -> Dict[date, np.ndarray]:
+    """
+    One cumulative volume curve per session day from 1-minute bars.
+
+    Bars are {"timestamp": datetime, "volume": number}. Minutes without a bar
+    carry the previous cumulative value forward.
+    """
+    per_day: Dict[date, np.ndarray] = {}
+    for bar in bars:
+        volume = bar.get("volume")
+        minute = session_minute(bar["timestamp"], minutes)
+        if volume is None or minute is None:
+            continue
+        day = _exchange_time(bar["timestamp"]).date()
+        if day not in per_day:
+            per_day[day] = np.zeros(minutes, dtype=np.float64)
+        per_day[day][minute] += volume
+
+    return {day: np.cumsum(volume_by_minute) for day, volume_by_minute in per_day.items()}
+
+
+def build_rvol_baselines(history: Mapping[str, Iterable[Mapping]],
+                         path: str,
+                         minutes: int = SESSION_MINUTES) -> Dict:
+    """
+    Write per-symbol, per-minute average cumulative volume to `path`.
+
+    Parameters
+    ----------
+    history : mapping
+        symbol → historical 1-minute bars (the lookback window, e.g. 20 sessions)
+    path : str
+        Output path; `<path>.npy` (float32 [symbol, minute]) and `<path>.json`
+        (symbol index + session layout) are written.
+
+    Returns
+    -------
+    dict
+        The JSON index that was written.
+    """
+    matrix_path, index_path = _baseline_paths(path)
+    directory = os.path.dirname(matrix_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    symbols = sorted(history)
+    # Written row by row into the memory map: the full matrix is never in RAM
+    baselines = np.lib.format.open_memmap(matrix_path, mode="w+", dtype=np.float32,
+                                          shape=(len(symbols), minutes))
+    sessions: Dict[str, int] = {}
+    for row, symbol in enumerate(symbols):
+        curves = cumulative_volume_curve(history[symbol], minutes)
+        sessions[symbol] = len(curves)
+        baselines[row] = np.mean(list(curves.values()), axis=0) if curves else 0.0
+    baselines.flush()
+    del baselines
+
+    index = {
+        "symbols": symbols,
+        "sessions": sessions,
+        "session_start": SESSION_START.strftime("%H:%M"),
+        "session_minutes": minutes,
+        "built_at": datetime.utcnow().isoformat(),
+    }
+    with open(index_path, "w", encoding="utf-8") as handle:
+        json.dump(index, handle)
+    return index
+
+# ================================
+# 4. Runtime: rVol Engine
+# ================================
+
+class RelativeVolumeEngine:
+    """
+    RelativeVolumeEngine
+    --------------------
+    O(1) rVol + volume spike from live cumulative volume.
+    """
+
+    def __init__(self, path: str, spike_threshold: float = DEFAULT_SPIKE_THRESHOLD):
+        matrix_path, index_path = _baseline_paths(path)
+        with open(index_path, encoding="utf-8") as handle:
+            index = json.load(handle)
+        if index["session_start"] != SESSION_START.strftime("%H:%M"):
+            raise ValueError(f"Baselines built for session start {index['session_start']}, "
+                             f"engine expects {SESSION_START.strftime('%H:%M')}")
+
+        self.baselines = np.load(matrix_path, mmap_mode="r")
+        self.minutes = index["session_minutes"]
+        self.built_at = index["built_at"]
+        self.spike_threshold = spike_threshold
+        self._rows: Dict[str, int] = {symbol: row for row, symbol in enumerate(index["symbols"])}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rows
+
+    def baseline(self, symbol: str, ts: datetime) -> Optional[float]:
+        """Average cumulative volume for `symbol` by the minute of `ts` (None = unknown)."""
+        row = self._rows.get(symbol)
+        minute = session_minute(ts, self.minutes)
+        if row is None or minute is None:
+            return None
+        value = float(self.baselines[row, minute])
+        return value if value > 0 else None
+
+    def lookup(self, symbol: str, cumulative_volume: Optional[float], ts: datetime) -> Dict:
+        """
+        Returns
+        -------
+        dict
+            {"relative_volume": float | None, "volume_spike": bool | None}
+            None when there is no baseline or no live volume (N/A, not 0).
+        """
+        baseline = self.baseline(symbol, ts)
+        if baseline is None or cumulative_volume is None:
+            return {"relative_volume": None, "volume_spike": None}
+        rvol = cumulative_volume / baseline
+        return {"relative_volume": round(rvol, 2), "volume_spike": rvol >= self.spike_threshold}
+
+    def annotate(self, snapshot: Dict, ts: Optional[datetime] = None) -> Dict:
+        """
+        Fill `relative_volume` / `volume_spike` of a provider snapshot from
+        its cumulative day `volume` (snapshot timestamp unless `ts` given).
+        Snapshots without a baseline keep whatever the provider sent.
+        """
+        if ts is None:
+            ts = snapshot.get("timestamp")
+            ts = datetime.fromisoformat(ts) if isinstance(ts, str) else ts or datetime.utcnow()
+        result = self.lookup(snapshot.get("symbol"), snapshot.get("volume"), ts)
+        if result["relative_volume"] is not None:
+            snapshot.update(result)
+        return snapshot
+
+# ================================
+# 5. Standalone Demo
+# ================================
+
+def synthetic_minute_bars(symbol_seed: int, days: Sequence[date], minutes: int = SESSION_MINUTES) -> List[Dict]:
+    """U-shaped intraday volume (busy open/close) with a per-symbol scale."""
+    rng = np.random.default_rng(symbol_seed)
+    scale = float(np.exp(rng.normal(8.0, 1.0)))
+    shape = 0.2 + np.exp(-np.arange(minutes) / 60.0) + np.exp(-(minutes - np.arange(minutes)) / 90.0)
+    bars = []
+    for day in days:
+        start = datetime.combine(day, SESSION_START, tzinfo=EXCHANGE_TIMEZONE)
+        volumes = rng.poisson(scale * shape)
+        bars.extend({"timestamp": start + timedelta(minutes=m), "volume": int(v)}
+                    for m, v in enumerate(volumes))
+    return bars
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time as _time
+
+    calendar = (date(2025, 12, 1) + timedelta(days=d) for d in range(28))
+    days = [day for day in calendar if day.weekday() < 5][:20]
+    history = {f"SYM{i:03d}": synthetic_minute_bars(i, days) for i in range(50)}
+    path = os.path.join(tempfile.mkdtemp(), "rvol_baselines")
+
+    started = _time.perf_counter()
+    index = build_rvol_baselines(history, path)
+    print(f"Precompute: {len(index['symbols'])} symbols x {len(days)} sessions "
+          f"in {(_time.perf_counter() - started) * 1000:.0f} ms")
+
+    engine = RelativeVolumeEngine(path)
+    now = datetime(2025, 12, 29, 9, 45, tzinfo=EXCHANGE_TIMEZONE)
+    minute = session_minute(now)
+
+    # Today: SYM007 trades 8x its usual pace, everything else normal
+    live = {}
+    for symbol in history:
+        live[symbol] = engine.baseline(symbol, now) * (8.0 if symbol == "SYM007" else 1.1)
+
+    # Per-cycle history query (what the lookup replaces)
+    started = _time.perf_counter()
+    for symbol, bars in history.items():
+        curves = cumulative_volume_curve(bars)
+        expected = np.mean([curve[minute] for curve in curves.values()])
+        live[symbol] / expected
+    history_ms = (_time.perf_counter() - started) * 1000
+
+    started = _time.perf_counter()
+    results = {symbol: engine.lookup(symbol, volume, now) for symbol, volume in live.items()}
+    lookup_ms = (_time.perf_counter() - started) * 1000
+
+    print(f"rVol from history: {history_ms:.1f} ms | from baselines: {lookup_ms:.2f} ms ({len(live)} symbols)")
+    print("SYM007:", results["SYM007"], "| SYM008:", results["SYM008"])
+    print("Premarket-closed lookup (03:00 ET):",
+          engine.lookup("SYM007", 1000, datetime(2025, 12, 29, 3, 0, tzinfo=EXCHANGE_TIMEZONE)))
+
+# ================================
+# END OF FILE
+# ================================
@@ -3,6 +3,7 @@
 # Created: 2025-12-16
 # Version Notes:
 # - v01: News aggregation metrics engine skeleton
+# - v01.1: Optional `now` for compute() and next_change_at() so callers can cache metrics until they would change
 
 """
 NEWS AGGREGATION METRICS ENGINE
@@ -36,8 +37,11 @@ Observation only.
 # 1. Imports
 # ================================
 
+import math
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+VELOCITY_WINDOWS_MINUTES = (1, 5, 10)
 
 # ================================
 # 2. Aggregation Engine
@@ -50,20 +54,15 @@ class NewsAggregationMetricsEngine:
     Computes aggregated metrics from normalized headlines.
     """
 
-    def compute(self, headlines: List[Dict]) -> Dict:
+    def compute(self, headlines: List[Dict], now: Optional[datetime] = None) -> Dict:
         """
         Compute news aggregation metrics.
-        """
-        now = datetime.utcnow()
 
-        # Filter valid timestamps
-        valid = []
-        for h in headlines:
-            try:
-                ts = datetime.fromisoformat(h.get("published_timestamp"))
-                valid.append((h, ts))
-            except Exception:
-                continue
+        `now` defaults to the current UTC time; pass it explicitly to get
+        repeatable results (e.g. one timestamp for a whole scan cycle).
+        """
+        now = now or datetime.utcnow()
+        valid = self._valid_headlines(headlines)
 
         # Velocity windows
         velocity_1m = sum(1 for _, ts in valid if now - ts <= timedelta(minutes=1))
@@ -96,6 +95,49 @@ class NewsAggregationMetricsEngine:
             "headlines": headlines,
         }
 
+    def next_change_at(self, headlines: List[Dict], now: datetime) -> Optional[datetime]:
+        """
+        Earliest time at or after `now` when compute() could return different
+        metrics for the same headlines, or None if they never change.
+
+        TEACHING NOTE:
+        The metrics only depend on time through the velocity windows and the
+        whole-minute headline age, so they are piecewise constant. A scanner
+        can keep a cached result until this moment and still match a fresh
+        computation exactly.
+        """
+        valid = self._valid_headlines(headlines)
+        if not valid:
+            return None
+
+        boundaries = []
+
+        # A headline leaves a velocity window once now - ts exceeds the window
+        for _, ts in valid:
+            for minutes in VELOCITY_WINDOWS_MINUTES:
+                leaves_at = ts + timedelta(minutes=minutes)
+                if leaves_at >= now:
+                    boundaries.append(leaves_at)
+
+        # Headline age ticks over at the next whole minute (int() truncates toward zero)
+        latest_ts = max(ts for _, ts in valid)
+        elapsed = (now - latest_ts).total_seconds() / 60
+        step = math.floor(elapsed) + 1 if elapsed >= 0 else math.ceil(elapsed)
+        boundaries.append(latest_ts + timedelta(minutes=step))
+
+        return min(boundaries)
+
+    def _valid_headlines(self, headlines: List[Dict]) -> List:
+        """Pair headlines with their parsed timestamps, skipping unparseable ones."""
+        valid = []
+        for h in headlines:
+            try:
+                ts = datetime.fromisoformat(h.get("published_timestamp"))
+                valid.append((h, ts))
+            except Exception:
+                continue
+        return valid
+
 # ================================
 # 3. Standalone Demo
 # ================================
@@ -113,6 +155,7 @@ if __name__ == "__main__":
     ]
 
     print(engine.compute(demo_headlines))
+    print("Metrics stable until:", engine.next_change_at(demo_headlines, datetime.utcnow()))
 
 # ================================
 # END OF FILE
@@ -0,0 +1,103 @@
+# File: scanner_scoring_config_v01.py
+# Created: 2025-12-18
+# Version Notes:
+# - v01: Scanner scoring thresholds and weights as configuration
+
+"""
+SCANNER SCORING CONFIGURATION
+-----------------------------
+
+GLOBAL CONTEXT
+--------------
+This file holds the thresholds and weights used by ScannerScoringEngine.
+
+Each scoring component is "if metric passes threshold → add weight":
+- gap_percent        > gap_threshold           → + gap_weight
+- relative_volume    > rvol_threshold          → + rvol_weight
+- news_velocity_10m  > news_velocity_threshold → + news_velocity_weight
+- unique_region_count >= region_min_count      → + region_weight
+- sentiment_score (any value)                  → + sentiment × sentiment_weight
+- spread             < spread_max              → + spread_weight
+
+The final score is clamped to [score_min, score_max].
+
+SOURCE OF TRUTH
+---------------
+Derived strictly from:
+- STEP_35_OUTCOME_SCANNER_SCORING_ENGINE.md
+- STEP_22_OUTCOME_CONFIGURATION_LOADER_AND_VALIDATION.md (config["scanner"]["scoring"])
+
+STANDALONE GUARANTEE
+-------------------
+No external dependencies.
+
+TRADING MODE
+------------
+Configuration only.
+"""
+
+# ================================
+# 1. Imports
+# ================================
+
+from dataclasses import dataclass, fields
+from typing import Dict
+
+# ================================
+# 2. Scoring Configuration Model
+# ================================
+
+@dataclass(frozen=True)
+class ScoringConfig:
+    """
+    ScoringConfig
+    -------------
+    Canonical scanner scoring configuration (defaults = original heuristics).
+    """
+
+    gap_threshold: float = 10.0
+    gap_weight: float = 20.0
+
+    rvol_threshold: float = 5.0
+    rvol_weight: float = 20.0
+
+    news_velocity_threshold: float = 5.0
+    news_velocity_weight: float = 15.0
+
+    region_min_count: int = 3
+    region_weight: float = 15.0
+
+    sentiment_weight: float = 10.0
+
+    spread_max: float = 0.05
+    spread_weight: float = 10.0
+
+    score_min: float = 0.0
+    score_max: float = 100.0
+
+    @classmethod
+    def from_dict(cls, section: Dict) -> "ScoringConfig":
+        """
+        Build from a loaded config section, e.g. config["scanner"]["scoring"].
+
+        Missing keys keep their defaults; unknown keys raise ValueError so a
+        typo cannot silently fall back to a default weight.
+        """
+        known = {f.name for f in fields(cls)}
+        unknown = set(section) - known
+        if unknown:
+            raise ValueError(f"Unknown scanner scoring config keys: {sorted(unknown)}")
+        return cls(**section)
+
+
+DEFAULT_SCORING_CONFIG = ScoringConfig()
+
+# ================================
+# TEACHING NOTE
+# ================================
+# Scoring weights are a research knob, not code.
+# Tuning them should never require editing the scoring engine.
+
+# ================================
+# END OF FILE
+# ================================
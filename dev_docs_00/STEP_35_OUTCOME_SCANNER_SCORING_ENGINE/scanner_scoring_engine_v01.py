@@ -2,6 +2,7 @@
 # Created: 2025-12-16
 # Version Notes:
 # - v01: Scanner composite scoring skeleton
+# - v01.1: Config-driven weights/thresholds; vectorized score_batch with lazy rationale
 
 """
 SCANNER SCORING ENGINE
@@ -14,10 +15,25 @@ is to rank symbols by *attention priority*.
 
 This is NOT a trade signal.
 
+Weights and thresholds come from ScoringConfig (scanner_scoring_config_v01.py).
+
+BATCH MODE
+----------
+`score(metrics)` scores one symbol from a dict.
+`score_batch(columns)` scores the whole universe at once from columnar
+metrics (one array per metric, NaN/None = missing) using NumPy masks.
+
+- Scores are identical to `score()` element for element: components are
+  added in the same order and rounded with Python's round().
+- Rationale strings are NOT built for every symbol. The returned
+  ScoreBatch keeps one boolean mask per component and builds the text
+  only when `rationale(i)` is asked for (i.e. for displayed rows).
+
 SOURCE OF TRUTH
 ---------------
 Derived strictly from:
 - STEP_35_OUTCOME_SCANNER_SCORING_ENGINE.md
+- scanner_scoring_config_v01.py
 
 STANDALONE GUARANTEE
 -------------------
@@ -29,7 +45,68 @@ Observation only.
 """
 
 # ================================
-# 1. Scoring Engine
+# 1. Imports
+# ================================
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from scanner_scoring_config_v01 import DEFAULT_SCORING_CONFIG, ScoringConfig
+
+# Component order = order of score additions and rationale text
+REASON_LARGE_GAP = "Large gap"
+REASON_HIGH_RVOL = "High relative volume"
+REASON_NEWS_VELOCITY = "Rapid news velocity"
+REASON_GLOBAL_COVERAGE = "Global news coverage"
+REASON_SENTIMENT = "Sentiment contribution"
+REASON_TIGHT_SPREAD = "Tight spread"
+NO_SIGNAL_RATIONALE = "No strong scanner signals"
+
+SCORING_METRICS = (
+    "gap_percent",
+    "relative_volume",
+    "news_velocity_10m",
+    "unique_region_count",
+    "sentiment_score",
+    "spread",
+)
+
+# ================================
+# 2. Batch Result
+# ================================
+
+class ScoreBatch:
+    """
+    ScoreBatch
+    ----------
+    Scores for a whole universe plus per-component masks.
+    Rationale text is built on demand.
+    """
+
+    def __init__(self, scores: np.ndarray, reason_masks: Sequence):
+        self.scores = scores
+        self._reason_masks = reason_masks  # [(reason text, bool array)], addition order
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def rationale(self, index: int) -> str:
+        reasons = [reason for reason, mask in self._reason_masks if mask[index]]
+        return "; ".join(reasons) if reasons else NO_SIGNAL_RATIONALE
+
+    def rationales(self, indices: Iterable[int]) -> List[str]:
+        return [self.rationale(i) for i in indices]
+
+    def result(self, index: int) -> dict:
+        """Same shape as ScannerScoringEngine.score()."""
+        return {
+            "scanner_score": float(self.scores[index]),
+            "scoring_rationale": self.rationale(index)
+        }
+
+# ================================
+# 3. Scoring Engine
 # ================================
 
 class ScannerScoringEngine:
@@ -39,6 +116,9 @@ class ScannerScoringEngine:
     Produces a normalized score and explanation.
     """
 
+    def __init__(self, config: Optional[ScoringConfig] = None):
+        self.config = config or DEFAULT_SCORING_CONFIG
+
     def score(self, metrics: dict) -> dict:
         """
         Compute composite scanner score.
@@ -57,43 +137,43 @@ class ScannerScoringEngine:
             }
         """
 
+        cfg = self.config
         score = 0.0
         reasons = []
 
-        # Example heuristic scoring (placeholders)
         gap = metrics.get("gap_percent")
-        if gap and gap > 10:
-            score += 20
-            reasons.append("Large gap")
+        if gap and gap > cfg.gap_threshold:
+            score += cfg.gap_weight
+            reasons.append(REASON_LARGE_GAP)
 
         rvol = metrics.get("relative_volume")
-        if rvol and rvol > 5:
-            score += 20
-            reasons.append("High relative volume")
+        if rvol and rvol > cfg.rvol_threshold:
+            score += cfg.rvol_weight
+            reasons.append(REASON_HIGH_RVOL)
 
         velocity = metrics.get("news_velocity_10m")
-        if velocity and velocity > 5:
-            score += 15
-            reasons.append("Rapid news velocity")
+        if velocity and velocity > cfg.news_velocity_threshold:
+            score += cfg.news_velocity_weight
+            reasons.append(REASON_NEWS_VELOCITY)
 
         regions = metrics.get("unique_region_count")
-        if regions and regions >= 3:
-            score += 15
-            reasons.append("Global news coverage")
+        if regions and regions >= cfg.region_min_count:
+            score += cfg.region_weight
+            reasons.append(REASON_GLOBAL_COVERAGE)
 
         sentiment = metrics.get("sentiment_score")
         if sentiment is not None:
-            score += sentiment * 10
-            reasons.append("Sentiment contribution")
+            score += sentiment * cfg.sentiment_weight
+            reasons.append(REASON_SENTIMENT)
 
         spread = metrics.get("spread")
-        if spread and spread < 0.05:
-            score += 10
-            reasons.append("Tight spread")
+        if spread and spread < cfg.spread_max:
+            score += cfg.spread_weight
+            reasons.append(REASON_TIGHT_SPREAD)
 
-        score = round(min(max(score, 0), 100), 2)
+        score = round(min(max(score, cfg.score_min), cfg.score_max), 2)
 
-        rationale = "; ".join(reasons) if reasons else "No strong scanner signals"
+        rationale = "; ".join(reasons) if reasons else NO_SIGNAL_RATIONALE
 
         return {
             "scanner_score": score,
@@ -101,8 +181,101 @@ class ScannerScoringEngine:
         }
 
 
+    def score_batch(self, columns: Mapping[str, Iterable]) -> ScoreBatch:
+        """
+        Compute composite scanner scores for many symbols at once.
+
+        Parameters
+        ----------
+        columns : mapping
+            metric name → one value per symbol (see SCORING_METRICS).
+            None / NaN = missing. A metric absent from the mapping is
+            missing for every symbol.
+
+        Returns
+        -------
+        ScoreBatch
+            .scores (float64 array, identical to score() per symbol)
+            .rationale(i) built lazily
+        """
+        cfg = self.config
+        size = self._batch_size(columns)
+        values = {name: self._column(columns, name, size) for name in SCORING_METRICS}
+
+        # `x and x > t` in score(): missing and 0 never pass, whatever t is
+        def passes(name: str, op, threshold) -> np.ndarray:
+            column = values[name]
+            with np.errstate(invalid="ignore"):
+                return (column != 0) & op(column, threshold) & ~np.isnan(column)
+
+        gap_mask = passes("gap_percent", np.greater, cfg.gap_threshold)
+        rvol_mask = passes("relative_volume", np.greater, cfg.rvol_threshold)
+        velocity_mask = passes("news_velocity_10m", np.greater, cfg.news_velocity_threshold)
+        region_mask = passes("unique_region_count", np.greater_equal, cfg.region_min_count)
+        sentiment_mask = ~np.isnan(values["sentiment_score"])
+        spread_mask = passes("spread", np.less, cfg.spread_max)
+
+        # Same addition order as score() so floating point results match bit for bit
+        score = np.zeros(size, dtype=np.float64)
+        score += np.where(gap_mask, float(cfg.gap_weight), 0.0)
+        score += np.where(rvol_mask, float(cfg.rvol_weight), 0.0)
+        score += np.where(velocity_mask, float(cfg.news_velocity_weight), 0.0)
+        score += np.where(region_mask, float(cfg.region_weight), 0.0)
+        score += np.where(sentiment_mask, values["sentiment_score"] * float(cfg.sentiment_weight), 0.0)
+        score += np.where(spread_mask, float(cfg.spread_weight), 0.0)
+
+        score = np.minimum(np.maximum(score, float(cfg.score_min)), float(cfg.score_max))
+
+        scores = self._round2(score)
+
+        return ScoreBatch(scores, [
+            (REASON_LARGE_GAP, gap_mask),
+            (REASON_HIGH_RVOL, rvol_mask),
+            (REASON_NEWS_VELOCITY, velocity_mask),
+            (REASON_GLOBAL_COVERAGE, region_mask),
+            (REASON_SENTIMENT, sentiment_mask),
+            (REASON_TIGHT_SPREAD, spread_mask),
+        ])
+
+    @staticmethod
+    def _round2(values: np.ndarray) -> np.ndarray:
+        """
+        Element-wise round(v, 2), identical to Python's round().
+
+        rint(v * 100) / 100 is exact except when v * 100 lands next to a
+        .5 tie (the multiplication may have crossed it); those few values
+        go through Python's correctly rounded round().
+        """
+        scaled = values * 100.0
+        rounded = np.rint(scaled) / 100.0
+        near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+        for index in np.flatnonzero(near_tie):
+            rounded[index] = round(float(values[index]), 2)
+        return rounded
+
+    @staticmethod
+    def columns_from_metrics(rows: Sequence[Mapping]) -> Dict[str, List]:
+        """Row dicts (score() input) → columns (score_batch() input)."""
+        return {name: [row.get(name) for row in rows] for name in SCORING_METRICS}
+
+    @staticmethod
+    def _batch_size(columns: Mapping[str, Iterable]) -> int:
+        sizes = {len(columns[name]) for name in SCORING_METRICS if name in columns}
+        if len(sizes) > 1:
+            raise ValueError(f"score_batch columns have different lengths: {sorted(sizes)}")
+        return sizes.pop() if sizes else 0
+
+    @staticmethod
+    def _column(columns: Mapping[str, Iterable], name: str, size: int) -> np.ndarray:
+        if name not in columns:
+            return np.full(size, np.nan)
+        column = columns[name]
+        if isinstance(column, np.ndarray) and column.dtype.kind in "fiub":
+            return column.astype(np.float64, copy=False)
+        return np.array([np.nan if v is None else v for v in column], dtype=np.float64)
+
 # ================================
-# 2. Standalone Demo
+# 4. Standalone Demo
 # ================================
 
 if __name__ == "__main__":
@@ -119,6 +292,47 @@ if __name__ == "__main__":
 
     print(engine.score(demo_metrics))
 
+    # Batch vs scalar over a synthetic universe (missing values, zeros, edges)
+    import random
+    import time
+
+    rng = random.Random(35)
+
+    def maybe(value):
+        return None if rng.random() < 0.1 else value
+
+    rows = [
+        {
+            "gap_percent": maybe(rng.choice([0, 10, round(rng.uniform(-20, 60), 2)])),
+            "relative_volume": maybe(round(rng.uniform(0, 12), 2)),
+            "news_velocity_10m": maybe(rng.randint(0, 12)),
+            "unique_region_count": maybe(rng.randint(0, 6)),
+            "sentiment_score": maybe(round(rng.uniform(-1, 1), 3)),
+            "spread": maybe(rng.choice([0, 0.05, round(rng.uniform(0.001, 0.2), 4)])),
+        }
+        for _ in range(20_000)
+    ]
+
+    started = time.perf_counter()
+    scalar = [engine.score(row) for row in rows]
+    scalar_ms = (time.perf_counter() - started) * 1000
+
+    columns = {name: np.array([np.nan if v is None else v for v in column], dtype=np.float64)
+               for name, column in ScannerScoringEngine.columns_from_metrics(rows).items()}
+    started = time.perf_counter()
+    batch = engine.score_batch(columns)
+    batch_ms = (time.perf_counter() - started) * 1000
+
+    scores_match = all(s["scanner_score"] == b for s, b in zip(scalar, batch.scores.tolist()))
+    rationale_match = all(s["scoring_rationale"] == batch.rationale(i) for i, s in enumerate(scalar))
+    print(f"Scalar score() x {len(rows)}: {scalar_ms:.1f} ms")
+    print(f"score_batch() x {len(rows)}: {batch_ms:.1f} ms (rationale: 0 built)")
+    print(f"Scores identical: {scores_match} | rationale identical: {rationale_match}")
+
+    top = np.argsort(-batch.scores, kind="stable")[:5]
+    for i in top:
+        print(batch.result(int(i)))
+
 # ================================
 # END OF FILE
 # ================================
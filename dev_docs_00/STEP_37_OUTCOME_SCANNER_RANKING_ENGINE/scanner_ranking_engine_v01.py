@@ -2,6 +2,7 @@
 # Created: 2025-12-17
 # Version Notes:
 # - v01: Scanner ranking engine skeleton
+# - v01.1: IncrementalTopKRanker — heap with lazy deletion, O(K log N) top-K, rank change vs previous cycle
 
 """
 SCANNER RANKING ENGINE
@@ -14,6 +15,16 @@ composite scanner scores.
 
 Ranking helps traders focus attention efficiently.
 
+TOP-K MODE
+----------
+Traders only watch the top 20–50 symbols. IncrementalTopKRanker keeps a
+min-heap keyed on (-scanner_score, symbol) — the same order as rank():
+- update(payload) pushes a new entry in O(log N); the old entry is left in
+  the heap and skipped later (lazy deletion)
+- top_k(k) pops the k best live entries and pushes them back: O(K log N)
+- rank_change_vs_previous_cycle is filled from the previous top-K board
+  (positive = moved up, None = new to the board), no full re-sort needed
+
 SOURCE OF TRUTH
 ---------------
 Derived strictly from:
@@ -32,7 +43,8 @@ Observation only.
 # 1. Imports
 # ================================
 
-from typing import List, Dict
+import heapq
+from typing import List, Dict, Tuple
 
 # ================================
 # 2. Ranking Engine
@@ -66,10 +78,106 @@ class ScannerRankingEngine:
         return sorted_payloads
 
 # ================================
-# 3. Standalone Demo
+# 3. Incremental Top-K Ranker
+# ================================
+
+class IncrementalTopKRanker:
+    """
+    IncrementalTopKRanker
+    ---------------------
+    Keeps scores in a heap so only changed symbols cost work per cycle.
+    """
+
+    # Rebuild the heap once stale entries outnumber live ones by this factor
+    COMPACT_FACTOR = 2
+
+    def __init__(self):
+        self._heap: List[Tuple[float, str, int]] = []
+        self._payloads: Dict[str, Dict] = {}
+        self._versions: Dict[str, int] = {}
+        self._scores: Dict[str, float] = {}
+        self._previous_ranks: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._payloads
+
+    def symbols(self) -> List[str]:
+        return list(self._payloads)
+
+    def update(self, payload: Dict) -> None:
+        """Insert or re-score one payload (uses payload["scanner_score"])."""
+        symbol = payload.get("symbol", "")
+        score = payload.get("scanner_score") or 0
+        self._payloads[symbol] = payload
+
+        if symbol in self._scores and self._scores[symbol] == score:
+            return  # same key, existing heap entry is still valid
+
+        version = self._versions.get(symbol, 0) + 1
+        self._versions[symbol] = version
+        self._scores[symbol] = score
+        heapq.heappush(self._heap, (-score, symbol, version))
+        self._maybe_compact()
+
+    def remove(self, symbol: str) -> None:
+        """Drop a symbol; its heap entries become stale."""
+        if self._payloads.pop(symbol, None) is not None:
+            self._scores.pop(symbol)
+            self._versions[symbol] = self._versions.get(symbol, 0) + 1
+            self._maybe_compact()
+
+    def top_k(self, k: int) -> List[Dict]:
+        """
+        Return the k best payloads with scanner_rank and
+        rank_change_vs_previous_cycle filled in.
+        """
+        best: List[Tuple[float, str, int]] = []
+        while self._heap and len(best) < k:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                best.append(entry)
+
+        for entry in best:
+            heapq.heappush(self._heap, entry)
+
+        ranks = {}
+        ranked = []
+        for rank, (_, symbol, _) in enumerate(best, start=1):
+            payload = self._payloads[symbol]
+            previous = self._previous_ranks.get(symbol)
+            payload["scanner_rank"] = rank
+            payload["rank_change_vs_previous_cycle"] = None if previous is None else previous - rank
+            ranks[symbol] = rank
+            ranked.append(payload)
+
+        # Symbols that fell off the board no longer have a displayed rank
+        for symbol in self._previous_ranks.keys() - ranks.keys():
+            if symbol in self._payloads:
+                self._payloads[symbol]["scanner_rank"] = None
+
+        self._previous_ranks = ranks
+        return ranked
+
+    def _is_live(self, entry: Tuple[float, str, int]) -> bool:
+        _, symbol, version = entry
+        return symbol in self._payloads and self._versions[symbol] == version
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > self.COMPACT_FACTOR * max(len(self._payloads), 64):
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+# ================================
+# 4. Standalone Demo
 # ================================
 
 if __name__ == "__main__":
+    import random
+    import time
+
     engine = ScannerRankingEngine()
     demo = [
         {"symbol": "AAPL", "scanner_score": 75},
@@ -78,6 +186,37 @@ if __name__ == "__main__":
     ]
     print(engine.rank(demo))
 
+    # Top-K mode on a large universe where few scores change per cycle
+    rng = random.Random(7)
+    universe = [{"symbol": f"SYM{i:05d}", "scanner_score": round(rng.uniform(0, 100), 3)} for i in range(20_000)]
+    ranker = IncrementalTopKRanker()
+    for payload in universe:
+        ranker.update(payload)
+    ranker.top_k(20)
+
+    full_ms = topk_ms = 0.0
+    for cycle in range(50):
+        changed = rng.sample(universe, 500)
+        for payload in changed:
+            payload["scanner_score"] = round(rng.uniform(0, 100), 3)
+
+        started = time.perf_counter()
+        for payload in changed:
+            ranker.update(payload)
+        board = ranker.top_k(20)
+        top = [(p["symbol"], p["scanner_score"]) for p in board]
+        topk_ms += (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        reference = [(p["symbol"], p["scanner_score"]) for p in engine.rank([dict(p) for p in universe])[:20]]
+        full_ms += (time.perf_counter() - started) * 1000
+        assert top == reference, f"cycle {cycle}: top-K differs from full rank"
+
+    print(f"Full rank: {full_ms / 50:.2f} ms/cycle | incremental top-20: {topk_ms / 50:.3f} ms/cycle")
+    movers = [(p["scanner_rank"], p["symbol"], p["rank_change_vs_previous_cycle"])
+              for p in board if p["rank_change_vs_previous_cycle"] != 0]
+    print("Last cycle movers (rank, symbol, change; None = new to board):", movers)
+
 # ================================
 # END OF FILE
 # ================================
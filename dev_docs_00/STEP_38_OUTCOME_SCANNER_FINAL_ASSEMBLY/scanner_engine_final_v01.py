@@ -2,6 +2,12 @@
 # Created: 2025-12-17
 # Version Notes:
 # - v01: Complete scanner assembly (market + news + metrics + sentiment + score + alert + rank + print)
+# - v01.1: Incremental mode — only symbols with new ticks/news (dirty set) or expiring news metrics are rescanned
+# - v01.2: Concurrent mode — market/news fetches fanned out via concurrent_fetch_v01.py, output order unchanged
+# - v01.3: Top-K mode — IncrementalTopKRanker re-ranks only rescored symbols and prints the top K
+# - v01.4: Optional live display — ranked payloads go to ScannerLiveDisplay instead of full reprints
+# - v01.5: Demo runs the live display path alongside the printing engines
+# - v01.6: Scoring weights/thresholds from config["scanner"]["scoring"] (FinalScannerEngine.from_config)
 
 """
 SCANNER ENGINE — FINAL ASSEMBLY
@@ -16,10 +22,51 @@ Market Data + News + Metrics + Sentiment → Payload → Score → Alert → Ran
 
 This is the trader-facing watchlist feed.
 
+INCREMENTAL MODE
+----------------
+With `incremental=True` the engine keeps the scored payload of every symbol
+and only rescans symbols that:
+- were marked dirty by a tick or news arrival (on_tick / on_news), or
+- have never been scanned, or
+- have news metrics that changed with the clock (velocity windows, headline age).
+
+Ranking still runs over the whole universe, so the output is identical to a
+full rescan of the same data. Each cycle reports the dirty ratio
+(rescanned / universe) in `last_cycle_stats`.
+
+CONCURRENT MODE
+---------------
+With `concurrent=True` the symbols being (re)scanned are fetched through a
+bounded thread pool with per-call timeouts (ConcurrentSymbolFetcher).
+Payloads are built and scored as each symbol's fetches complete; ranking
+and printing are unchanged, so the output does not depend on timing.
+
+TOP-K MODE
+----------
+With `top_k=K` every scored payload is pushed into an IncrementalTopKRanker
+and only the best K are ranked, printed and returned (same order as the
+full ranking). Combined with incremental mode, a cycle costs
+O(changed log N + K log N) instead of a full sort. Board payloads also
+carry rank_change_vs_previous_cycle.
+
+LIVE DISPLAY MODE
+-----------------
+Pass a started ScannerLiveDisplay as `display` and the ranked payloads are
+published to it (diff-based redraw on its own thread) instead of printing
+every contract block and the per-cycle metric line.
+
+SCORING CONFIGURATION
+---------------------
+Pass a ScoringConfig as `scoring_config`, or build the engine with
+`FinalScannerEngine.from_config(config, ...)` to read the weights and
+thresholds from the loaded config["scanner"]["scoring"] section (STEP_22).
+Without either, the ScoringConfig defaults apply.
+
 SOURCE OF TRUTH
 ---------------
 Derived strictly from:
 - STEP_38_OUTCOME_SCANNER_FINAL_ASSEMBLY.md
+- STEP_22_OUTCOME_CONFIGURATION_LOADER_AND_VALIDATION.md (config["scanner"]["scoring"])
 
 STANDALONE GUARANTEE
 -------------------
@@ -34,7 +81,9 @@ Observation only.
 # 1. Imports
 # ================================
 
-from typing import List, Dict
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional, Set
 
 from data_source_registry_v01 import DataSourceRegistry
 from news_source_registry_v01 import NewsSourceRegistry
@@ -42,12 +91,19 @@ from news_source_registry_v01 import NewsSourceRegistry
 from news_aggregation_metrics_v01 import NewsAggregationMetricsEngine
 from sentiment_analysis_engine_v01 import SentimentAnalysisEngine
 
+from scanner_scoring_config_v01 import ScoringConfig
 from scanner_scoring_engine_v01 import ScannerScoringEngine
 from alert_priority_engine_v01 import AlertPriorityEngine
-from scanner_ranking_engine_v01 import ScannerRankingEngine
+from scanner_ranking_engine_v01 import IncrementalTopKRanker, ScannerRankingEngine
 
 from scanner_print_contract_v01 import validate_scanner_print_payload
 from scanner_print_formatter_v01 import ScannerPrintFormatter
+from scanner_live_display_v01 import ScannerLiveDisplay
+from concurrent_fetch_v01 import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_TIMEOUT_SECONDS,
+    ConcurrentSymbolFetcher,
+)
 
 # ================================
 # 2. Final Scanner Assembly
@@ -63,29 +119,106 @@ class FinalScannerEngine:
     def __init__(self,
                  symbols: List[str],
                  data_registry: DataSourceRegistry,
-                 news_registry: NewsSourceRegistry):
-        self.symbols = symbols
+                 news_registry: NewsSourceRegistry,
+                 incremental: bool = False,
+                 concurrent: bool = False,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 fetch_timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+                 top_k: Optional[int] = None,
+                 display: Optional[ScannerLiveDisplay] = None,
+                 scoring_config: Optional[ScoringConfig] = None):
+        self.symbols = symbols  # property: keeps the membership set in sync
         self.data_registry = data_registry
         self.news_registry = news_registry
+        self.incremental = incremental
+        self.fetcher = (
+            ConcurrentSymbolFetcher(data_registry, news_registry, max_workers, fetch_timeout_seconds)
+            if concurrent else None
+        )
 
         self.news_metrics_engine = NewsAggregationMetricsEngine()
         self.sentiment_engine = SentimentAnalysisEngine()
-        self.scoring_engine = ScannerScoringEngine()
+        self.scoring_engine = ScannerScoringEngine(scoring_config)
         self.alert_engine = AlertPriorityEngine()
         self.ranking_engine = ScannerRankingEngine()
+        self.top_k = top_k
+        self.top_k_ranker = IncrementalTopKRanker() if top_k else None
         self.formatter = ScannerPrintFormatter()
-
-    def run_scan(self) -> List[Dict]:
+        self.display = display
+
+        # Incremental state: scored payloads, pending dirty symbols and the
+        # time each cached payload's news metrics stop being valid
+        self._payload_cache: Dict[str, Dict] = {}
+        self._dirty: Set[str] = set()
+        self._dirty_lock = threading.Lock()  # on_tick / on_news may come from feed threads
+        self._expires_at: Dict[str, datetime] = {}
+        self.last_cycle_stats: Dict = {}
+
+    @classmethod
+    def from_config(cls,
+                    config: Dict,
+                    symbols: List[str],
+                    data_registry: DataSourceRegistry,
+                    news_registry: NewsSourceRegistry,
+                    **options) -> "FinalScannerEngine":
+        """
+        Build the engine from a loaded, validated config (STEP_22).
+
+        config["scanner"]["scoring"] is optional; missing keys keep their
+        ScoringConfig defaults and unknown keys raise ValueError.
+        """
+        scoring_section = config.get("scanner", {}).get("scoring", {})
+        return cls(symbols, data_registry, news_registry,
+                   scoring_config=ScoringConfig.from_dict(scoring_section), **options)
+
+    @property
+    def symbols(self) -> List[str]:
+        return self._symbols
+
+    @symbols.setter
+    def symbols(self, symbols: List[str]) -> None:
+        self._symbols = list(symbols)
+        self._symbol_set = set(self._symbols)
+
+    # ----------------------------
+    # Change Notifications
+    # ----------------------------
+
+    def mark_dirty(self, symbol: str) -> None:
+        """Flag a symbol for rescan on the next incremental cycle."""
+        if symbol in self._symbol_set:
+            with self._dirty_lock:
+                self._dirty.add(symbol)
+
+    def on_tick(self, symbol: str) -> None:
+        """Market data arrived for symbol."""
+        self.mark_dirty(symbol)
+
+    def on_news(self, symbol: str) -> None:
+        """A headline arrived for symbol."""
+        self.mark_dirty(symbol)
+
+    # ----------------------------
+    # Pipeline
+    # ----------------------------
+
+    def run_scan(self, now: Optional[datetime] = None) -> List[Dict]:
         """Run full scanner pipeline."""
-        payloads = [self._scan_symbol(s) for s in self.symbols]
-
-        # Score + alert per symbol
-        for p in payloads:
-            p.update(self.scoring_engine.compute(p))
-            p.update(self.alert_engine.compute(p))
-
-        # Rank globally
-        ranked = self.ranking_engine.rank(payloads)
+        now = now or datetime.utcnow()
+
+        if self.incremental:
+            payloads = self._collect_incremental(now)
+        else:
+            scanned = self._scan_symbols(self.symbols, now)
+            payloads = [scanned[s] for s in self.symbols]
+            self._drop_departed_symbols()
+            self._record_cycle_stats(len(payloads), len(payloads), 0, 0)
+
+        # Rank globally (or just the top-K board)
+        if self.top_k_ranker is not None:
+            ranked = self.top_k_ranker.top_k(self.top_k)
+        else:
+            ranked = self.ranking_engine.rank(payloads)
 
         # Validate + print
         for p in ranked:
@@ -93,16 +226,124 @@ class FinalScannerEngine:
             if missing:
                 p["scanner_error"] = f"Missing fields: {missing}"
 
-            print(self.formatter.format(p))
+            if self.display is None:
+                print(self.formatter.format(p))
+
+        if self.display is not None:
+            # Non-blocking: formatting happens on the display thread
+            self.display.publish(ranked)
 
         return ranked
 
-    def _scan_symbol(self, symbol: str) -> Dict:
-        """Scan one symbol and build contract payload."""
-        market = self.data_registry.fetch_market_data(symbol)
-        headlines = self.news_registry.fetch_news(symbol).get("headlines", [])
+    def close(self) -> None:
+        """Release the concurrent fetch threads (no-op in sequential mode)."""
+        if self.fetcher is not None:
+            self.fetcher.close()
+
+    def _scan_symbols(self, symbols: List[str], now: datetime) -> Dict[str, Dict]:
+        """Scan, score and alert the given symbols (sequentially or concurrently)."""
+        if self.fetcher is None:
+            return {
+                s: self._build_payload(s, now,
+                                       self.data_registry.fetch_market_data(s),
+                                       self.news_registry.fetch_news(s).get("headlines", []))
+                for s in symbols
+            }
+
+        scanned: Dict[str, Dict] = {}
+
+        def on_ready(index: int, fetched: Dict) -> None:
+            # Runs on this (calling) thread; only the fetches run on the pool
+            symbol = fetched["symbol"]
+            if fetched["errors"]:
+                print(f"[SCANNER_FINAL][WARN] Partial data for {symbol}: {fetched['errors']}")
+            scanned[symbol] = self._build_payload(
+                symbol, now,
+                fetched["market"] or {},
+                (fetched["news"] or {}).get("headlines", []),
+            )
+
+        self.fetcher.fetch(symbols, on_ready=on_ready)
+        return scanned
+
+    def _build_payload(self, symbol: str, now: datetime, market: Dict, headlines: List[Dict]) -> Dict:
+        """Payload + score + alert for fetched data; tracks news expiry in incremental mode."""
+        payload = self._score_payload(self._scan_symbol(symbol, now, market=market, headlines=headlines))
+        if self.incremental:
+            # Cached payloads stay valid until the news metrics would change
+            expires_at = self.news_metrics_engine.next_change_at(headlines, now)
+            if expires_at is None:
+                self._expires_at.pop(symbol, None)
+            else:
+                self._expires_at[symbol] = expires_at
+        return payload
+
+    def _collect_incremental(self, now: datetime) -> List[Dict]:
+        """Rescan dirty/expired symbols, reuse cached payloads for the rest."""
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
 
-        news_metrics = self.news_metrics_engine.compute(headlines)
+        expired = {
+            s for s, expires_at in self._expires_at.items()
+            if now >= expires_at and s not in dirty
+        }
+        rescan = dirty | expired
+
+        to_scan = [s for s in self.symbols if s in rescan or s not in self._payload_cache]
+        self._payload_cache.update(self._scan_symbols(to_scan, now))
+        payloads = [self._payload_cache[s] for s in self.symbols]
+
+        self._drop_departed_symbols()
+        self._record_cycle_stats(len(self.symbols), len(to_scan), len(dirty), len(expired))
+        return payloads
+
+    def _drop_departed_symbols(self) -> None:
+        """Forget cached/ranked state for symbols that left the universe."""
+        universe = set(self.symbols)
+        for s in set(self._payload_cache) - universe:
+            del self._payload_cache[s]
+        for s in set(self._expires_at) - universe:
+            del self._expires_at[s]
+        if self.top_k_ranker is not None:
+            for s in set(self.top_k_ranker.symbols()) - universe:
+                self.top_k_ranker.remove(s)
+
+    def _score_payload(self, payload: Dict) -> Dict:
+        """Score + alert one symbol (depends only on its own payload)."""
+        payload.update(self.scoring_engine.score(payload))
+        payload.update(self.alert_engine.compute(payload))
+        if self.top_k_ranker is not None:
+            self.top_k_ranker.update(payload)
+        return payload
+
+    def _record_cycle_stats(self, symbols: int, recomputed: int, dirty: int, expired: int) -> None:
+        self.last_cycle_stats = {
+            "symbols": symbols,
+            "recomputed": recomputed,
+            "dirty": dirty,
+            "expired": expired,
+            "dirty_ratio": round(recomputed / symbols, 4) if symbols else 0.0,
+        }
+        if self.display is not None:
+            return
+        print(
+            f"[SCANNER_FINAL][METRIC] dirty_ratio={self.last_cycle_stats['dirty_ratio']:.2%} "
+            f"recomputed={recomputed}/{symbols} (dirty={dirty}, expired={expired})"
+        )
+
+    def _scan_symbol(self,
+                     symbol: str,
+                     now: Optional[datetime] = None,
+                     market: Optional[Dict] = None,
+                     headlines: Optional[List[Dict]] = None) -> Dict:
+        """Scan one symbol and build contract payload (fetches unless given)."""
+        now = now or datetime.utcnow()
+        if market is None:
+            market = self.data_registry.fetch_market_data(symbol)
+        if headlines is None:
+            headlines = self.news_registry.fetch_news(symbol).get("headlines", [])
+
+        news_metrics = self.news_metrics_engine.compute(headlines, now=now)
         sentiment = self.sentiment_engine.compute(headlines)
 
         # Build contract payload (placeholders allowed)
@@ -156,13 +397,115 @@ class FinalScannerEngine:
 # ================================
 
 if __name__ == "__main__":
-    # NOTE: Registries can be wired with providers using scanner_wiring_v01.py
-    scanner = FinalScannerEngine(
-        symbols=["AAPL", "TSLA", "MSFT"],
-        data_registry=DataSourceRegistry(),
-        news_registry=NewsSourceRegistry(),
+    import contextlib
+    import io
+    from datetime import timedelta
+
+    from data_source_registry_v01 import MarketDataProvider
+    from news_source_registry_v01 import NewsProvider
+
+    # NOTE: Real registries are wired with providers using scanner_wiring_v01.py.
+    # The demo uses in-memory feeds so ticks and headlines can be injected.
+
+    class QuoteBoardProvider(MarketDataProvider):
+        provider_name = "DEMO_QUOTE_BOARD"
+
+        def __init__(self, symbols):
+            self.quotes = {s: {"current_price": 4.0, "previous_close_price": 3.8,
+                               "bid_price": 3.99, "ask_price": 4.01} for s in symbols}
+
+        def fetch(self, symbol):
+            return dict(self.quotes[symbol])
+
+    class HeadlineFeedProvider(NewsProvider):
+        provider_name = "DEMO_HEADLINE_FEED"
+
+        def __init__(self):
+            self.items = {}
+
+        def fetch(self, symbol):
+            return list(self.items.get(symbol, []))
+
+    universe = [f"SYM{i:03d}" for i in range(200)]
+    quotes = QuoteBoardProvider(universe)
+    feed = HeadlineFeedProvider()
+    data_registry = DataSourceRegistry()
+    data_registry.register_provider(quotes)
+    news_registry = NewsSourceRegistry()
+    news_registry.register_provider(feed)
+
+    scanner = FinalScannerEngine(universe, data_registry, news_registry, incremental=True)
+    reference = FinalScannerEngine(universe, data_registry, news_registry, concurrent=True)
+    sequential = FinalScannerEngine(universe, data_registry, news_registry)
+    board = FinalScannerEngine(universe, data_registry, news_registry, incremental=True, top_k=10)
+    # ansi=True: diff redraw as on a terminal, captured so the demo output stays readable
+    display = ScannerLiveDisplay(top_n=10, max_fps=0, stream=io.StringIO(), ansi=True).start()
+    live = FinalScannerEngine(universe, data_registry, news_registry, incremental=True, top_k=10,
+                              display=display)
+
+    clock = datetime(2025, 12, 17, 14, 30)
+    for cycle in range(1, 6):
+        # A few symbols tick, one gets a headline
+        for s in universe[cycle * 7: cycle * 7 + 4]:
+            quotes.quotes[s]["current_price"] += 0.05 * cycle
+            scanner.on_tick(s)
+        news_symbol = universe[cycle * 31]
+        feed.items.setdefault(news_symbol, []).append({
+            "headline_text": f"{news_symbol} update {cycle}",
+            "published_timestamp": clock.isoformat(),
+            "region": "US",
+            "source_name": "DemoWire",
+            "url": f"https://example.com/{news_symbol}/{cycle}",
+        })
+        scanner.on_news(news_symbol)
+        for s in universe[cycle * 7: cycle * 7 + 4] + [news_symbol]:
+            board.mark_dirty(s)
+            live.mark_dirty(s)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            incremental = scanner.run_scan(now=clock)
+            full = reference.run_scan(now=clock)
+            sequential_full = sequential.run_scan(now=clock)
+            top = board.run_scan(now=clock)
+        with contextlib.redirect_stdout(io.StringIO()) as printed:
+            live_top = live.run_scan(now=clock)
+
+        stats = scanner.last_cycle_stats
+        board_view = [(p["symbol"], p["scanner_rank"]) for p in top]
+        full_view = [(p["symbol"], p["scanner_rank"]) for p in full[:10]]
+        print(
+            f"[SCANNER_FINAL][DEMO] cycle={cycle} dirty_ratio={stats['dirty_ratio']:.2%} "
+            f"recomputed={stats['recomputed']}/{stats['symbols']} "
+            f"matches_full_rescan={incremental == full} "
+            f"concurrent_matches_sequential={full == sequential_full} "
+            f"top10_matches={board_view == full_view} "
+            f"display_matches={live_top == top} display_silent={printed.getvalue() == ''}"
+        )
+        clock += timedelta(seconds=45)
+
+    # Same universe scored from a loaded config section. Gap/spread are still
+    # payload placeholders here, so raise the score floor to make it visible.
+    tuned = FinalScannerEngine.from_config(
+        {"scanner": {"scoring": {"score_min": 5.0}}}, universe, data_registry, news_registry
     )
-    scanner.run_scan()
+    with contextlib.redirect_stdout(io.StringIO()):
+        tuned_scan = tuned.run_scan(now=clock)
+    print(
+        f"[SCANNER_FINAL][DEMO] config scanner.scoring score_min={tuned.scoring_engine.config.score_min} "
+        f"top score default={full[0]['scanner_score']} configured={tuned_scan[0]['scanner_score']}"
+    )
+
+    reference.close()
+    display.stop()
+    print(
+        f"[SCANNER_FINAL][DEMO] display frames rendered={display.frames_rendered} "
+        f"cells written={display.cells_written} "
+        f"(full redraw would be {display.frames_rendered * 10 * len(display.columns)}; "
+        f"diff savings need an ANSI terminal, plain output redraws every cell)"
+    )
+
+    print()
+    print(scanner.formatter.format(incremental[0]))
 
 # ================================
 # END OF FILE
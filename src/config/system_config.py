@@ -6,7 +6,8 @@ application. Values are intentionally safe and annotated to explain their
 purpose to new contributors during Phase 4.
 """
 
-from datetime import datetime, time
+from datetime import time
+from typing import Dict, Optional, Tuple
 
 # Runtime mode defaults to SIM to keep all behaviour safe by default. The
 # runtime_config module still owns authoritative runtime selection, but this
@@ -21,29 +22,167 @@ CYCLE_SLEEP_SECONDS: int = 3
 # does not yet act on these, but they show how we might gate behaviour.
 ACTIVE_SESSIONS = ["PRE", "REGULAR", "AFTER"]
 
+# Runtime loop selection. "POLLING" keeps the fixed-sleep cycle loop as the
+# safe fallback; "EVENT_DRIVEN" wakes the orchestrator on data events (ticks,
+# news, fills, timers) through core.event_runtime; "PIPELINED" runs each stage
+# as its own worker through core.pipeline so consecutive cycles overlap.
+RUNTIME_LOOP_MODE: str = "POLLING"
 
-def get_current_market_session() -> str:
-    """Return a simple market session indicator based on local time.
+# Heartbeat for the event-driven loop: when no data event arrives within this
+# many seconds a TIMER event wakes the orchestrator anyway.
+EVENT_TIMER_SECONDS: float = 3.0
 
-    This teaching helper uses broad time windows to map to common US equity
-    sessions:
-    - PRE:    04:00 - 09:30 local
-    - REGULAR:09:30 - 16:00 local
-    - AFTER:  16:00 - 20:00 local
-    - CLOSED: all other times
-    """
+# Events arriving this soon after a wake-up are folded into the same cycle so a
+# burst of ticks produces one cycle instead of many.
+EVENT_COALESCE_WINDOW_SECONDS: float = 0.05
 
-    now = datetime.now().time()
+# Simulated tick feed (market_data.teaching_feed). There is no live market data
+# connection yet, so in EVENT_DRIVEN mode this feed publishes random-walk trade
+# ticks for the scanner universe (about TEACHING_FEED_TICKS_PER_SECOND, seeded
+# by TEACHING_FEED_SEED) through the runtime's publish_tick. Disable it once a
+# real feed calls the runtime's publish_* methods.
+TEACHING_FEED_ENABLED: bool = True
+TEACHING_FEED_TICKS_PER_SECOND: float = 2.0
+TEACHING_FEED_SEED: int = 7
 
-    pre_start = time(4, 0)
-    regular_start = time(9, 30)
-    regular_end = time(16, 0)
-    after_end = time(20, 0)
+# Exchange session calendar (core.session_calendar). Session windows are in
+# exchange-local time for EXCHANGE_TIMEZONE, so DST is handled by the
+# calendar rather than by the machine's local clock. On early-close days
+# (day after Thanksgiving, Christmas Eve, July 3) regular trading ends at
+# SESSION_EARLY_CLOSE and after-hours at SESSION_AFTER_END_EARLY_CLOSE.
+EXCHANGE_TIMEZONE: str = "America/New_York"
+SESSION_PRE_START: time = time(4, 0)
+SESSION_REGULAR_START: time = time(9, 30)
+SESSION_REGULAR_END: time = time(16, 0)
+SESSION_AFTER_END: time = time(20, 0)
+SESSION_EARLY_CLOSE: time = time(13, 0)
+SESSION_AFTER_END_EARLY_CLOSE: time = time(17, 0)
 
-    if pre_start <= now < regular_start:
-        return "PRE"
-    if regular_start <= now < regular_end:
-        return "REGULAR"
-    if regular_end <= now < after_end:
-        return "AFTER"
-    return "CLOSED"
+# When the session is CLOSED, runtime loops sleep until the next session
+# boundary instead of cycling every CYCLE_SLEEP_SECONDS through the night.
+SLEEP_THROUGH_CLOSED_SESSIONS: bool = True
+
+# Capacity of each bounded queue between pipeline stages. Small values keep
+# backpressure tight: a slow stage stalls its producers after this many cycles.
+PIPELINE_QUEUE_MAXSIZE: int = 2
+
+# Stage timing telemetry. Every orchestrator stage is timed into rolling
+# histograms covering the last STAGE_TIMING_WINDOW_SECONDS. Overhead is about
+# a microsecond per timed stage, so this stays on in every mode.
+STAGE_TIMING_ENABLED: bool = True
+STAGE_TIMING_WINDOW_SECONDS: float = 60.0
+
+# When set, a JSON-lines snapshot of the stage histograms is appended to this
+# file every STAGE_TIMING_EXPORT_INTERVAL_SECONDS. None disables the export.
+STAGE_TIMING_EXPORT_PATH: Optional[str] = None
+STAGE_TIMING_EXPORT_INTERVAL_SECONDS: float = 60.0
+
+# Logging (telemetry.logger). DEBUG keeps every teaching line visible; set
+# LOG_DEFAULT_LEVEL to "INFO" in production so per-symbol detail lines are
+# skipped before any string formatting happens.
+LOG_DEFAULT_LEVEL: str = "DEBUG"
+
+# Per-module overrides keyed by logger name; dotted children inherit from their
+# parent, e.g. {"scanner": "INFO", "strategy": "WARN"}.
+LOG_MODULE_LEVELS: Dict[str, str] = {}
+
+# "ASYNC" hands records to a background writer thread through a bounded queue;
+# "SYNC" writes on the calling thread (useful when debugging a crash).
+LOG_SINK: str = "ASYNC"
+LOG_QUEUE_MAXSIZE: int = 100_000
+
+# "TEXT" keeps the teaching-style lines; "JSON" writes one JSON object per line.
+LOG_OUTPUT_FORMAT: str = "TEXT"
+
+# Optional log file; None writes to stdout.
+LOG_FILE_PATH: Optional[str] = None
+
+# Per-cycle deadline budget (core.cycle_budget). A cycle that overruns carries
+# the overrun into the next cycle's budget unless the idle gap before that
+# cycle (e.g. CYCLE_SLEEP_SECONDS) absorbs it. Once CYCLE_DEGRADE_AT_FRACTION
+# of the budget is spent, run_once degrades the optional work that remains:
+# verbose stage dumps are skipped, storage goes to the deferred writer, and
+# the next scan covers only the DEGRADED_SCAN_TOP_N best-ranked candidates.
+# Off by default: the 0.5s deadline is a placeholder, not a measured cycle
+# time. Set it from the "cycle" stage timing p99 before enabling.
+CYCLE_DEADLINE_ENABLED: bool = False
+CYCLE_DEADLINE_SECONDS: float = 0.5
+CYCLE_DEGRADE_AT_FRACTION: float = 0.8
+DEGRADED_SCAN_TOP_N: int = 2
+
+# Sharded scan/pattern execution (core.sharding). When enabled, the scanner
+# universe is split across SCAN_SHARD_WORKERS processes by a stable hash of the
+# symbol; each worker scans and pattern-tags its shard and results are merged
+# back in universe order. A dead worker is replaced and its shards re-run up to
+# SCAN_SHARD_MAX_RETRIES times before falling back to in-process execution.
+SCAN_SHARDING_ENABLED: bool = False
+SCAN_SHARD_WORKERS: int = 4
+SCAN_SHARD_MAX_RETRIES: int = 1
+
+# Cycle capture (core.replay). When set, every run_once cycle appends its
+# inputs (scanner candidates, registry state) and outputs to this gzip JSON
+# lines file so it can be replayed later with `python -m core.replay <path>`.
+CYCLE_RECORD_PATH: Optional[str] = None
+
+# Columnar scanning (scanner.scanner_frame). When enabled, the scan stage
+# returns a NumPy-backed ScannerFrame and patterns are evaluated with
+# vectorized masks. TradeRecord.scanner_output still holds every scanned
+# candidate, materialized lazily from the frame on first read.
+SCANNER_FRAME_ENABLED: bool = False
+
+# Streaming scan (CoreOrchestrator._run_streaming_stages). When enabled,
+# run_once consumes Scanner.iter_scan_cycle and sends each candidate through
+# pattern → strategy → risk as soon as it is yielded, instead of waiting for
+# the whole scan. Execution and storage still run after the stream ends and
+# intents are put back in batch order, so TradeRecords match the batch path.
+# Sharding takes precedence and frame mode is not used while streaming; a
+# degraded (top-N) cycle scans in batch.
+SCAN_STREAMING_ENABLED: bool = False
+
+# Tick store (market_data.tick_store). Each symbol gets preallocated ring
+# buffers for its latest TICK_STORE_CAPACITY_PER_SYMBOL ticks (about 82 bytes
+# per tick, columns are mirrored for zero-copy windows); at most
+# TICK_STORE_MAX_SYMBOLS buffers exist at once. A symbol missing from
+# TICK_STORE_EVICT_AFTER_SCANS consecutive scans has its buffer recycled.
+TICK_STORE_CAPACITY_PER_SYMBOL: int = 2048
+TICK_STORE_MAX_SYMBOLS: int = 500
+TICK_STORE_EVICT_AFTER_SCANS: int = 3
+
+# Bar aggregation (market_data.bar_aggregator). Trade ticks are rolled into
+# OHLCV bars for every timeframe listed here (seconds). Bars are aligned to the
+# start of their session segment (PRE / REGULAR / AFTER) and never span a
+# session boundary. PatternEngine keeps the last PATTERN_BAR_HISTORY closed
+# bars per symbol and timeframe.
+BAR_TIMEFRAMES_SECONDS: Tuple[int, ...] = (10, 60, 300)
+PATTERN_BAR_HISTORY: int = 120
+
+# BarAggregator.advance() runs on the wall clock and closes a bar only this
+# long after its end, so trades stamped inside it that arrive with normal feed
+# latency still land in it. Trades arriving after their bar closed are late.
+BAR_CLOSE_GRACE_SECONDS: float = 0.5
+
+# Technical indicators (market_data.indicators). Every closed bar updates the
+# symbol's EMA / MACD / RSI / ATR / VWAP state in O(1). EMAs are seeded with the
+# SMA of their first `period` inputs; RSI and ATR use Wilder smoothing. VWAP is
+# anchored at the first bar of each trading day (premarket included). The
+# scanner's trend context is read from INDICATOR_TREND_TIMEFRAME_SECONDS bars;
+# ATR above VOLATILITY_RISK_ATR_PERCENT of price raises volatility_risk_flag.
+INDICATOR_EMA_FAST_PERIOD: int = 9
+INDICATOR_EMA_SLOW_PERIOD: int = 20
+INDICATOR_MACD_PERIODS: Tuple[int, int, int] = (12, 26, 9)
+INDICATOR_RSI_PERIOD: int = 14
+INDICATOR_ATR_PERIOD: int = 14
+INDICATOR_TREND_TIMEFRAME_SECONDS: int = 60
+VOLATILITY_RISK_ATR_PERCENT: float = 5.0
+
+# Universe prefilter (scanner.universe_index). When enabled, the scanner
+# resolves these slow-moving criteria with range queries over per-session
+# sorted arrays and only enriches the surviving symbols. Each entry maps an
+# indexed column ("previous_close", "float_millions", "avg_volume") to a
+# (low, high) range with low inclusive and high exclusive; None leaves that
+# side open. The index is rebuilt once per exchange-local trading date.
+SCANNER_PREFILTER_ENABLED: bool = False
+SCANNER_PREFILTER_CRITERIA: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    "previous_close": (1.0, 20.0),
+    "float_millions": (None, 20.0),
+}
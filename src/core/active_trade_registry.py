@@ -26,6 +26,13 @@ class ActiveTradeRegistry:
     def snapshot(self):
         return list(self._active_trades)
 
+    def restore(self, trades):
+        """
+        Replace registry contents with a previous snapshot().
+        Used by cycle replay to start each cycle from its recorded state.
+        """
+        self._active_trades = [dict(t) for t in trades]
+
     def close_all_trades(self):
         """
         Teaching-first lifecycle reset.
@@ -0,0 +1,81 @@
+"""
+Per-cycle deadline budget for the Core Orchestrator.
+
+Phase 5: without a budget, an overrunning cycle just makes the next one late
+and every stage keeps doing its optional work. CycleBudget tracks how much of
+CYCLE_DEADLINE_SECONDS a cycle has spent so the orchestrator can degrade the
+remaining optional work and keep intents flowing.
+
+Rules:
+- An overrun is carried into the next cycle only as far as the idle gap
+  between the cycles did not absorb it: if cycle N ran 200ms late and cycle
+  N+1 starts back-to-back, N+1 gets 200ms less budget (never less than zero);
+  after the runtime's CYCLE_SLEEP_SECONDS pause it gets the full budget.
+- A cycle is "nearly spent" once CYCLE_DEGRADE_AT_FRACTION of its budget has
+  elapsed. Every degradation applied is recorded by name for telemetry.
+"""
+
+import time
+from typing import List
+
+from config.system_config import (
+    CYCLE_DEADLINE_ENABLED,
+    CYCLE_DEADLINE_SECONDS,
+    CYCLE_DEGRADE_AT_FRACTION,
+)
+
+
+class CycleBudget:
+    """Deadline bookkeeping for consecutive orchestrator cycles."""
+
+    def __init__(
+        self,
+        deadline_seconds: float = CYCLE_DEADLINE_SECONDS,
+        degrade_at_fraction: float = CYCLE_DEGRADE_AT_FRACTION,
+        enabled: bool = CYCLE_DEADLINE_ENABLED,
+    ) -> None:
+        self.enabled = enabled
+        self.deadline_ns = int(deadline_seconds * 1_000_000_000)
+        self.degrade_at_fraction = degrade_at_fraction
+        self.carry_over_ns = 0
+        self.degradations: List[str] = []
+        self._started_ns = time.perf_counter_ns()
+        self._finished_ns = self._started_ns
+        self._budget_ns = self.deadline_ns
+
+    def start_cycle(self) -> None:
+        """Open a new cycle, shrinking its budget by whatever overrun the idle gap did not absorb."""
+
+        self._started_ns = time.perf_counter_ns()
+        idle_ns = self._started_ns - self._finished_ns
+        self.carry_over_ns = max(self.carry_over_ns - idle_ns, 0)
+        self._budget_ns = max(self.deadline_ns - self.carry_over_ns, 0)
+        self.degradations = []
+
+    def finish_cycle(self) -> int:
+        """Close the cycle and return its overrun in nanoseconds (0 when on time or disabled)."""
+
+        self._finished_ns = time.perf_counter_ns()
+        if not self.enabled:
+            self.carry_over_ns = 0
+            return 0
+        overrun_ns = max(self._finished_ns - self._started_ns - self._budget_ns, 0)
+        # Capped at one full deadline so a single stall cannot degrade forever.
+        self.carry_over_ns = min(overrun_ns, self.deadline_ns)
+        return overrun_ns
+
+    def elapsed_ns(self) -> int:
+        return time.perf_counter_ns() - self._started_ns
+
+    def remaining_ns(self) -> int:
+        return self._budget_ns - self.elapsed_ns()
+
+    def nearly_spent(self) -> bool:
+        if not self.enabled:
+            return False
+        return self.elapsed_ns() >= self._budget_ns * self.degrade_at_fraction
+
+    def degrade(self, name: str) -> None:
+        """Record that optional work `name` was skipped or deferred this cycle."""
+
+        self.degradations.append(name)
@@ -0,0 +1,291 @@
+"""
+Event-driven runtime for the Core Orchestrator.
+
+Phase 5: asyncio-based alternative to the fixed-sleep polling loop in main.py.
+The orchestrator wakes when a data event arrives (new tick, news item, fill)
+or when the heartbeat timer fires, instead of sleeping a fixed interval. The
+runtime also measures event-to-intent latency so the two loops can be compared.
+
+TICK events carrying quote/trade fields (bid, ask, last, size, flags,
+timestamp_ns) are appended to the orchestrator's TickStore and fed to its
+BarAggregator on the event loop thread as they arrive, so both have a single
+writer. Every wake-up also advances the aggregator's clock, so candles close
+on time even when a symbol stops trading.
+
+With SLEEP_THROUGH_CLOSED_SESSIONS the heartbeat is suspended while the
+session is CLOSED: the runtime waits until the next session opens (or a data
+event arrives) instead of waking every EVENT_TIMER_SECONDS all night.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Deque, Dict, List, Optional
+
+from config.system_config import (
+    EVENT_COALESCE_WINDOW_SECONDS,
+    EVENT_TIMER_SECONDS,
+    SLEEP_THROUGH_CLOSED_SESSIONS,
+)
+from core.session_calendar import CLOSED, get_session_calendar
+from telemetry.logger import get_logger
+
+log = get_logger("orchestrator.event_runtime")
+
+
+class EventType(str, Enum):
+    """Enumerate the data events that may wake the orchestrator."""
+
+    TICK = "TICK"
+    NEWS = "NEWS"
+    FILL = "FILL"
+    TIMER = "TIMER"
+
+
+@dataclass
+class MarketEvent:
+    """One data event delivered to the runtime; stamped on arrival for latency tracking."""
+
+    event_type: EventType
+    symbol: Optional[str] = None
+    payload: Dict = field(default_factory=dict)
+    received_ns: int = field(default_factory=time.perf_counter_ns)
+
+
+class LatencyTracker:
+    """Keep a bounded window of latency samples (milliseconds) and summarise them."""
+
+    def __init__(self, label: str, max_samples: int = 10_000) -> None:
+        self.label = label
+        self._samples_ms: Deque[float] = deque(maxlen=max_samples)
+
+    def record_ns(self, elapsed_ns: int) -> float:
+        elapsed_ms = elapsed_ns / 1_000_000
+        self._samples_ms.append(elapsed_ms)
+        return elapsed_ms
+
+    def summary(self) -> Dict[str, float]:
+        """Return count, p50, p99 and max over the retained samples."""
+
+        if not self._samples_ms:
+            return {"count": 0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self._samples_ms)
+        last = len(ordered) - 1
+        return {
+            "count": len(ordered),
+            "p50_ms": ordered[int(last * 0.50)],
+            "p99_ms": ordered[int(last * 0.99)],
+            "max_ms": ordered[last],
+        }
+
+    def format_summary(self) -> str:
+        stats = self.summary()
+        return (
+            f"[LATENCY] {self.label}: samples={stats['count']} "
+            f"p50={stats['p50_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms max={stats['max_ms']:.2f}ms"
+        )
+
+
+class EventDrivenRuntime:
+    """
+    Wake the orchestrator on data events rather than on a fixed sleep.
+
+    Events are published from any thread (feed callbacks, broker fills) and
+    queued on the asyncio loop. A burst of events arriving within the coalesce
+    window is folded into a single cycle. When nothing arrives for
+    ``timer_seconds`` a TIMER event is synthesised so session checks and
+    lifecycle work still happen. Cycles always run on one dedicated worker
+    thread, so the orchestrator never executes two cycles concurrently.
+    """
+
+    def __init__(
+        self,
+        orchestrator,
+        cycle_gate: Optional[Callable[[], bool]] = None,
+        timer_seconds: float = EVENT_TIMER_SECONDS,
+        coalesce_window_seconds: float = EVENT_COALESCE_WINDOW_SECONDS,
+        sleep_through_closed: bool = SLEEP_THROUGH_CLOSED_SESSIONS,
+    ) -> None:
+        log.info("[BOOT] EventDrivenRuntime instantiated — orchestrator wakes on data events")
+        self.orchestrator = orchestrator
+        self.cycle_gate = cycle_gate or (lambda: True)
+        self.timer_seconds = timer_seconds
+        self.coalesce_window_seconds = coalesce_window_seconds
+        self.sleep_through_closed = sleep_through_closed
+        self._closed_sleep_logged = False
+        self.latency = LatencyTracker("event-to-intent (event-driven)")
+        self.cycles_run = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: List[MarketEvent] = []
+        self._pending_lock = threading.Lock()  # publish() vs. run() start-up
+        self._stop_requested = False
+        self._cycle_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="orchestrator-cycle")
+
+    # ----------------------------
+    # Event publishing (thread-safe)
+    # ----------------------------
+
+    def publish(self, event: MarketEvent) -> None:
+        """Queue an event for the runtime; safe to call from any thread."""
+
+        with self._pending_lock:
+            if self._loop is None or self._queue is None:
+                self._pending.append(event)
+                return
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+
+    def publish_tick(self, symbol: str, **payload) -> None:
+        self.publish(MarketEvent(EventType.TICK, symbol=symbol, payload=payload))
+
+    def publish_news(self, symbol: str, **payload) -> None:
+        self.publish(MarketEvent(EventType.NEWS, symbol=symbol, payload=payload))
+
+    def publish_fill(self, symbol: str, **payload) -> None:
+        self.publish(MarketEvent(EventType.FILL, symbol=symbol, payload=payload))
+
+    def stop(self) -> None:
+        """Ask the runtime to exit after the current cycle; safe to call from any thread."""
+
+        self._stop_requested = True
+        if self._loop is not None and self._queue is not None:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+
+    # ----------------------------
+    # Main loop
+    # ----------------------------
+
+    async def run(self, max_cycles: Optional[int] = None) -> None:
+        """Run cycles on events until stop() is called or max_cycles is reached."""
+
+        with self._pending_lock:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue()
+            for event in self._pending:
+                self._queue.put_nowait(event)
+            self._pending.clear()
+        log.info(
+            "[LOOP] Event-driven loop running (timer=%ss, coalesce=%.0fms).",
+            self.timer_seconds,
+            self.coalesce_window_seconds * 1000,
+        )
+
+        try:
+            while not self._stop_requested:
+                batch = await self._next_batch()
+                if not batch:
+                    break
+                self._store_ticks(batch)
+                self._describe_wake(batch)
+                if not self.cycle_gate():
+                    continue
+                trade_record = await self._loop.run_in_executor(
+                    self._cycle_executor, self.orchestrator.run_once
+                )
+                self.cycles_run += 1
+                self._record_event_to_intent(batch, trade_record)
+                if max_cycles is not None and self.cycles_run >= max_cycles:
+                    break
+        finally:
+            self._cycle_executor.shutdown(wait=True)
+            log.info(self.latency.format_summary())
+
+    async def _next_batch(self) -> List[MarketEvent]:
+        """Wait for the next event (or the heartbeat timer), then drain the coalesce window."""
+
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout=self._heartbeat_timeout())
+        except asyncio.TimeoutError:
+            first = MarketEvent(EventType.TIMER)
+        if first is None:
+            return []
+
+        batch = [first]
+        if first.event_type != EventType.TIMER and self.coalesce_window_seconds > 0:
+            await asyncio.sleep(self.coalesce_window_seconds)
+        while not self._queue.empty():
+            event = self._queue.get_nowait()
+            if event is None:
+                self._stop_requested = True
+                continue
+            batch.append(event)
+        return batch
+
+    def _heartbeat_timeout(self) -> float:
+        """Heartbeat interval, or the time left until the next session while CLOSED."""
+
+        if not self.sleep_through_closed:
+            return self.timer_seconds
+        calendar = get_session_calendar()
+        if calendar.session_at() != CLOSED:
+            self._closed_sleep_logged = False
+            return self.timer_seconds
+        transition_at, next_session = calendar.next_transition()
+        seconds = calendar.seconds_until_next_transition()
+        if not self._closed_sleep_logged:
+            # Data events can still wake the loop at night; log the sleep once.
+            log.info(
+                "[SLEEP] Market CLOSED — heartbeat paused for %.0f seconds until %s (%s).",
+                seconds,
+                transition_at.strftime("%Y-%m-%d %H:%M %Z"),
+                next_session,
+            )
+            self._closed_sleep_logged = True
+        return seconds
+
+    def _store_ticks(self, batch: List[MarketEvent]) -> None:
+        tick_store = getattr(self.orchestrator, "tick_store", None)
+        bar_aggregator = getattr(self.orchestrator, "bar_aggregator", None)
+        if tick_store is None and bar_aggregator is None:
+            return
+        for event in batch:
+            if event.event_type != EventType.TICK or event.symbol is None:
+                continue
+            payload = event.payload
+            if not any(key in payload for key in ("bid", "ask", "last")):
+                continue
+            timestamp_ns = payload.get("timestamp_ns") or time.time_ns()
+            last = payload.get("last", float("nan"))
+            size = payload.get("size", 0.0)
+            flags = payload.get("flags", 0)
+            if tick_store is not None:
+                tick_store.append(
+                    event.symbol,
+                    timestamp_ns,
+                    bid=payload.get("bid", float("nan")),
+                    ask=payload.get("ask", float("nan")),
+                    last=last,
+                    size=size,
+                    flags=flags,
+                )
+            if bar_aggregator is not None:
+                bar_aggregator.on_tick(event.symbol, timestamp_ns, last, size, flags)
+        if bar_aggregator is not None:
+            bar_aggregator.advance(time.time_ns())
+
+    def _describe_wake(self, batch: List[MarketEvent]) -> None:
+        counts: Dict[str, int] = {}
+        for event in batch:
+            counts[event.event_type.value] = counts.get(event.event_type.value, 0) + 1
+        summary = ", ".join(f"{name}={count}" for name, count in sorted(counts.items()))
+        log.info("[CYCLE] Woken by %s event(s): %s", len(batch), summary)
+
+    def _record_event_to_intent(self, batch: List[MarketEvent], trade_record) -> None:
+        """Record latency from the oldest data event in the batch to the intents it produced."""
+
+        intents = getattr(trade_record, "strategy_output", None) or []
+        data_events = [event for event in batch if event.event_type != EventType.TIMER]
+        if not intents or not data_events:
+            return
+        oldest_ns = min(event.received_ns for event in data_events)
+        elapsed_ms = self.latency.record_ns(time.perf_counter_ns() - oldest_ns)
+        log.info(
+            "[LATENCY] event-to-intent %.2fms (trigger=%s, intents=%s)",
+            elapsed_ms,
+            data_events[0].event_type.value,
+            len(intents),
+        )
@@ -4,122 +4,425 @@ Core Orchestrator for PHASE 3 — Skeleton System (Teaching-First).
 This file only outlines the conceptual flow of the trading system and contains
 no real trading logic, integrations, or data handling. It exists solely to make
 the system stages and their order easy to follow during this teaching phase.
+
+Each stage lives in its own `_run_*_stage` method. `run_once` calls them in
+teaching order; `core.pipeline.OrchestratorPipeline` drives the same methods
+from per-stage workers so consecutive cycles can overlap. Every stage is timed
+into `self.stage_timing` (rolling p50/p90/p99/max histograms).
+
+`run_once` also runs against a CycleBudget (CYCLE_DEADLINE_SECONDS). When the
+budget is nearly spent, optional work is degraded — top-N scan, no verbose
+stage dumps, deferred storage — and each degradation is recorded on the
+TradeRecord and in the stage timing counters.
+
+With SCAN_SHARDING_ENABLED, scan + pattern run together across worker
+processes (core.sharding) and the merged results feed the usual single
+strategy → risk → execution path. An injected Scanner subclass cannot be
+rebuilt in the workers, so sharding is skipped (with a warning) for it. With
+SCANNER_FRAME_ENABLED the scan stage hands a columnar ScannerFrame to
+PatternEngine.evaluate_frame instead.
+
+With SCAN_STREAMING_ENABLED, `run_once` pulls candidates from
+Scanner.iter_scan_cycle and runs pattern → strategy → risk on each one as it
+arrives, so an early hot symbol reaches the risk engine without waiting for
+the rest of the scan. Every run_once cycle records "time_to_first_intent"
+(cycle start → first intent handed to risk) in either mode.
+
+`self.tick_store` (market_data.tick_store) holds recent ticks per symbol; the
+event-driven runtime fills it and every run_once scan tells it which symbols
+are still being scanned so buffers of departed symbols get recycled.
+`self.bar_aggregator` turns the same ticks into 10s/1m/5m candles and
+publishes each closed bar to PatternEngine.on_bar_close and to
+`self.indicator_engine` (EMA / MACD / RSI / ATR / VWAP per symbol).
+
+Collaborators can be injected (scanner, registry, budget, recorder) so the
+replay harness in core.replay can drive recorded cycles through this class.
 """
 
+import time
+
+from config.system_config import (
+    CYCLE_RECORD_PATH,
+    DEGRADED_SCAN_TOP_N,
+    SCAN_SHARDING_ENABLED,
+    SCAN_STREAMING_ENABLED,
+    SCANNER_FRAME_ENABLED,
+)
 from core.active_trade_registry import ActiveTradeRegistry
+from core.cycle_budget import CycleBudget
+from core.replay import CycleRecorder
+from core.sharding import ShardedScanPatternRunner
 from execution.execution_engine import ExecutionEngine
+from market_data.bar_aggregator import BarAggregator
+from market_data.indicators import IndicatorEngine
+from market_data.tick_store import TickStore
 from patterns.pattern_engine import PatternEngine
 from risk.risk_engine import RiskEngine
 from scanner.scanner import Scanner
+from scanner.scanner_frame import ScannerFrame
 from models.data_models import ExecutionResult, RiskDecision, TradeIntent, TradeRecord
-from storage.storage_engine import StorageEngine
+from storage.storage_engine import DeferredStorageWriter, StorageEngine
 from strategy.strategy_runner import StrategyRunner
-from typing import List
+from telemetry.logger import get_logger
+from telemetry.stage_timing import StageTimingRecorder
+from typing import List, Optional, Tuple
+
+log = get_logger("orchestrator")
+
+
+_UNSET = object()
 
 
 class CoreOrchestrator:
-    def __init__(self):
-        print("[INFO] Core Orchestrator initialised.")
-        self.trade_registry = ActiveTradeRegistry()
-        self.scanner = Scanner()
+    def __init__(
+        self,
+        scanner: Optional[Scanner] = None,
+        trade_registry: Optional[ActiveTradeRegistry] = None,
+        cycle_budget: Optional[CycleBudget] = None,
+        sharding_enabled: bool = SCAN_SHARDING_ENABLED,
+        scanner_frame_enabled: bool = SCANNER_FRAME_ENABLED,
+        streaming_enabled: bool = SCAN_STREAMING_ENABLED,
+        cycle_recorder=_UNSET,
+    ):
+        log.info("[INFO] Core Orchestrator initialised.")
+        self.trade_registry = trade_registry if trade_registry is not None else ActiveTradeRegistry()
+        self.scanner = scanner if scanner is not None else Scanner()
         self.pattern_engine = PatternEngine()
         self.strategy_runner = StrategyRunner()
         self.risk_engine = RiskEngine(trade_registry=self.trade_registry)
         self.execution_engine = ExecutionEngine(trade_registry=self.trade_registry)
         self.storage_engine = StorageEngine()
+        self.tick_store = TickStore()
+        self.bar_aggregator = BarAggregator()
+        self.indicator_engine = IndicatorEngine()
+        self.bar_aggregator.subscribe(self.pattern_engine.on_bar_close)
+        self.bar_aggregator.subscribe(self.indicator_engine.on_bar_close)
+        self.stage_timing = StageTimingRecorder()
+        self.cycle_budget = cycle_budget if cycle_budget is not None else CycleBudget()
+        self.scanner_frame_enabled = scanner_frame_enabled
+        self.streaming_enabled = streaming_enabled
+        # Set by run_once; the pipelined driver does not track first-intent latency.
+        self._cycle_started_ns: Optional[int] = None
+        self.deferred_storage = DeferredStorageWriter(self.storage_engine)
+        self.sharded_runner: Optional[ShardedScanPatternRunner] = None
+        if sharding_enabled:
+            if ShardedScanPatternRunner.can_rebuild(self.scanner):
+                self.sharded_runner = ShardedScanPatternRunner(self.scanner, self.pattern_engine)
+            else:
+                # Workers would scan with a default Scanner and silently diverge.
+                log.warn(
+                    "[SHARD] Sharding disabled — %s cannot be rebuilt in worker processes; scanning in-process.",
+                    type(self.scanner).__name__,
+                )
+        if cycle_recorder is _UNSET:
+            cycle_recorder = CycleRecorder(CYCLE_RECORD_PATH) if CYCLE_RECORD_PATH else None
+        self.cycle_recorder: Optional[CycleRecorder] = cycle_recorder
 
     def run_once(self):
-        """Run a single conceptual system cycle in teaching order."""
-        print("[INFO] Starting orchestrator cycle (teaching-only).")
+        """
+        Run a single conceptual system cycle in teaching order.
 
-        print("[TEACH] >>> Scanner stage — gather candidates (conceptual).")
-        scanner_results = self.scanner.run_scan_cycle()
+        Returns the cycle's TradeRecord so callers (runtime loops, latency
+        tracking) can inspect what the cycle produced.
+        """
+        log.info("[INFO] Starting orchestrator cycle (teaching-only).")
+
+        registry_before = self.trade_registry.snapshot() if self.cycle_recorder is not None else None
+        budget = self.cycle_budget
+        budget.start_cycle()
+        self._cycle_started_ns = time.perf_counter_ns()
+        with self.stage_timing.stage("cycle"):
+            if (
+                self.streaming_enabled
+                and self.sharded_runner is None
+                and not self._degrade(budget, "scan_top_n")
+            ):
+                scanner_results, pattern_results, strategy_output, risk_output = self._run_streaming_stages(
+                    budget
+                )
+            else:
+                if self.sharded_runner is not None:
+                    scanner_results, pattern_results = self._run_sharded_scan_pattern_stage(budget)
+                else:
+                    scanner_results = self._run_scan_stage(budget)
+                    pattern_results = self._run_pattern_stage(scanner_results, budget)
+                strategy_output = self._run_strategy_stage(pattern_results, budget)
+                risk_output = self._run_risk_stage(strategy_output, budget)
+            self._retain_tick_buffers(scanner_results)
+            execution_output = self._run_execution_stage(risk_output, budget)
+            trade_record = self._run_storage_stage(
+                scanner_results, pattern_results, strategy_output, risk_output, execution_output, budget
+            )
+        overrun_ns = budget.finish_cycle()
+        if overrun_ns:
+            self.stage_timing.increment("cycle_overrun")
+            log.warn(
+                "[BUDGET] Cycle overran its deadline by %.2fms — carried over unless idle time absorbs it.",
+                overrun_ns / 1_000_000,
+            )
+        if trade_record.degradations:
+            self.stage_timing.increment("degraded_cycles")
+        self._cycle_started_ns = None
+        if self.cycle_recorder is not None:
+            self.cycle_recorder.record(registry_before, trade_record, self.trade_registry.snapshot())
+        self._print_cycle_summary(trade_record)
+        self.stage_timing.maybe_export()
+
+        log.info("[INFO] Orchestrator cycle complete (teaching-only).")
+        return trade_record
+
+    # ----------------------------
+    # Stages
+    # ----------------------------
+
+    def _degrade(self, budget: Optional[CycleBudget], name: str) -> bool:
+        """Return True (and record `name` once per cycle) when the budget is nearly spent."""
+
+        if budget is None or not budget.nearly_spent():
+            return False
+        if name not in budget.degradations:
+            budget.degrade(name)
+            self.stage_timing.increment(f"degraded.{name}")
+            log.warn(
+                "[BUDGET] Cycle budget nearly spent (%.2fms left) — degrading: %s",
+                budget.remaining_ns() / 1_000_000,
+                name,
+            )
+        return True
+
+    def _run_scan_stage(self, budget: Optional[CycleBudget] = None) -> List:
+        log.debug("[TEACH] >>> Scanner stage — gather candidates (conceptual).")
+        # Only an overrun carried from the previous cycle can exhaust the budget
+        # this early, so a degraded scan means "catch up first".
+        max_candidates = DEGRADED_SCAN_TOP_N if self._degrade(budget, "scan_top_n") else None
+        with self.stage_timing.stage("scan"):
+            if self.scanner_frame_enabled:
+                scanner_results = self.scanner.run_scan_frame(max_candidates=max_candidates)
+            else:
+                scanner_results = self.scanner.run_scan_cycle(max_candidates=max_candidates)
         if not scanner_results:
-            print("[SCAN] Scanner returned no candidates — placeholder outcome.")
-        else:
-            print(f"[SCAN] Scanner produced candidates: {scanner_results}")
-        print("[TEACH] <<< Scanner stage complete — moving to pattern stage.")
+            log.info("[SCAN] Scanner returned no candidates — placeholder outcome.")
+        elif not self._degrade(budget, "stage_dumps"):
+            log.debug("[SCAN] Scanner produced candidates: %s", scanner_results)
+        log.debug("[TEACH] <<< Scanner stage complete — moving to pattern stage.")
+        return scanner_results or []
+
+    def _run_sharded_scan_pattern_stage(self, budget: Optional[CycleBudget] = None):
+        log.debug("[TEACH] >>> Sharded scan + pattern stage — one worker process per shard.")
+        max_candidates = DEGRADED_SCAN_TOP_N if self._degrade(budget, "scan_top_n") else None
+        with self.stage_timing.stage("scan_pattern_sharded"):
+            scanner_results, pattern_results = self.sharded_runner.run(max_candidates=max_candidates)
+        log.info(
+            "[SHARD] Merged %s candidate(s) and %s pattern(s) from shards.",
+            len(scanner_results),
+            len(pattern_results),
+        )
+        log.debug("[TEACH] <<< Sharded scan + pattern stage complete — moving to strategy stage.")
+        return scanner_results, pattern_results
 
-        print("[TEACH] >>> Pattern stage — evaluate shapes/behaviors (conceptual).")
-        pattern_results = self.pattern_engine.evaluate_patterns(scanner_results or [])
+    def _run_pattern_stage(self, scanner_results: List, budget: Optional[CycleBudget] = None) -> List:
+        log.debug("[TEACH] >>> Pattern stage — evaluate shapes/behaviors (conceptual).")
+        with self.stage_timing.stage("patterns"):
+            if isinstance(scanner_results, ScannerFrame):
+                pattern_results = self.pattern_engine.evaluate_frame(scanner_results)
+            else:
+                pattern_results = self.pattern_engine.evaluate_patterns(scanner_results or [])
         if not pattern_results:
-            print("[PATTERN] No patterns detected — placeholder outcome.")
-        else:
-            print(f"[PATTERN] Patterns evaluated: {pattern_results}")
-        print("[TEACH] <<< Pattern stage complete — moving to strategy stage.")
+            log.info("[PATTERN] No patterns detected — placeholder outcome.")
+        elif not self._degrade(budget, "stage_dumps"):
+            log.debug("[PATTERN] Patterns evaluated: %s", pattern_results)
+        log.debug("[TEACH] <<< Pattern stage complete — moving to strategy stage.")
+        return pattern_results or []
 
-        print("[TEACH] >>> Strategy stage — decide on trade ideas (conceptual).")
-        strategy_output = self.strategy_runner.generate_trade_intent(pattern_results or [])
+    def _run_strategy_stage(
+        self, pattern_results: List, budget: Optional[CycleBudget] = None
+    ) -> List[TradeIntent]:
+        log.debug("[TEACH] >>> Strategy stage — decide on trade ideas (conceptual).")
+        with self.stage_timing.stage("strategies"):
+            strategy_output = self.strategy_runner.generate_trade_intent(pattern_results or [])
         if not strategy_output:
-            print("[STRATEGY] No trade intents generated — placeholder outcome.")
-        else:
-            print(f"[STRATEGY] Trade intents generated: {strategy_output}")
-        print("[TEACH] <<< Strategy stage complete — moving to risk stage.")
+            log.info("[STRATEGY] No trade intents generated — placeholder outcome.")
+        elif not self._degrade(budget, "stage_dumps"):
+            log.debug("[STRATEGY] Trade intents generated: %s", strategy_output)
+        log.debug("[TEACH] <<< Strategy stage complete — moving to risk stage.")
+        return strategy_output or []
 
-        print("[TEACH] >>> Risk stage — check sizing and limits (conceptual).")
+    def _run_risk_stage(
+        self, strategy_output: List[TradeIntent], budget: Optional[CycleBudget] = None
+    ) -> List[RiskDecision]:
+        log.debug("[TEACH] >>> Risk stage — check sizing and limits (conceptual).")
         risk_output: List[RiskDecision] = []
         if not strategy_output:
-            print("[RISK] No risk decision produced — placeholder outcome.")
+            log.info("[RISK] No risk decision produced — placeholder outcome.")
         else:
-            print(
-                f"[TEACH] Risk engine will evaluate {len(strategy_output)} trade intents individually."
+            log.debug(
+                "[TEACH] Risk engine will evaluate %s trade intents individually.", len(strategy_output)
             )
             for trade_intent in strategy_output:
-                print(
-                    f"[TEACH] Evaluating risk for symbol: {trade_intent.symbol} "
-                    f"(trader_type={trade_intent.trader_type})"
-                )
-                decision = self.risk_engine.evaluate_trade_intent(trade_intent)
-                decision.trader_type = getattr(trade_intent, "trader_type", "MANUAL")
-                risk_output.append(decision)
+                risk_output.append(self._evaluate_intent_risk(trade_intent))
             if not risk_output:
-                print("[RISK] No risk decision produced — placeholder outcome.")
-            else:
-                print(f"[RISK] Risk decision produced: {risk_output}")
-        print("[TEACH] <<< Risk stage complete — moving to execution stage.")
+                log.info("[RISK] No risk decision produced — placeholder outcome.")
+            elif not self._degrade(budget, "stage_dumps"):
+                log.debug("[RISK] Risk decision produced: %s", risk_output)
+        log.debug("[TEACH] <<< Risk stage complete — moving to execution stage.")
+        return risk_output
+
+    def _evaluate_intent_risk(self, trade_intent: TradeIntent) -> RiskDecision:
+        log.debug(
+            "[TEACH] Evaluating risk for symbol: %s (trader_type=%s)",
+            trade_intent.symbol,
+            trade_intent.trader_type,
+        )
+        if self._cycle_started_ns is not None:
+            self.stage_timing.record_ns("time_to_first_intent", time.perf_counter_ns() - self._cycle_started_ns)
+            self._cycle_started_ns = None
+        with self.stage_timing.stage("risk_per_intent"):
+            decision = self.risk_engine.evaluate_trade_intent(trade_intent)
+        decision.trader_type = getattr(trade_intent, "trader_type", "MANUAL")
+        return decision
+
+    def _run_streaming_stages(
+        self, budget: Optional[CycleBudget] = None
+    ) -> Tuple[List, List, List[TradeIntent], List[RiskDecision]]:
+        """
+        Scan → pattern → strategy → risk, one candidate at a time as the scanner yields.
+
+        Risk decisions only read the registry (execution writes it after the
+        stream), so evaluating them early changes nothing. Intents and
+        decisions are returned in batch order (strategy, then candidate) so
+        execution and the TradeRecord are the same as in batch mode.
+        """
 
-        print("[TEACH] >>> Execution stage — send/prepare orders (conceptual).")
+        log.debug("[TEACH] >>> Streaming stages — each candidate flows to risk as soon as it is scanned.")
+        scanner_results: List = []
+        pattern_results: List = []
+        streamed: List = []  # (strategy position, candidate position, intent, decision)
+        strategy_position = {strategy.name: index for index, strategy in enumerate(self.strategy_runner.strategies)}
+
+        with self.stage_timing.stage("scan_stream"):
+            for candidate_position, candidate in enumerate(self.scanner.iter_scan_cycle()):
+                scanner_results.append(candidate)
+                with self.stage_timing.stage("pattern_per_candidate"):
+                    patterns = self.pattern_engine.evaluate_patterns([candidate])
+                if not patterns:
+                    continue
+                pattern_results.extend(patterns)
+                with self.stage_timing.stage("strategy_per_candidate"):
+                    intents = self.strategy_runner.generate_trade_intents(patterns)
+                for trade_intent in intents:
+                    decision = self._evaluate_intent_risk(trade_intent)
+                    streamed.append(
+                        (strategy_position.get(trade_intent.strategy_name, 0), candidate_position, trade_intent, decision)
+                    )
+
+        streamed.sort(key=lambda entry: (entry[0], entry[1]))
+        strategy_output = [entry[2] for entry in streamed]
+        risk_output = [entry[3] for entry in streamed]
+        log.info(
+            "[STREAM] %s candidate(s) → %s pattern(s) → %s intent(s) evaluated by risk while scanning.",
+            len(scanner_results),
+            len(pattern_results),
+            len(risk_output),
+        )
+        if risk_output and not self._degrade(budget, "stage_dumps"):
+            log.debug("[RISK] Risk decision produced: %s", risk_output)
+        log.debug("[TEACH] <<< Streaming stages complete — moving to execution stage.")
+        return scanner_results, pattern_results, strategy_output, risk_output
+
+    def _run_execution_stage(
+        self, risk_output: List[RiskDecision], budget: Optional[CycleBudget] = None
+    ) -> List[ExecutionResult]:
+        log.debug("[TEACH] >>> Execution stage — send/prepare orders (conceptual).")
         execution_output: List[ExecutionResult] = []
         if not risk_output:
-            print("[EXECUTION] No execution result — placeholder outcome.")
+            log.info("[EXECUTION] No execution result — placeholder outcome.")
         else:
-            print(f"[TEACH] Execution engine will handle {len(risk_output)} risk decisions individually.")
+            log.debug("[TEACH] Execution engine will handle %s risk decisions individually.", len(risk_output))
             for risk_decision in risk_output:
-                print(
-                    f"[TEACH] Routing execution for symbol: {risk_decision.symbol} "
-                    f"(trader_type={risk_decision.trader_type})"
+                log.debug(
+                    "[TEACH] Routing execution for symbol: %s (trader_type=%s)",
+                    risk_decision.symbol,
+                    risk_decision.trader_type,
                 )
-                execution_output.append(self.execution_engine.execute_trade(risk_decision))
+                with self.stage_timing.stage("execution_per_decision"):
+                    execution_output.append(self.execution_engine.execute_trade(risk_decision))
             if not execution_output:
-                print("[EXECUTION] No execution results captured — placeholder outcome.")
-            else:
-                print(f"[EXECUTION] Execution results: {execution_output}")
-        print("[TEACH] <<< Execution stage complete — moving to storage stage.")
+                log.info("[EXECUTION] No execution results captured — placeholder outcome.")
+            elif not self._degrade(budget, "stage_dumps"):
+                log.debug("[EXECUTION] Execution results: %s", execution_output)
+        log.debug("[TEACH] <<< Execution stage complete — moving to storage stage.")
+        return execution_output
 
-        print("[TEACH] >>> Storage stage — record decisions/results (conceptual).")
-        print("[TEACH] Creating TradeRecord to capture stage outputs for review.")
+    def _run_storage_stage(
+        self,
+        scanner_results: List,
+        pattern_results: List,
+        strategy_output: List[TradeIntent],
+        risk_output: List[RiskDecision],
+        execution_output: List[ExecutionResult],
+        budget: Optional[CycleBudget] = None,
+    ) -> TradeRecord:
+        log.debug("[TEACH] >>> Storage stage — record decisions/results (conceptual).")
+        defer_storage = self._degrade(budget, "storage_deferred")
+        log.debug("[TEACH] Creating TradeRecord to capture stage outputs for review.")
         trade_record = TradeRecord(
-            scanner_output=scanner_results or [],
+            scanner_output=self._materialize_scanner_output(scanner_results),
             pattern_output=pattern_results or [],
             strategy_output=strategy_output or [],
             risk_output=risk_output or [],
             execution_output=execution_output or [],
+            degradations=list(budget.degradations) if budget is not None else [],
         )
-        print("[TEACH] TradeRecord encapsulates the journey for teaching purposes.")
-        storage_result = self.storage_engine.store_trade_record(trade_record)
+        log.debug("[TEACH] TradeRecord encapsulates the journey for teaching purposes.")
+        if defer_storage:
+            self.deferred_storage.submit(trade_record)
+            log.info("[STORAGE] Storage handed to the deferred writer — cycle budget nearly spent.")
+            log.debug("[TEACH] <<< Storage stage complete (deferred).")
+            return trade_record
+        with self.stage_timing.stage("storage"):
+            storage_result = self.storage_engine.store_trade_record(trade_record)
         if storage_result is None:
-            print("[STORAGE] No storage action taken — placeholder outcome.")
+            log.info("[STORAGE] No storage action taken — placeholder outcome.")
         else:
-            print(f"[STORAGE] Storage result: {storage_result}")
-        print("[TEACH] <<< Storage stage complete.")
-
-        print(
-            "[SUMMARY] "
-            f"scanner={len(scanner_results or [])} | "
-            f"patterns={len(pattern_results or [])} | "
-            f"trade_intents={len(strategy_output or [])} | "
-            f"risk_decisions={len(risk_output or [])} | "
-            f"execution_results={len(execution_output or [])}"
+            log.debug("[STORAGE] Storage result: %s", storage_result)
+        log.debug("[TEACH] <<< Storage stage complete.")
+        return trade_record
+
+    def _retain_tick_buffers(self, scanner_results) -> None:
+        if isinstance(scanner_results, ScannerFrame):
+            symbols = scanner_results.symbols.tolist()
+        else:
+            symbols = [candidate.symbol for candidate in scanner_results or []]
+        evicted = self.tick_store.retain(symbols)
+        if evicted:
+            self.pattern_engine.forget_symbols(evicted)
+            self.indicator_engine.forget_symbols(evicted)
+
+    @staticmethod
+    def _materialize_scanner_output(scanner_results) -> List:
+        """Every scanned candidate; a ScannerFrame is wrapped so rows are built only when read."""
+
+        if not isinstance(scanner_results, ScannerFrame):
+            return scanner_results or []
+        return scanner_results.lazy_candidates()
+
+    def _print_cycle_summary(self, trade_record: TradeRecord) -> None:
+        log.info(
+            "[SUMMARY] scanner=%s | patterns=%s | trade_intents=%s | risk_decisions=%s | execution_results=%s",
+            len(trade_record.scanner_output),
+            len(trade_record.pattern_output),
+            len(trade_record.strategy_output),
+            len(trade_record.risk_output),
+            len(trade_record.execution_output),
         )
+        if trade_record.degradations:
+            log.info("[SUMMARY] degraded=%s", ",".join(trade_record.degradations))
+
+    def shutdown(self) -> None:
+        """Release background resources (deferred storage, shard workers, cycle recorder)."""
 
-        print("[INFO] Orchestrator cycle complete (teaching-only).")
+        self.deferred_storage.close()
+        if self.sharded_runner is not None:
+            self.sharded_runner.shutdown()
+        if self.cycle_recorder is not None:
+            self.cycle_recorder.close()
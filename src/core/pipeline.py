@@ -0,0 +1,201 @@
+"""
+Pipelined stage execution for the Core Orchestrator.
+
+Phase 5: instead of running scanner → pattern → strategy → risk → execution →
+storage strictly one after another, each stage runs as its own worker thread
+connected to the next by a bounded queue. Scan N+1 can therefore overlap with
+risk/execution of cycle N and storage of cycle N-1.
+
+Guarantees:
+- Backpressure: queues are bounded, so a slow stage (e.g. storage) blocks the
+  stages feeding it instead of letting work pile up without limit.
+- Deterministic ordering: every stage has exactly one worker that processes
+  cycles in FIFO order, so per-symbol ordering matches the sequential loop.
+- Registry safety: risk and execution share a single "decision" worker, so a
+  cycle's risk checks and trade registrations against ActiveTradeRegistry are
+  never interleaved with another cycle's.
+- Shared counters: any stage worker can fail a cycle, so the completed/failed
+  counters are updated under a lock (stage timing has its own).
+- Same side effects as run_once: the decision worker evicts tick buffers of
+  symbols that left the scan and snapshots the registry around the cycle, so
+  the storage worker can hand it to the cycle recorder for replay.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from config.system_config import PIPELINE_QUEUE_MAXSIZE
+from models.data_models import TradeRecord
+from telemetry.logger import get_logger
+
+log = get_logger("orchestrator.pipeline")
+
+# Sentinel placed on a queue to tell the downstream worker to shut down.
+_STOP = object()
+
+
+@dataclass
+class CycleWork:
+    """Work item carried between pipeline stages for one cycle."""
+
+    cycle_id: int
+    submitted_ns: int = field(default_factory=time.perf_counter_ns)
+    scanner_results: List = field(default_factory=list)
+    pattern_results: List = field(default_factory=list)
+    strategy_output: List = field(default_factory=list)
+    risk_output: List = field(default_factory=list)
+    execution_output: List = field(default_factory=list)
+    trade_record: Optional[TradeRecord] = None
+    # ActiveTradeRegistry snapshots for the cycle recorder (None when not recording)
+    registry_before: Optional[List[Dict]] = None
+    registry_after: Optional[List[Dict]] = None
+
+
+class OrchestratorPipeline:
+    """Run the orchestrator's stages as workers connected by bounded queues."""
+
+    def __init__(
+        self,
+        orchestrator,
+        queue_maxsize: int = PIPELINE_QUEUE_MAXSIZE,
+        on_cycle_complete: Optional[Callable[[CycleWork], None]] = None,
+    ) -> None:
+        log.info("[BOOT] OrchestratorPipeline instantiated — bounded queues of size %s", queue_maxsize)
+        self.orchestrator = orchestrator
+        self.on_cycle_complete = on_cycle_complete
+        self._scan_queue: queue.Queue = queue.Queue(maxsize=queue_maxsize)
+        self._pattern_queue: queue.Queue = queue.Queue(maxsize=queue_maxsize)
+        self._strategy_queue: queue.Queue = queue.Queue(maxsize=queue_maxsize)
+        self._decision_queue: queue.Queue = queue.Queue(maxsize=queue_maxsize)
+        self._storage_queue: queue.Queue = queue.Queue(maxsize=queue_maxsize)
+        self._next_cycle_id = 1
+        self._workers: List[threading.Thread] = []
+        self._counter_lock = threading.Lock()
+        self.cycles_completed = 0
+        self.cycles_failed = 0
+
+    # ----------------------------
+    # Lifecycle
+    # ----------------------------
+
+    def start(self) -> None:
+        stages = [
+            ("scan", self._scan_queue, self._pattern_queue, self._scan_step),
+            ("pattern", self._pattern_queue, self._strategy_queue, self._pattern_step),
+            ("strategy", self._strategy_queue, self._decision_queue, self._strategy_step),
+            ("decision", self._decision_queue, self._storage_queue, self._decision_step),
+            ("storage", self._storage_queue, None, self._storage_step),
+        ]
+        for name, inbox, outbox, step in stages:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(name, inbox, outbox, step),
+                name=f"pipeline-{name}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+        log.info("[LOOP] Pipeline workers started: scan → pattern → strategy → decision(risk+execution) → storage.")
+
+    def submit_cycle(self) -> int:
+        """Queue a new cycle for the scan worker; blocks while the scan queue is full."""
+
+        cycle_id = self._next_cycle_id
+        self._next_cycle_id += 1
+        self._scan_queue.put(CycleWork(cycle_id=cycle_id))
+        log.info("[CYCLE] Pipeline cycle %s submitted.", cycle_id)
+        return cycle_id
+
+    def stop(self) -> None:
+        """Drain in-flight cycles, then stop every worker in stage order."""
+
+        self._scan_queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+        self._workers.clear()
+        log.info(
+            "[SHUTDOWN] Pipeline stopped — completed=%s failed=%s", self.cycles_completed, self.cycles_failed
+        )
+
+    # ----------------------------
+    # Worker plumbing
+    # ----------------------------
+
+    def _worker_loop(self, name: str, inbox: queue.Queue, outbox: Optional[queue.Queue], step) -> None:
+        while True:
+            work = inbox.get()
+            if work is _STOP:
+                if outbox is not None:
+                    outbox.put(_STOP)
+                return
+            try:
+                step(work)
+            except Exception as exc:
+                # A failed stage drops its cycle; later cycles keep flowing.
+                with self._counter_lock:
+                    self.cycles_failed += 1
+                log.error(
+                    "[ERROR] Pipeline stage '%s' failed for cycle %s: %s — cycle dropped, pipeline continues.",
+                    name,
+                    work.cycle_id,
+                    exc,
+                )
+                continue
+            if outbox is not None:
+                outbox.put(work)
+
+    # ----------------------------
+    # Stage steps
+    # ----------------------------
+
+    def _scan_step(self, work: CycleWork) -> None:
+        log.debug("[INFO] Pipeline cycle %s: scan stage.", work.cycle_id)
+        if self.orchestrator.sharded_runner is not None:
+            # Shard workers already tag patterns; the pattern step passes through.
+            work.scanner_results, work.pattern_results = self.orchestrator._run_sharded_scan_pattern_stage()
+            return
+        work.scanner_results = self.orchestrator._run_scan_stage()
+
+    def _pattern_step(self, work: CycleWork) -> None:
+        if self.orchestrator.sharded_runner is not None:
+            return
+        work.pattern_results = self.orchestrator._run_pattern_stage(work.scanner_results)
+
+    def _strategy_step(self, work: CycleWork) -> None:
+        work.strategy_output = self.orchestrator._run_strategy_stage(work.pattern_results)
+
+    def _decision_step(self, work: CycleWork) -> None:
+        # Risk and execution stay on one worker so ActiveTradeRegistry reads and
+        # writes for a cycle complete before the next cycle's risk checks begin.
+        # The registry snapshots are taken here too: by the time storage runs,
+        # a later cycle may already have changed the registry.
+        recording = self.orchestrator.cycle_recorder is not None
+        if recording:
+            work.registry_before = self.orchestrator.trade_registry.snapshot()
+        work.risk_output = self.orchestrator._run_risk_stage(work.strategy_output)
+        self.orchestrator._retain_tick_buffers(work.scanner_results)
+        work.execution_output = self.orchestrator._run_execution_stage(work.risk_output)
+        if recording:
+            work.registry_after = self.orchestrator.trade_registry.snapshot()
+
+    def _storage_step(self, work: CycleWork) -> None:
+        work.trade_record = self.orchestrator._run_storage_stage(
+            work.scanner_results,
+            work.pattern_results,
+            work.strategy_output,
+            work.risk_output,
+            work.execution_output,
+        )
+        if self.orchestrator.cycle_recorder is not None:
+            self.orchestrator.cycle_recorder.record(work.registry_before, work.trade_record, work.registry_after)
+        self.orchestrator._print_cycle_summary(work.trade_record)
+        self.orchestrator.stage_timing.record_ns("pipeline_cycle", time.perf_counter_ns() - work.submitted_ns)
+        self.orchestrator.stage_timing.maybe_export()
+        with self._counter_lock:
+            self.cycles_completed += 1
+        log.info("[INFO] Pipeline cycle %s complete.", work.cycle_id)
+        if self.on_cycle_complete is not None:
+            self.on_cycle_complete(work)
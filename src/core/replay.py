@@ -0,0 +1,228 @@
+"""
+Record-and-replay harness for CoreOrchestrator cycles.
+
+Phase 5: production cycles could not be reproduced, and the pipeline could
+only be benchmarked on the static teaching candidates. This module captures
+every input a `run_once` cycle consumes and replays the captures later.
+
+What a capture holds (one gzip-compressed JSON line per cycle):
+- inputs: the scanner candidates (the cycle's market snapshot) and the
+  ActiveTradeRegistry state at cycle start.
+- outputs: patterns, trade intents, risk decisions, execution results and
+  the registry state after the cycle.
+
+Replay feeds the inputs back through a fresh CoreOrchestrator as fast as
+possible (no sleeping, deadline budget off) and checks the outputs are
+identical, which gives both a regression test and a cycles/sec figure.
+
+Usage:
+    cd src && python -m core.replay captures.jsonl.gz             # replay
+    cd src && python -m core.replay captures.jsonl.gz --record 50  # record, then replay
+
+Capture happens in `run_once` only; pipelined mode interleaves registry
+access across cycles, so it has no single "registry at cycle start".
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from models.data_models import ScannerCandidate, TradeRecord
+from scanner.scanner import Scanner
+from telemetry.logger import get_logger
+
+log = get_logger("orchestrator.replay")
+
+CAPTURE_VERSION = 1
+
+
+def _serialize_outputs(trade_record: TradeRecord, registry_after: List[Dict]) -> Dict:
+    # Degradations are excluded: they depend on wall-clock timing, not inputs.
+    return {
+        "pattern_output": [asdict(item) for item in trade_record.pattern_output],
+        "strategy_output": [asdict(item) for item in trade_record.strategy_output],
+        "risk_output": [asdict(item) for item in trade_record.risk_output],
+        "execution_output": [asdict(item) for item in trade_record.execution_output],
+        "registry_after": registry_after,
+    }
+
+
+@dataclass
+class CycleCapture:
+    """Inputs and outputs of one recorded orchestrator cycle."""
+
+    cycle_id: int
+    recorded_at: float
+    registry_before: List[Dict]
+    scanner_candidates: List[Dict]
+    outputs: Dict
+
+
+class CycleRecorder:
+    """Append one CycleCapture per cycle to a gzip JSON-lines file."""
+
+    def __init__(self, path: str) -> None:
+        log.info("[BOOT] CycleRecorder instantiated — capturing cycles to %s", path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.cycles_recorded = 0
+        self._handle = gzip.open(path, "at", encoding="utf-8")
+
+    def record(self, registry_before: List[Dict], trade_record: TradeRecord, registry_after: List[Dict]) -> None:
+        self.cycles_recorded += 1
+        capture = CycleCapture(
+            cycle_id=self.cycles_recorded,
+            recorded_at=time.time(),
+            registry_before=registry_before,
+            scanner_candidates=[asdict(candidate) for candidate in trade_record.scanner_output],
+            outputs=_serialize_outputs(trade_record, registry_after),
+        )
+        line = json.dumps({"v": CAPTURE_VERSION, **asdict(capture)}, separators=(",", ":"))
+        self._handle.write(line + "\n")
+        # Sync-flush each cycle so a crash loses at most the cycle in flight.
+        self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            log.info("[SHUTDOWN] CycleRecorder closed — %s cycle(s) in %s", self.cycles_recorded, self.path)
+
+
+def load_captures(path: str) -> Iterator[CycleCapture]:
+    """Yield captures in order; a file cut short by a crash yields its complete cycles."""
+
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        try:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    log.warn("[REPLAY] Skipping truncated capture line in %s", path)
+                    return
+                entry.pop("v", None)
+                yield CycleCapture(**entry)
+        except EOFError:
+            log.warn("[REPLAY] Capture file %s ends mid-stream (recorder not closed); stopping there", path)
+
+
+class ReplayScanner(Scanner):
+    """Scanner that returns the recorded candidates of the cycle being replayed."""
+
+    # Recorded candidates already passed the prefilter in production.
+    prefilter_enabled = False
+
+    def __init__(self) -> None:
+        self._candidates: List[Dict] = []
+
+    def load(self, candidates: List[Dict]) -> None:
+        self._candidates = candidates
+
+    def universe(self) -> List[str]:
+        return [candidate["symbol"] for candidate in self._candidates]
+
+    def iter_scan_cycle(self, symbols: Optional[Sequence[str]] = None) -> Iterator[ScannerCandidate]:
+        yield from self.run_scan_cycle(symbols=symbols)
+
+    def run_scan_cycle(
+        self, max_candidates: Optional[int] = None, symbols: Optional[Sequence[str]] = None
+    ) -> List[ScannerCandidate]:
+        # Recorded candidates are already post-degradation, so max_candidates
+        # is ignored; replay must not drop what production actually scanned.
+        wanted = set(symbols) if symbols is not None else None
+        return [
+            ScannerCandidate(**candidate)
+            for candidate in self._candidates
+            if wanted is None or candidate["symbol"] in wanted
+        ]
+
+
+@dataclass
+class ReplayReport:
+    cycles: int
+    mismatches: List[int]
+    elapsed_seconds: float
+
+    @property
+    def cycles_per_second(self) -> float:
+        return self.cycles / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class CycleReplayer:
+    """Feed recorded cycles back through a fresh CoreOrchestrator and compare outputs."""
+
+    def __init__(self, path: str) -> None:
+        # Imported here: core.orchestrator imports this module for the recorder.
+        from core.active_trade_registry import ActiveTradeRegistry
+        from core.cycle_budget import CycleBudget
+        from core.orchestrator import CoreOrchestrator
+
+        self.path = path
+        self.scanner = ReplayScanner()
+        self.trade_registry = ActiveTradeRegistry()
+        self.orchestrator = CoreOrchestrator(
+            scanner=self.scanner,
+            trade_registry=self.trade_registry,
+            cycle_budget=CycleBudget(enabled=False),
+            sharding_enabled=False,
+            cycle_recorder=None,
+        )
+
+    def run(self) -> ReplayReport:
+        captures = list(load_captures(self.path))
+        mismatches: List[int] = []
+        started = time.perf_counter()
+        for capture in captures:
+            self.trade_registry.restore(capture.registry_before)
+            self.scanner.load(capture.scanner_candidates)
+            trade_record = self.orchestrator.run_once()
+            outputs = _serialize_outputs(trade_record, self.trade_registry.snapshot())
+            # Round-trip through JSON so tuples/floats compare exactly as stored.
+            if json.loads(json.dumps(outputs)) != capture.outputs:
+                mismatches.append(capture.cycle_id)
+        elapsed = time.perf_counter() - started
+        self.orchestrator.shutdown()
+        return ReplayReport(cycles=len(captures), mismatches=mismatches, elapsed_seconds=elapsed)
+
+
+if __name__ == "__main__":
+    from telemetry.logger import flush_logging, set_default_level
+
+    parser = argparse.ArgumentParser(description="Replay recorded orchestrator cycles.")
+    parser.add_argument("path", help="gzip JSON-lines capture file")
+    parser.add_argument("--record", type=int, default=0, help="record this many live cycles first")
+    parser.add_argument("--verbose", action="store_true", help="keep DEBUG/INFO logs during replay")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        set_default_level("WARN")
+
+    if args.record:
+        from core.orchestrator import CoreOrchestrator
+
+        recorder = CycleRecorder(args.path)
+        live = CoreOrchestrator(cycle_recorder=recorder)
+        for _ in range(args.record):
+            live.run_once()
+            # Free a slot now and then so later cycles reach execution again.
+            if live.trade_registry.count_active_by_trader("SCALPER") >= 2:
+                live.execution_engine.close_all_active_trades()
+        live.shutdown()
+
+    report = CycleReplayer(args.path).run()
+    flush_logging()
+    print(
+        f"[REPLAY] cycles={report.cycles} mismatches={len(report.mismatches)} "
+        f"elapsed={report.elapsed_seconds:.3f}s throughput={report.cycles_per_second:,.0f} cycles/sec"
+    )
+    if report.mismatches:
+        print(f"[REPLAY] Mismatched cycle ids: {report.mismatches}")
+        raise SystemExit(1)
@@ -0,0 +1,229 @@
+"""
+Exchange session calendar for the runtime loops.
+
+Phase 5: replaces the naive `get_current_market_session()` helper, which read
+`datetime.now()` in machine-local time and ignored holidays and early closes.
+Sessions are now computed in America/New_York (EXCHANGE_TIMEZONE) from a
+precomputed per-day table:
+
+- Each exchange-local date maps to its ordered session transitions, e.g.
+  04:00 PRE → 09:30 REGULAR → 16:00 AFTER → 20:00 CLOSED, stored as UTC epoch
+  seconds. Weekends and NYSE holidays have no transitions (CLOSED all day).
+- Early-close days end REGULAR at 13:00 and AFTER at 17:00.
+- A lookup is one dict access plus a scan of at most four transitions, so it
+  is O(1). Years are built on first use and kept for the life of the process.
+
+`next_transition()` tells the runtime loops how long they can sleep before the
+session changes, so a CLOSED night costs one sleep instead of thousands of
+empty cycles.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from config.system_config import (
+    EXCHANGE_TIMEZONE,
+    SESSION_AFTER_END,
+    SESSION_AFTER_END_EARLY_CLOSE,
+    SESSION_EARLY_CLOSE,
+    SESSION_PRE_START,
+    SESSION_REGULAR_END,
+    SESSION_REGULAR_START,
+)
+
+CLOSED = "CLOSED"
+
+# (utc_epoch_seconds, session that starts at that instant)
+Transition = Tuple[float, str]
+
+
+# ================================
+# NYSE holiday rules
+# ================================
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    last = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter_sunday(year: int) -> date:
+    # Anonymous Gregorian algorithm.
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed Friday, Sunday holidays Monday."""
+
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year: int) -> Set[date]:
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter_sunday(year) - timedelta(days=2),  # Good Friday
+        _last_weekday(year, 5, 0),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    }
+    # New Year's Day on a Saturday is not observed on the prior Friday (NYSE rule 7.2).
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return holidays
+
+
+def nyse_early_closes(year: int, holidays: Set[date]) -> Set[date]:
+    candidates = [
+        date(year, 7, 3),
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),  # day after Thanksgiving
+        date(year, 12, 24),
+    ]
+    return {day for day in candidates if day.weekday() < 5 and day not in holidays}
+
+
+# ================================
+# Calendar
+# ================================
+
+class SessionCalendar:
+    """Precomputed, timezone-aware session table keyed by exchange-local date."""
+
+    def __init__(self, tz_name: str = EXCHANGE_TIMEZONE) -> None:
+        self.tz = ZoneInfo(tz_name)
+        self._days: Dict[date, Tuple[Transition, ...]] = {}
+        self._built_years: Set[int] = set()
+
+    def _build_year(self, year: int) -> None:
+        holidays = nyse_holidays(year)
+        early_closes = nyse_early_closes(year, holidays)
+        day = date(year, 1, 1)
+        while day.year == year:
+            if day.weekday() >= 5 or day in holidays:
+                self._days[day] = ()
+            else:
+                early = day in early_closes
+                self._days[day] = (
+                    (self._epoch(day, SESSION_PRE_START), "PRE"),
+                    (self._epoch(day, SESSION_REGULAR_START), "REGULAR"),
+                    (self._epoch(day, SESSION_EARLY_CLOSE if early else SESSION_REGULAR_END), "AFTER"),
+                    (self._epoch(day, SESSION_AFTER_END_EARLY_CLOSE if early else SESSION_AFTER_END), CLOSED),
+                )
+            day += timedelta(days=1)
+        self._built_years.add(year)
+
+    def _epoch(self, day: date, at: time) -> float:
+        return datetime.combine(day, at, tzinfo=self.tz).timestamp()
+
+    def _transitions(self, day: date) -> Tuple[Transition, ...]:
+        transitions = self._days.get(day)
+        if transitions is None:
+            self._build_year(day.year)
+            transitions = self._days[day]
+        return transitions
+
+    def _resolve(self, when: Optional[datetime]) -> Tuple[float, date]:
+        when = when if when is not None else datetime.now(timezone.utc)
+        if when.tzinfo is None:
+            raise ValueError("SessionCalendar needs timezone-aware datetimes")
+        return when.timestamp(), when.astimezone(self.tz).date()
+
+    def session_at(self, when: Optional[datetime] = None) -> str:
+        """Return PRE, REGULAR, AFTER or CLOSED for `when` (default: now)."""
+
+        epoch, local_day = self._resolve(when)
+        session = CLOSED
+        for starts_at, name in self._transitions(local_day):
+            if epoch < starts_at:
+                break
+            session = name
+        return session
+
+    def next_transition(self, when: Optional[datetime] = None) -> Tuple[datetime, str]:
+        """Return (exchange-local time, session) of the next boundary after `when`."""
+
+        epoch, local_day = self._resolve(when)
+        # Long weekends plus holidays never span more than a few days; the
+        # bound only guards against a malformed table.
+        for offset in range(14):
+            for starts_at, name in self._transitions(local_day + timedelta(days=offset)):
+                if starts_at > epoch:
+                    return datetime.fromtimestamp(starts_at, tz=self.tz), name
+        raise RuntimeError("No session transition found within 14 days")
+
+    def seconds_until_next_transition(self, when: Optional[datetime] = None) -> float:
+        when = when if when is not None else datetime.now(timezone.utc)
+        transition_at, _ = self.next_transition(when)
+        return max(transition_at.timestamp() - when.timestamp(), 0.0)
+
+    def session_bounds_at(self, epoch_seconds: float) -> Optional[Tuple[float, float, str]]:
+        """
+        Return (start, end, session) in UTC epoch seconds for the trading
+        session containing `epoch_seconds`, or None when the market is CLOSED.
+        """
+
+        local_day = datetime.fromtimestamp(epoch_seconds, tz=self.tz).date()
+        transitions = self._transitions(local_day)
+        for (starts_at, name), (ends_at, _) in zip(transitions, transitions[1:]):
+            if starts_at <= epoch_seconds < ends_at:
+                return starts_at, ends_at, name
+        return None
+
+    def is_trading_day(self, day: date) -> bool:
+        return bool(self._transitions(day))
+
+
+_default_calendar: Optional[SessionCalendar] = None
+
+
+def get_session_calendar() -> SessionCalendar:
+    global _default_calendar
+    if _default_calendar is None:
+        _default_calendar = SessionCalendar()
+    return _default_calendar
+
+
+def get_current_market_session() -> str:
+    """Return the current exchange session: PRE, REGULAR, AFTER or CLOSED."""
+
+    return get_session_calendar().session_at()
+
+
+if __name__ == "__main__":
+    calendar = get_session_calendar()
+    now = datetime.now(timezone.utc)
+    transition_at, next_session = calendar.next_transition(now)
+    print(f"[SESSION] Now: {now.astimezone(calendar.tz):%Y-%m-%d %H:%M %Z} session={calendar.session_at(now)}")
+    print(f"[SESSION] Next transition: {transition_at:%Y-%m-%d %H:%M %Z} → {next_session}")
+    for year in (now.year, now.year + 1):
+        holidays = sorted(nyse_holidays(year))
+        print(f"[SESSION] {year} holidays: {', '.join(day.isoformat() for day in holidays)}")
+        print(
+            f"[SESSION] {year} early closes: "
+            f"{', '.join(day.isoformat() for day in sorted(nyse_early_closes(year, set(holidays))))}"
+        )
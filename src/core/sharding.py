@@ -0,0 +1,328 @@
+"""
+Multi-process sharding for the scan and pattern stages.
+
+Phase 5: `Scanner.run_scan_cycle` and `PatternEngine.evaluate_patterns` run in
+one Python process, so a single core caps how many symbols a cycle can cover.
+ShardedScanPatternRunner splits the scanner universe into shards, runs scan +
+pattern detection for each shard in a pool of worker processes, and merges the
+results back so risk/execution still see one ordered list.
+
+Guarantees:
+- Deterministic shard assignment: crc32(symbol) % shard_count, stable across
+  processes and restarts (unlike Python's salted hash()).
+- Deterministic output: merged candidates and patterns follow universe order,
+  so results match a single-process scan exactly.
+- Crash recovery: if a worker process dies the pool is rebuilt and the
+  unfinished shards re-run; after SCAN_SHARD_MAX_RETRIES they run in-process.
+- Same collaborators: workers rebuild the coordinator's scanner and pattern
+  engine from their public settings (prefilter criteria, bar_history), and
+  every shard ships the candle history of its symbols, so worker patterns see
+  the bars the coordinator's PatternEngine collected. Scanner subclasses hold
+  state a worker cannot rebuild (ReplayScanner's per-cycle candidates), so
+  they need an explicit scanner_factory; see `can_rebuild`.
+
+Benchmark (symbols/sec from 1 to N workers):
+    cd src && python -m core.sharding
+"""
+
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from config.system_config import SCAN_SHARD_MAX_RETRIES, SCAN_SHARD_WORKERS
+from models.data_models import Bar, PatternResult, ScannerCandidate
+from patterns.pattern_engine import PatternEngine
+from scanner.scanner import Scanner, select_top_ranked
+from telemetry.logger import get_logger
+
+log = get_logger("orchestrator.sharding")
+
+ShardResult = Tuple[int, List[ScannerCandidate], List[PatternResult]]
+BarSnapshot = Dict[Tuple[str, int], List[Bar]]
+
+
+def shard_for_symbol(symbol: str, shard_count: int) -> int:
+    """Return the shard index that owns `symbol`."""
+
+    return zlib.crc32(symbol.encode("utf-8")) % shard_count
+
+
+def partition_universe(symbols: Sequence[str], shard_count: int) -> List[List[str]]:
+    """Split symbols into `shard_count` lists, keeping universe order inside each shard."""
+
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    for symbol in symbols:
+        shards[shard_for_symbol(symbol, shard_count)].append(symbol)
+    return shards
+
+
+class _SettingsFactory:
+    """
+    Picklable factory that rebuilds an injected instance in a worker process.
+
+    Only public instance attributes (configuration) are copied; underscore
+    attributes are per-process runtime state such as caches and bar history.
+    """
+
+    def __init__(self, instance) -> None:
+        self.instance_class = type(instance)
+        self.settings = {name: value for name, value in vars(instance).items() if not name.startswith("_")}
+
+    def __call__(self):
+        instance = self.instance_class()
+        instance.__dict__.update(self.settings)
+        return instance
+
+
+# ----------------------------
+# Worker process side
+# ----------------------------
+
+_worker_scanner: Optional[Scanner] = None
+_worker_pattern_engine: Optional[PatternEngine] = None
+
+
+def _init_worker(scanner_factory: Callable[[], Scanner], pattern_engine_factory: Callable[[], PatternEngine]) -> None:
+    global _worker_scanner, _worker_pattern_engine
+    _worker_scanner = scanner_factory()
+    _worker_pattern_engine = pattern_engine_factory()
+
+
+def _scan_and_detect(
+    scanner: Scanner, pattern_engine: PatternEngine, shard_index: int, symbols: List[str]
+) -> ShardResult:
+    candidates = scanner.run_scan_cycle(symbols=symbols)
+    return shard_index, candidates, pattern_engine.evaluate_patterns(candidates)
+
+
+def _run_shard_in_worker(shard_index: int, symbols: List[str], bars: BarSnapshot) -> ShardResult:
+    _worker_pattern_engine.restore_bars(bars)
+    return _scan_and_detect(_worker_scanner, _worker_pattern_engine, shard_index, symbols)
+
+
+# ----------------------------
+# Coordinator
+# ----------------------------
+
+class ShardedScanPatternRunner:
+    """Fan scan + pattern work out to worker processes and merge the results."""
+
+    def __init__(
+        self,
+        scanner: Scanner,
+        pattern_engine: PatternEngine,
+        worker_count: int = SCAN_SHARD_WORKERS,
+        scanner_factory: Optional[Callable[[], Scanner]] = None,
+        pattern_engine_factory: Optional[Callable[[], PatternEngine]] = None,
+        max_retries: int = SCAN_SHARD_MAX_RETRIES,
+    ) -> None:
+        """
+        Factories must be picklable. When omitted they rebuild `scanner` and
+        `pattern_engine` from their settings, which is only possible for the
+        base classes (ValueError otherwise).
+        """
+
+        if scanner_factory is None:
+            if not self.can_rebuild(scanner):
+                raise ValueError(
+                    f"{type(scanner).__name__} cannot be rebuilt in worker processes; pass scanner_factory"
+                )
+            scanner_factory = _SettingsFactory(scanner)
+        if pattern_engine_factory is None:
+            if type(pattern_engine) is not PatternEngine:
+                raise ValueError(
+                    f"{type(pattern_engine).__name__} cannot be rebuilt in worker processes; "
+                    "pass pattern_engine_factory"
+                )
+            pattern_engine_factory = _SettingsFactory(pattern_engine)
+
+        log.info("[BOOT] ShardedScanPatternRunner instantiated — %s worker process(es)", worker_count)
+        self.scanner = scanner
+        self.pattern_engine = pattern_engine
+        self.worker_count = max(worker_count, 1)
+        self.scanner_factory = scanner_factory
+        self.pattern_engine_factory = pattern_engine_factory
+        self.max_retries = max_retries
+        self.worker_restarts = 0
+        self.in_process_fallbacks = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @staticmethod
+    def can_rebuild(scanner: Scanner) -> bool:
+        """True when workers can rebuild `scanner` from its settings (no scanner_factory needed)."""
+
+        return type(scanner) is Scanner
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.worker_count,
+                initializer=_init_worker,
+                initargs=(self.scanner_factory, self.pattern_engine_factory),
+            )
+        return self._pool
+
+    def _rebuild_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self.worker_restarts += 1
+        self._ensure_pool()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def run(self, max_candidates: Optional[int] = None) -> Tuple[List[ScannerCandidate], List[PatternResult]]:
+        """Scan and pattern-tag the whole universe across shards; merged in universe order."""
+
+        universe = self.scanner.scan_universe()
+        shards = partition_universe(universe, self.worker_count)
+        log.info(
+            "[SHARD] Scanning %s symbol(s) across %s shard(s): sizes=%s",
+            len(universe),
+            len(shards),
+            [len(shard) for shard in shards],
+        )
+        results = self._run_shards(shards)
+
+        position: Dict[str, int] = {symbol: index for index, symbol in enumerate(universe)}
+        candidates = sorted(
+            (candidate for _, shard_candidates, _ in results for candidate in shard_candidates),
+            key=lambda candidate: position[candidate.symbol],
+        )
+        patterns = sorted(
+            (pattern for _, _, shard_patterns in results for pattern in shard_patterns),
+            key=lambda pattern: position[pattern.symbol],
+        )
+        if max_candidates is not None and len(candidates) > max_candidates:
+            candidates = select_top_ranked(candidates, max_candidates)
+            kept = {candidate.symbol for candidate in candidates}
+            patterns = [pattern for pattern in patterns if pattern.symbol in kept]
+            log.info("[SHARD] Degraded scan — keeping top %s ranked candidates only", max_candidates)
+        return candidates, patterns
+
+    def _run_shards(self, shards: List[List[str]]) -> List[ShardResult]:
+        pending: Dict[int, List[str]] = {index: shard for index, shard in enumerate(shards) if shard}
+        results: List[ShardResult] = []
+        attempts = 0
+        while pending and attempts <= self.max_retries:
+            broken = False
+            try:
+                pool = self._ensure_pool()
+                futures = {
+                    index: pool.submit(_run_shard_in_worker, index, shard, self.pattern_engine.bar_snapshot(shard))
+                    for index, shard in pending.items()
+                }
+            except BrokenProcessPool:
+                # A worker died between cycles; the pool refuses new work.
+                futures = {}
+                broken = True
+            for index, future in futures.items():
+                try:
+                    results.append(future.result())
+                    del pending[index]
+                except BrokenProcessPool:
+                    broken = True
+            if broken:
+                log.recovery(
+                    "[RECOVERY] Shard worker died — rebuilding pool and re-running %s shard(s)", len(pending)
+                )
+                self._rebuild_pool()
+            attempts += 1
+
+        for index, shard in pending.items():
+            # Last resort: keep the cycle alive by scanning the shard here.
+            self.in_process_fallbacks += 1
+            log.recovery("[RECOVERY] Shard %s running in-process after repeated worker failures", index)
+            results.append(_scan_and_detect(self.scanner, self.pattern_engine, index, shard))
+        return results
+
+
+# ----------------------------
+# Benchmark
+# ----------------------------
+
+class _BenchmarkScanner(Scanner):
+    """Synthetic universe with CPU work per symbol, standing in for real indicator math."""
+
+    UNIVERSE_SIZE = 2_000
+    WORK_STEPS = 4_000
+
+    def universe(self) -> List[str]:
+        return [f"SYM{index:05d}" for index in range(self.UNIVERSE_SIZE)]
+
+    def run_scan_cycle(
+        self, max_candidates: Optional[int] = None, symbols: Optional[Sequence[str]] = None
+    ) -> List[ScannerCandidate]:
+        candidates = []
+        for symbol in symbols if symbols is not None else self.universe():
+            seed = zlib.crc32(symbol.encode("utf-8"))
+            price = 5.0 + seed % 9_500 / 100.0
+            ema = price
+            for step in range(self.WORK_STEPS):
+                ema += (price * (1.0 + ((seed >> (step % 24)) & 7) / 1_000.0) - ema) * 0.05
+            candidates.append(
+                ScannerCandidate(
+                    symbol=symbol,
+                    price=round(ema, 4),
+                    gap_percent=seed % 1_500 / 100.0,
+                    rvol=1.0 + seed % 500 / 100.0,
+                    float_millions=5.0 + seed % 400,
+                    rationale="Synthetic benchmark candidate.",
+                )
+            )
+        return candidates
+
+
+if __name__ == "__main__":
+    from telemetry.logger import flush_logging, set_module_level
+
+    for module in ("scanner", "patterns", "orchestrator"):
+        set_module_level(module, "WARN")
+
+    benchmark_scanner = _BenchmarkScanner()
+    benchmark_patterns = PatternEngine()
+    started = time.perf_counter()
+    reference = _scan_and_detect(benchmark_scanner, benchmark_patterns, 0, benchmark_scanner.universe())
+    baseline_seconds = time.perf_counter() - started
+    symbols = len(benchmark_scanner.universe())
+    print(f"[BENCH] in-process: {symbols / baseline_seconds:,.0f} symbols/sec")
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for workers in worker_counts:
+        runner = ShardedScanPatternRunner(
+            benchmark_scanner,
+            benchmark_patterns,
+            worker_count=workers,
+            scanner_factory=_BenchmarkScanner,
+        )
+        runner.run()  # warm-up: start workers outside the timed run
+        started = time.perf_counter()
+        candidates, patterns = runner.run()
+        elapsed = time.perf_counter() - started
+        identical = candidates == reference[1] and patterns == reference[2]
+        print(
+            f"[BENCH] workers={workers}: {symbols / elapsed:,.0f} symbols/sec "
+            f"(speedup x{baseline_seconds / elapsed:.2f}, identical={identical})"
+        )
+        runner.shutdown()
+
+    # Crash recovery: make one worker exit mid-life and check the next run still completes.
+    runner = ShardedScanPatternRunner(benchmark_scanner, benchmark_patterns, worker_count=2, scanner_factory=_BenchmarkScanner)
+    runner.run()
+    try:
+        runner._ensure_pool().submit(os._exit, 1).result()
+    except BrokenProcessPool:
+        pass
+    candidates, patterns = runner.run()
+    print(
+        f"[BENCH] after killing a worker: restarts={runner.worker_restarts} "
+        f"fallbacks={runner.in_process_fallbacks} identical={candidates == reference[1] and patterns == reference[2]}"
+    )
+    runner.shutdown()
+    flush_logging()
@@ -9,6 +9,9 @@ from typing import Optional
 
 from core.active_trade_registry import ActiveTradeRegistry
 from models.data_models import ExecutionResult, RiskDecision
+from telemetry.logger import DEBUG, get_logger
+
+log = get_logger("execution")
 
 
 class ExecutionEngine:
@@ -19,7 +22,7 @@ class ExecutionEngine:
         broker: Optional[object] = None,
         trade_registry: Optional[ActiveTradeRegistry] = None,
     ) -> None:
-        print("[BOOT] ExecutionEngine instantiated — phase 3 skeleton only")
+        log.info("[BOOT] ExecutionEngine instantiated — phase 3 skeleton only")
         self.broker = broker
         self.trade_registry = trade_registry or ActiveTradeRegistry()
 
@@ -31,9 +34,9 @@ class ExecutionEngine:
         about the intended behavior without touching any broker.
         """
 
-        print("[EXECUTION] Received risk decision for teaching-only execution flow")
+        log.debug("[EXECUTION] Received risk decision for teaching-only execution flow")
         if risk_decision is None:
-            print("[EXECUTION] No execution performed — placeholder path")
+            log.info("[EXECUTION] No execution performed — placeholder path")
             return ExecutionResult(
                 symbol="UNKNOWN",
                 trader_type="MANUAL",
@@ -44,12 +47,14 @@ class ExecutionEngine:
 
         trader_type = getattr(risk_decision, "trader_type", "MANUAL")
         symbol = getattr(risk_decision, "symbol", "UNKNOWN")
-        print(
-            "[EXECUTION:REGISTRY] Current active trades snapshot by trader_type "
-            f"{trader_type}: {self.trade_registry.count_active_by_trader(trader_type)}"
-        )
+        if log.is_enabled_for(DEBUG):
+            log.debug(
+                "[EXECUTION:REGISTRY] Current active trades snapshot by trader_type %s: %s",
+                trader_type,
+                self.trade_registry.count_active_by_trader(trader_type),
+            )
         if not getattr(risk_decision, "allowed", True):
-            print(
+            log.info(
                 "[EXECUTION] Risk decision not allowed — skipping registration in registry"
             )
             return ExecutionResult(
@@ -63,20 +68,22 @@ class ExecutionEngine:
                 ),
             )
 
-        print(
-            f"[EXECUTION] Routing execution for symbol={symbol} to trader_type={trader_type} "
-            "(teaching-only path)"
+        log.info(
+            "[EXECUTION] Routing execution for symbol=%s to trader_type=%s (teaching-only path)",
+            symbol,
+            trader_type,
         )
         self.trade_registry.register_trade(symbol, trader_type)
-        print(
-            "[EXECUTION:REGISTRY] Registered active trade "
-            f"symbol={symbol} trader_type={trader_type}"
+        log.info(
+            "[EXECUTION:REGISTRY] Registered active trade symbol=%s trader_type=%s", symbol, trader_type
         )
-        print(
-            "[EXECUTION:REGISTRY] Active trades for trader_type "
-            f"{trader_type}: {self.trade_registry.count_active_by_trader(trader_type)}"
-        )
-        print("[EXECUTION] SIM mode active — no broker calls; returning simulated result.")
+        if log.is_enabled_for(DEBUG):
+            log.debug(
+                "[EXECUTION:REGISTRY] Active trades for trader_type %s: %s",
+                trader_type,
+                self.trade_registry.count_active_by_trader(trader_type),
+            )
+        log.debug("[EXECUTION] SIM mode active — no broker calls; returning simulated result.")
 
         return ExecutionResult(
             symbol=symbol,
@@ -94,10 +101,11 @@ class ExecutionEngine:
         """
 
         self.trade_registry.unregister_trade(symbol, trader_type)
-        print(
-            "[EXECUTION:REGISTRY] Completed trade "
-            f"symbol={symbol} trader_type={trader_type}; "
-            f"remaining active={self.trade_registry.count_active_by_trader(trader_type)}"
+        log.info(
+            "[EXECUTION:REGISTRY] Completed trade symbol=%s trader_type=%s; remaining active=%s",
+            symbol,
+            trader_type,
+            self.trade_registry.count_active_by_trader(trader_type),
         )
 
     def close_all_active_trades(self):
@@ -110,18 +118,18 @@ class ExecutionEngine:
 
         closed_trades = self.trade_registry.close_all_trades()
         if not closed_trades:
-            print("[EXECUTION:REGISTRY] No active trades to close — registry already empty.")
+            log.info("[EXECUTION:REGISTRY] No active trades to close — registry already empty.")
             return []
 
-        print("[EXECUTION:REGISTRY] Closing all active trades and resetting registry")
+        log.info("[EXECUTION:REGISTRY] Closing all active trades and resetting registry")
         for trade in closed_trades:
-            print(
-                "[EXECUTION:REGISTRY] Closed trade "
-                f"symbol={trade.get('symbol', 'UNKNOWN')} "
-                f"trader_type={trade.get('trader_type', 'UNKNOWN')}"
+            log.info(
+                "[EXECUTION:REGISTRY] Closed trade symbol=%s trader_type=%s",
+                trade.get("symbol", "UNKNOWN"),
+                trade.get("trader_type", "UNKNOWN"),
             )
 
-        print(
+        log.info(
             "[EXECUTION:REGISTRY] All trades closed; registry capacity reset for next cycle"
         )
         return closed_trades
@@ -1,12 +1,29 @@
 """
 Main entry point for PHASE 4 — Minimal Live-Capable System (Teaching-First).
 
-This file provides a minimal, runnable starting point that prints clear,
+This file provides a minimal, runnable starting point that emits clear,
 teaching-style logs when executed via `python src/main.py`. It intentionally
 avoids importing other project modules, performing any trading logic, loading
 configuration, or connecting to brokers or data sources.
+
+Three runtime loops are available (see RUNTIME_LOOP_MODE in system_config):
+- POLLING: run a cycle, sleep CYCLE_SLEEP_SECONDS, repeat (safe fallback).
+- EVENT_DRIVEN: wake the orchestrator on data events via EventDrivenRuntime.
+  Until a live feed exists, TeachingTickFeed (TEACHING_FEED_ENABLED) publishes
+  simulated ticks so the runtime actually wakes on data.
+- PIPELINED: submit a cycle every CYCLE_SLEEP_SECONDS to OrchestratorPipeline,
+  whose stage workers let consecutive cycles overlap.
+
+Sessions come from core.session_calendar (America/New_York, holidays, early
+closes). With SLEEP_THROUGH_CLOSED_SESSIONS every loop sleeps straight to the
+next session boundary while the market is CLOSED (the event-driven loop still
+wakes for data events).
 """
 
+import asyncio
+import os
+import signal
+import threading
 import time
 
 from config.runtime_config import RunMode, get_run_mode
@@ -14,51 +31,192 @@ from config.system_config import (
     ACTIVE_SESSIONS,
     CYCLE_SLEEP_SECONDS,
     RUN_MODE,
-    get_current_market_session,
+    RUNTIME_LOOP_MODE,
+    SLEEP_THROUGH_CLOSED_SESSIONS,
+    TEACHING_FEED_ENABLED,
 )
+from core.event_runtime import EventDrivenRuntime, LatencyTracker
 from core.orchestrator import CoreOrchestrator
+from core.pipeline import CycleWork, OrchestratorPipeline
+from core.session_calendar import CLOSED, get_session_calendar
+from market_data.teaching_feed import TeachingTickFeed
+from telemetry.logger import get_logger, shutdown_logging
 
+log = get_logger("main")
 
-def main() -> None:
-    """Run the minimal teaching-first entry point."""
-    print("[BOOT] Starting the IBKR Trading System skeleton.")
-    print("[PHASE] PHASE 4 — Minimal Live-Capable System (Teaching-First).")
-    print("[INTENT] Demonstrate a clean, observable entry point without trading logic.")
-    print("[CONFIG] Teaching-first configuration preview:")
-    print(f"  - RUN_MODE (baseline string): {RUN_MODE}")
-    print(f"  - CYCLE_SLEEP_SECONDS: {CYCLE_SLEEP_SECONDS} (seconds)")
-    print(f"  - ACTIVE_SESSIONS: {', '.join(ACTIVE_SESSIONS)}")
-    run_mode = get_run_mode()
-    print(f"[MODE] RUN_MODE = {run_mode.value} (safe default)")
-    orchestrator = CoreOrchestrator()
-    print("[LOOP] Entering continuous run loop. Press Ctrl+C to stop safely.")
 
+def _session_allows_cycle(run_mode: RunMode) -> bool:
+    """Apply the teaching-first session gate shared by every runtime loop."""
+
+    current_session = get_session_calendar().session_at()
+    log.info("[SESSION] Detected market session: %s", current_session)
+    if current_session in ACTIVE_SESSIONS:
+        log.info("[SESSION] System WOULD consider trading allowed in this session (teaching-only).")
+    else:
+        log.info("[SESSION] System WOULD treat market as closed (teaching-only).")
+    if run_mode == RunMode.LIVE and current_session == CLOSED:
+        log.warn(
+            "[GATE] RUN_MODE is LIVE while session is CLOSED. Skipping orchestrator.run_once() "
+            "to maintain teaching-first safety."
+        )
+        log.info("[GATE] Teaching note: SIM/PAPER would still run for education, but LIVE waits for an open session.")
+        return False
+    log.debug("[SAFETY] RUN_MODE and session allow safe progression to orchestrator.run_once().")
+    return True
+
+
+def _sleep_if_market_closed() -> bool:
+    """Sleep until the next session boundary while CLOSED; return True if it slept."""
+
+    calendar = get_session_calendar()
+    if not SLEEP_THROUGH_CLOSED_SESSIONS or calendar.session_at() != CLOSED:
+        return False
+    transition_at, next_session = calendar.next_transition()
+    seconds = calendar.seconds_until_next_transition()
+    log.info(
+        "[SLEEP] Market CLOSED — sleeping %.0f seconds until %s (%s).",
+        seconds,
+        transition_at.strftime("%Y-%m-%d %H:%M %Z"),
+        next_session,
+    )
+    time.sleep(seconds)
+    return True
+
+
+def _run_polling_loop(orchestrator: CoreOrchestrator, run_mode: RunMode) -> None:
+    """Fixed-sleep fallback loop; reports worst-case event-to-intent latency."""
+
+    # Data arriving while we sleep is only seen by the next cycle, so the
+    # worst-case event-to-intent latency is measured from the moment the
+    # previous cycle finished (the start of the blind window).
+    latency = LatencyTracker("event-to-intent worst case (polling)")
+    blind_since_ns = time.perf_counter_ns()
     try:
         while True:
-            print("[CYCLE] Starting orchestrator cycle.")
-            current_session = get_current_market_session()
-            print(f"[SESSION] Detected market session: {current_session}")
-            if current_session in ACTIVE_SESSIONS:
-                print("[SESSION] System WOULD consider trading allowed in this session (teaching-only).")
-            else:
-                print("[SESSION] System WOULD treat market as closed (teaching-only).")
-            if run_mode == RunMode.LIVE and current_session == "CLOSED":
-                print(
-                    "[GATE] RUN_MODE is LIVE while session is CLOSED. Skipping orchestrator.run_once() "
-                    "to maintain teaching-first safety."
-                )
-                print("[GATE] Teaching note: SIM/PAPER would still run for education, but LIVE waits for an open session.")
-            else:
-                print("[SAFETY] RUN_MODE and session allow safe progression to orchestrator.run_once().")
-                orchestrator.run_once()
-            print(
-                f"[SLEEP] Sleeping for {CYCLE_SLEEP_SECONDS} seconds before next cycle."
-            )
+            if _sleep_if_market_closed():
+                blind_since_ns = time.perf_counter_ns()
+                continue
+            log.info("[CYCLE] Starting orchestrator cycle.")
+            if _session_allows_cycle(run_mode):
+                trade_record = orchestrator.run_once()
+                if trade_record.strategy_output:
+                    elapsed_ms = latency.record_ns(time.perf_counter_ns() - blind_since_ns)
+                    log.info("[LATENCY] event-to-intent worst case %.2fms (polling)", elapsed_ms)
+            blind_since_ns = time.perf_counter_ns()
+            log.info("[SLEEP] Sleeping for %s seconds before next cycle.", CYCLE_SLEEP_SECONDS)
             time.sleep(CYCLE_SLEEP_SECONDS)
     except KeyboardInterrupt:
-        print("[SHUTDOWN] KeyboardInterrupt received. Stopping continuous run loop.")
+        log.info("[SHUTDOWN] KeyboardInterrupt received. Stopping continuous run loop.")
+    log.info(latency.format_summary())
+
+
+def _run_event_driven_loop(orchestrator: CoreOrchestrator, run_mode: RunMode) -> None:
+    """Event-driven loop; the orchestrator wakes on ticks, news, fills or the heartbeat."""
+
+    # The runtime pauses its heartbeat while CLOSED; data events can still wake
+    # it, and the gate turns those wake-ups into no-ops instead of empty cycles.
+    def _gate() -> bool:
+        if SLEEP_THROUGH_CLOSED_SESSIONS and get_session_calendar().session_at() == CLOSED:
+            return False
+        return _session_allows_cycle(run_mode)
+
+    runtime = EventDrivenRuntime(orchestrator, cycle_gate=_gate)
+    # The data producer: a real feed or broker adapter would call runtime.publish_*
+    # from its callbacks; the teaching feed stands in for one.
+    feed = None
+    if TEACHING_FEED_ENABLED:
+        reference_prices = {row["symbol"]: row["previous_close"] for row in orchestrator.scanner.reference_data()}
+        feed = TeachingTickFeed(runtime.publish_tick, reference_prices).start()
+    try:
+        asyncio.run(runtime.run())
+    except KeyboardInterrupt:
+        log.info("[SHUTDOWN] KeyboardInterrupt received. Stopping event-driven loop.")
+    finally:
+        if feed is not None:
+            feed.stop()
+
+
+def _run_pipelined_loop(orchestrator: CoreOrchestrator, run_mode: RunMode) -> None:
+    """Pipelined loop; stages run as workers so a slow stage no longer delays the next scan."""
+
+    latency = LatencyTracker("cycle submit-to-record (pipelined)")
+
+    def _on_cycle_complete(work: CycleWork) -> None:
+        latency.record_ns(time.perf_counter_ns() - work.submitted_ns)
+
+    pipeline = OrchestratorPipeline(orchestrator, on_cycle_complete=_on_cycle_complete)
+    pipeline.start()
+    try:
+        while True:
+            if _sleep_if_market_closed():
+                continue
+            if _session_allows_cycle(run_mode):
+                pipeline.submit_cycle()
+            log.info("[SLEEP] Sleeping for %s seconds before submitting next cycle.", CYCLE_SLEEP_SECONDS)
+            time.sleep(CYCLE_SLEEP_SECONDS)
+    except KeyboardInterrupt:
+        log.info("[SHUTDOWN] KeyboardInterrupt received. Draining pipeline.")
+    pipeline.stop()
+    log.info(latency.format_summary())
+
+
+def _install_timing_dump_signal(orchestrator: CoreOrchestrator) -> None:
+    """Dump the stage timing report on demand with `kill -USR1 <pid>` (POSIX only)."""
+
+    if not hasattr(signal, "SIGUSR1"):
+        return
+    # The handler runs on the main thread between bytecodes, possibly while
+    # run_once holds the stage timing or log sink lock, so it must not take
+    # any lock itself: it only writes a byte to a pipe, and a dump thread does
+    # the locking and logging.
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+
+    def _request_dump(_signum, _frame) -> None:
+        try:
+            os.write(write_fd, b"\0")
+        except BlockingIOError:
+            pass  # A dump is already pending.
+
+    def _dump_on_request() -> None:
+        while os.read(read_fd, 1):
+            orchestrator.stage_timing.dump()
+
+    threading.Thread(target=_dump_on_request, name="stage-timing-dump", daemon=True).start()
+    signal.signal(signal.SIGUSR1, _request_dump)
+    log.info("[TIMING] Send SIGUSR1 to print the rolling stage timing report on demand.")
+
+
+def main() -> None:
+    """Run the minimal teaching-first entry point."""
+    log.info("[BOOT] Starting the IBKR Trading System skeleton.")
+    log.info("[PHASE] PHASE 4 — Minimal Live-Capable System (Teaching-First).")
+    log.info("[INTENT] Demonstrate a clean, observable entry point without trading logic.")
+    log.info("[CONFIG] Teaching-first configuration preview:")
+    log.info("  - RUN_MODE (baseline string): %s", RUN_MODE)
+    log.info("  - CYCLE_SLEEP_SECONDS: %s (seconds)", CYCLE_SLEEP_SECONDS)
+    log.info("  - ACTIVE_SESSIONS: %s", ", ".join(ACTIVE_SESSIONS))
+    log.info("  - RUNTIME_LOOP_MODE: %s", RUNTIME_LOOP_MODE)
+    run_mode = get_run_mode()
+    log.info("[MODE] RUN_MODE = %s (safe default)", run_mode.value)
+    orchestrator = CoreOrchestrator()
+    _install_timing_dump_signal(orchestrator)
+
+    if RUNTIME_LOOP_MODE == "EVENT_DRIVEN":
+        log.info("[LOOP] Entering event-driven run loop. Press Ctrl+C to stop safely.")
+        _run_event_driven_loop(orchestrator, run_mode)
+    elif RUNTIME_LOOP_MODE == "PIPELINED":
+        log.info("[LOOP] Entering pipelined run loop. Press Ctrl+C to stop safely.")
+        _run_pipelined_loop(orchestrator, run_mode)
+    else:
+        log.info("[LOOP] Entering continuous run loop. Press Ctrl+C to stop safely.")
+        _run_polling_loop(orchestrator, run_mode)
 
-    print("[SHUTDOWN] Exiting gracefully. Goodbye!")
+    orchestrator.shutdown()
+    orchestrator.stage_timing.dump()
+    log.info("[SHUTDOWN] Exiting gracefully. Goodbye!")
+    # Drain the asynchronous log sink so the final lines are not lost.
+    shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,379 @@
+"""
+Incremental multi-timeframe OHLCV bar aggregation.
+
+Phase 5: the momentum patterns in the blueprint (bull flag, micro pullback,
+first candle to make a new high) are read off 10s / 1m / 5m candles, and
+nothing built candles. BarAggregator rolls trade ticks into every configured
+timeframe (BAR_TIMEFRAMES_SECONDS) as they arrive:
+
+- `on_trade` updates one open bar per timeframe: O(1) per tick.
+- Bars are aligned to the start of their session segment (PRE / REGULAR /
+  AFTER from core.session_calendar) and cut at its end, so a candle never
+  spans 09:30 or 16:00 and the overnight gap never lands inside one. Trades
+  while the market is CLOSED are ignored.
+- A bar closes when a trade of a later bucket arrives, or when `advance(now)`
+  is called more than BAR_CLOSE_GRACE_SECONDS past its end (timer-driven, so
+  a quiet symbol's last candle still closes; the grace absorbs feed latency
+  between a trade's exchange timestamp and the wall clock driving `advance`).
+  Each closed bar is handed to every subscriber, e.g.
+  PatternEngine.on_bar_close.
+- A trade older than its symbol's open bar, or stamped before the end of a
+  bar that already closed, is dropped and counted in `late_trades`: a closed
+  candle is never reopened or emitted twice.
+
+`resample_trades` is the vectorized path for historical tick arrays. For
+time-sorted trades it returns exactly the bars the incremental path emits:
+open/close are picked, high/low are max/min and volume is an integer sum, so
+no floating point reordering can creep in.
+
+Benchmark:
+    cd src && python -m market_data.bar_aggregator
+"""
+
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.system_config import BAR_CLOSE_GRACE_SECONDS, BAR_TIMEFRAMES_SECONDS
+from core.session_calendar import SessionCalendar, get_session_calendar
+from market_data.tick_store import FLAG_TRADE
+from models.data_models import Bar
+from telemetry.logger import get_logger
+
+log = get_logger("market_data.bar_aggregator")
+
+NS_PER_SECOND = 1_000_000_000
+
+BarCallback = Callable[[Bar], None]
+
+
+class _OpenBar:
+    """Mutable state of the candle currently being built."""
+
+    __slots__ = ("start_ns", "end_ns", "open", "high", "low", "close", "volume", "trade_count")
+
+    def __init__(self, start_ns: int, end_ns: int, price: float, size: int) -> None:
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.open = self.high = self.low = self.close = price
+        self.volume = size
+        self.trade_count = 1
+
+
+class _Segment:
+    """Cached session segment in epoch nanoseconds."""
+
+    __slots__ = ("start_ns", "end_ns", "session")
+
+    def __init__(self, start_ns: int, end_ns: int, session: str) -> None:
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.session = session
+
+
+class BarAggregator:
+    """Builds closed OHLCV bars for several timeframes from a trade stream."""
+
+    def __init__(
+        self,
+        timeframes_seconds: Sequence[int] = BAR_TIMEFRAMES_SECONDS,
+        calendar: Optional[SessionCalendar] = None,
+        close_grace_seconds: float = BAR_CLOSE_GRACE_SECONDS,
+    ) -> None:
+        log.info("[BOOT] BarAggregator instantiated — timeframes %s", ", ".join(f"{tf}s" for tf in timeframes_seconds))
+        self.timeframes_seconds: Tuple[int, ...] = tuple(sorted(timeframes_seconds))
+        self._timeframes_ns = tuple(tf * NS_PER_SECOND for tf in self.timeframes_seconds)
+        self.calendar = calendar or get_session_calendar()
+        self.close_grace_ns = int(close_grace_seconds * NS_PER_SECOND)
+        # symbol → one open bar slot per timeframe (None until the first trade)
+        self._open: Dict[str, List[Optional[_OpenBar]]] = {}
+        self._open_session: Dict[str, str] = {}
+        # symbol → end of its latest closed bar; older trades are late
+        self._closed_until: Dict[str, int] = {}
+        self._subscribers: List[Tuple[BarCallback, Optional[frozenset]]] = []
+        self._segment: Optional[_Segment] = None
+        self.bars_closed = 0
+        self.late_trades = 0
+        self.closed_market_trades = 0
+
+    # ----------------------------
+    # Subscriptions
+    # ----------------------------
+
+    def subscribe(self, callback: BarCallback, timeframes_seconds: Optional[Iterable[int]] = None) -> None:
+        """Call `callback(bar)` for every closed bar (optionally only some timeframes)."""
+
+        wanted = frozenset(timeframes_seconds) if timeframes_seconds is not None else None
+        self._subscribers.append((callback, wanted))
+
+    # ----------------------------
+    # Incremental path
+    # ----------------------------
+
+    def on_tick(self, symbol: str, timestamp_ns: int, last: float, size: float, flags: int) -> None:
+        """Feed one tick in TickStore layout; quote-only ticks do not build bars."""
+
+        if flags & FLAG_TRADE:
+            self.on_trade(symbol, timestamp_ns, last, size)
+
+    def on_trade(self, symbol: str, timestamp_ns: int, price: float, size: float) -> None:
+        if price != price:  # NaN price: nothing to chart
+            return
+        segment = self._segment_for(timestamp_ns)
+        if segment is None:
+            self.closed_market_trades += 1
+            return
+        if timestamp_ns < self._closed_until.get(symbol, 0):
+            # Its bucket was already emitted; reopening it would emit the candle twice.
+            self.late_trades += 1
+            return
+
+        slots = self._open.get(symbol)
+        if slots is None:
+            slots = self._open[symbol] = [None] * len(self._timeframes_ns)
+        shares = int(size)
+        offset = timestamp_ns - segment.start_ns
+
+        for index, timeframe_ns in enumerate(self._timeframes_ns):
+            start_ns = segment.start_ns + offset // timeframe_ns * timeframe_ns
+            bar = slots[index]
+            if bar is not None and bar.start_ns != start_ns:
+                if timestamp_ns < bar.start_ns:
+                    # Shortest timeframe decides; longer ones cannot be newer.
+                    self.late_trades += 1
+                    return
+                self._emit(symbol, index, bar)
+                bar = None
+            if bar is None:
+                slots[index] = _OpenBar(start_ns, min(start_ns + timeframe_ns, segment.end_ns), price, shares)
+                continue
+            if price > bar.high:
+                bar.high = price
+            if price < bar.low:
+                bar.low = price
+            bar.close = price
+            bar.volume += shares
+            bar.trade_count += 1
+        self._open_session[symbol] = segment.session
+
+    def advance(self, now_ns: int) -> int:
+        """Close every open bar that ended at least close_grace_ns before `now_ns`; returns how many closed."""
+
+        cutoff_ns = now_ns - self.close_grace_ns
+        closed = 0
+        for symbol, slots in self._open.items():
+            for index, bar in enumerate(slots):
+                if bar is not None and bar.end_ns <= cutoff_ns:
+                    self._emit(symbol, index, bar)
+                    slots[index] = None
+                    closed += 1
+        return closed
+
+    def open_bar(self, symbol: str, timeframe_seconds: int) -> Optional[Bar]:
+        """Snapshot of the candle still being built (not a close event)."""
+
+        slots = self._open.get(symbol)
+        if slots is None:
+            return None
+        bar = slots[self.timeframes_seconds.index(timeframe_seconds)]
+        return None if bar is None else self._to_bar(symbol, timeframe_seconds, bar, self._open_session[symbol])
+
+    def _segment_for(self, timestamp_ns: int) -> Optional[_Segment]:
+        segment = self._segment
+        if segment is not None and segment.start_ns <= timestamp_ns < segment.end_ns:
+            return segment
+        # Crossed a session boundary (rare): look the new segment up once
+        bounds = self.calendar.session_bounds_at(timestamp_ns / NS_PER_SECOND)
+        if bounds is None:
+            return None
+        start, end, session = bounds
+        self._segment = _Segment(int(start) * NS_PER_SECOND, int(end) * NS_PER_SECOND, session)
+        return self._segment
+
+    def _emit(self, symbol: str, index: int, bar: _OpenBar) -> None:
+        timeframe_seconds = self.timeframes_seconds[index]
+        closed = self._to_bar(symbol, timeframe_seconds, bar, self._open_session[symbol])
+        self.bars_closed += 1
+        if bar.end_ns > self._closed_until.get(symbol, 0):
+            self._closed_until[symbol] = bar.end_ns
+        for callback, wanted in self._subscribers:
+            if wanted is None or timeframe_seconds in wanted:
+                callback(closed)
+
+    @staticmethod
+    def _to_bar(symbol: str, timeframe_seconds: int, bar: _OpenBar, session: str) -> Bar:
+        return Bar(
+            symbol=symbol,
+            timeframe_seconds=timeframe_seconds,
+            start_ns=bar.start_ns,
+            end_ns=bar.end_ns,
+            open=bar.open,
+            high=bar.high,
+            low=bar.low,
+            close=bar.close,
+            volume=bar.volume,
+            trade_count=bar.trade_count,
+            session=session,
+        )
+
+
+# ================================
+# Vectorized path
+# ================================
+
+def _session_segments(timestamps_ns: np.ndarray, calendar: SessionCalendar) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """Session segments (start_ns, end_ns, name) covering the span of `timestamps_ns`."""
+
+    starts: List[int] = []
+    ends: List[int] = []
+    names: List[str] = []
+    if timestamps_ns.size == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), names
+    cursor = int(timestamps_ns.min())
+    last = int(timestamps_ns.max())
+    while cursor <= last:
+        bounds = calendar.session_bounds_at(cursor / NS_PER_SECOND)
+        if bounds is None:
+            # Jump to the next boundary (start of the next session)
+            transition_at, _ = calendar.next_transition(
+                datetime.fromtimestamp(cursor / NS_PER_SECOND, tz=timezone.utc)
+            )
+            cursor = int(transition_at.timestamp()) * NS_PER_SECOND
+            continue
+        start, end, session = bounds
+        starts.append(int(start) * NS_PER_SECOND)
+        ends.append(int(end) * NS_PER_SECOND)
+        names.append(session)
+        cursor = int(end) * NS_PER_SECOND
+    return np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64), names
+
+
+def resample_trades(
+    timestamps_ns: np.ndarray,
+    prices: np.ndarray,
+    sizes: np.ndarray,
+    timeframe_seconds: int,
+    calendar: Optional[SessionCalendar] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Resample time-sorted trades into session-aligned OHLCV bars.
+
+    Returns columns start_ns, end_ns, open, high, low, close, volume,
+    trade_count (one row per bar) and "session" (object array); `to_bars`
+    turns them into Bar objects.
+    """
+
+    calendar = calendar or get_session_calendar()
+    timestamps_ns = np.asarray(timestamps_ns, dtype=np.int64)
+    prices = np.asarray(prices, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.float64)
+
+    keep = ~np.isnan(prices)
+    seg_starts, seg_ends, seg_names = _session_segments(timestamps_ns[keep], calendar)
+    segment = np.searchsorted(seg_starts, timestamps_ns, side="right") - 1
+    in_session = keep & (segment >= 0)
+    in_session[in_session] &= timestamps_ns[in_session] < seg_ends[segment[in_session]]
+
+    timestamps_ns = timestamps_ns[in_session]
+    prices = prices[in_session]
+    shares = sizes[in_session].astype(np.int64)
+    segment = segment[in_session]
+
+    timeframe_ns = timeframe_seconds * NS_PER_SECOND
+    seg_start = seg_starts[segment]
+    bucket_start = seg_start + (timestamps_ns - seg_start) // timeframe_ns * timeframe_ns
+
+    if bucket_start.size == 0:
+        empty_i = np.zeros(0, dtype=np.int64)
+        empty_f = np.zeros(0, dtype=np.float64)
+        return {
+            "start_ns": empty_i, "end_ns": empty_i, "open": empty_f, "high": empty_f, "low": empty_f,
+            "close": empty_f, "volume": empty_i, "trade_count": empty_i, "session": np.zeros(0, dtype=object),
+        }
+
+    first = np.flatnonzero(np.concatenate(([True], bucket_start[1:] != bucket_start[:-1])))
+    last = np.concatenate((first[1:], [bucket_start.size])) - 1
+    bar_segment = segment[first]
+    return {
+        "start_ns": bucket_start[first],
+        "end_ns": np.minimum(bucket_start[first] + timeframe_ns, seg_ends[bar_segment]),
+        "open": prices[first],
+        "high": np.maximum.reduceat(prices, first),
+        "low": np.minimum.reduceat(prices, first),
+        "close": prices[last],
+        "volume": np.add.reduceat(shares, first),
+        "trade_count": last - first + 1,
+        "session": np.asarray(seg_names, dtype=object)[bar_segment],
+    }
+
+
+def to_bars(symbol: str, timeframe_seconds: int, columns: Dict[str, np.ndarray]) -> List[Bar]:
+    return [
+        Bar(
+            symbol=symbol,
+            timeframe_seconds=timeframe_seconds,
+            start_ns=start_ns,
+            end_ns=end_ns,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            trade_count=trade_count,
+            session=session,
+        )
+        for start_ns, end_ns, open_, high, low, close, volume, trade_count, session in zip(
+            columns["start_ns"].tolist(),
+            columns["end_ns"].tolist(),
+            columns["open"].tolist(),
+            columns["high"].tolist(),
+            columns["low"].tolist(),
+            columns["close"].tolist(),
+            columns["volume"].tolist(),
+            columns["trade_count"].tolist(),
+            columns["session"].tolist(),
+        )
+    ]
+
+
+if __name__ == "__main__":
+    import time
+
+    from telemetry.logger import set_default_level
+
+    set_default_level("WARN")
+    calendar = get_session_calendar()
+    # 08:00 ET → 16:30 ET on a regular trading day: crosses PRE → REGULAR → AFTER
+    day_start_ns = int(datetime(2025, 12, 16, 13, 0, tzinfo=timezone.utc).timestamp()) * NS_PER_SECOND
+    rng = np.random.default_rng(22)
+    count = 200_000
+    timestamps = np.sort(day_start_ns + rng.integers(0, int(8.5 * 3600) * NS_PER_SECOND, count))
+    prices = np.round(5.0 + np.cumsum(rng.normal(0, 0.01, count)), 4)
+    sizes = rng.integers(1, 50, count).astype(np.float64) * 100
+
+    closed: List[Bar] = []
+    aggregator = BarAggregator(calendar=calendar)
+    aggregator.subscribe(closed.append)
+    started = time.perf_counter()
+    for ts, price, size in zip(timestamps.tolist(), prices.tolist(), sizes.tolist()):
+        aggregator.on_trade("DEMO", ts, price, size)
+    aggregator.advance(int(timestamps[-1]) + 3600 * NS_PER_SECOND)
+    incremental_ns = (time.perf_counter() - started) * 1e9 / count
+
+    identical = True
+    started = time.perf_counter()
+    for timeframe in aggregator.timeframes_seconds:
+        batch = to_bars("DEMO", timeframe, resample_trades(timestamps, prices, sizes, timeframe, calendar))
+        streamed = [bar for bar in closed if bar.timeframe_seconds == timeframe]
+        identical &= batch == streamed
+    vectorized_ms = (time.perf_counter() - started) * 1000
+
+    sessions = {}
+    for bar in closed:
+        sessions[bar.session] = sessions.get(bar.session, 0) + 1
+    print(
+        f"[BENCH] {count:,} trades → {len(closed):,} bars over {aggregator.timeframes_seconds}s | "
+        f"incremental {incremental_ns:.0f}ns/trade | vectorized resample {vectorized_ms:.1f}ms | "
+        f"bit-identical={identical} | bars per session {sessions}"
+    )
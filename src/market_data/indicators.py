@@ -0,0 +1,609 @@
+"""
+Streaming and vectorized technical indicators (EMA, MACD, RSI, ATR, VWAP).
+
+Phase 5: ScannerResult has trend_direction / trend_strength and the scanner
+payload a volatility_risk_flag, but nothing computed them, and the momentum
+rules in the blueprint read VWAP, the 9 / 20 EMA and MACD. Every indicator
+here has two modes over the same state:
+
+- `update(...)` folds one new bar (or tick) into a few floats held in
+  __slots__: O(1), no history kept. It returns the current value, or None
+  while the indicator is still warming up.
+- `warm_up(arrays)` computes the whole series with NumPy (NaN while warming
+  up) and leaves the instance in the state streaming those inputs would
+  have reached, so live updates continue from a vectorized backfill. The batch
+  functions `ema`, `macd`, `rsi`, `atr` and `vwap` are `warm_up` on a fresh
+  instance, for backtests.
+
+Definitions (shared by both modes):
+- EMA(p): alpha = 2 / (p + 1), seeded with the SMA of the first p inputs.
+- MACD(12, 26, 9): EMA12 - EMA26; signal = EMA9 of that line; histogram =
+  line - signal.
+- RSI(14), ATR(14): Wilder smoothing (alpha = 1 / p) seeded with the SMA of
+  the first p gains / losses / true ranges. The first true range is
+  high - low.
+- VWAP: cumulative price × volume / cumulative volume since the anchor
+  changed. Bars use the typical price (H + L + C) / 3 and are anchored on the
+  trading day, premarket included.
+
+The recursive averages are vectorized block by block: inside a block
+y[j] = d^(j+1) · (y0 + alpha · cumsum(x[k] / d^(k+1))), and blocks stop
+before d^-k reaches 1e6, so batch and streaming values agree to ~1e-12
+relative. VWAP sums in the same order in both modes and agrees exactly.
+
+IndicatorEngine subscribes to BarAggregator, keeps one IndicatorSet per
+symbol and timeframe (about 1.5 KiB) and derives the scanner's trend context
+from the INDICATOR_TREND_TIMEFRAME_SECONDS set.
+
+Benchmark:
+    cd src && python -m market_data.indicators
+"""
+
+import math
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+
+from config.system_config import (
+    INDICATOR_ATR_PERIOD,
+    INDICATOR_EMA_FAST_PERIOD,
+    INDICATOR_EMA_SLOW_PERIOD,
+    INDICATOR_MACD_PERIODS,
+    INDICATOR_RSI_PERIOD,
+    INDICATOR_TREND_TIMEFRAME_SECONDS,
+    VOLATILITY_RISK_ATR_PERCENT,
+)
+from models.data_models import Bar, ScannerResult
+from telemetry.logger import get_logger
+
+log = get_logger("market_data.indicators")
+
+NS_PER_DAY = 86_400 * 1_000_000_000
+# Sessions run 04:00 → 20:00 ET, i.e. 08:00/09:00 → 00:00/01:00 UTC. Shifting
+# UTC back 4 hours keeps every session minute on its own ET calendar day in
+# both EST and EDT, so the trading day is a single integer division.
+_TRADING_DAY_SHIFT_NS = 4 * 3600 * 1_000_000_000
+
+# Smallest decay factor allowed inside one vectorized block (bounds d^-k)
+_MIN_BLOCK_DECAY = 1e-6
+
+
+def trading_day(timestamp_ns):
+    """Trading-day number of a UTC epoch-ns timestamp (scalar or int64 array)."""
+
+    return (timestamp_ns - _TRADING_DAY_SHIFT_NS) // NS_PER_DAY
+
+
+def typical_price(high, low, close):
+    return (high + low + close) / 3.0
+
+
+def _exponential_average(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    """SMA-seeded y[t] = y[t-1] + alpha * (x[t] - y[t-1]); NaN before the seed."""
+
+    count = len(values)
+    out = np.full(count, np.nan)
+    if count < period:
+        return out
+    # cumsum adds left to right, like the streaming warm-up sum
+    out[period - 1] = np.cumsum(values[:period])[-1] / period
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[period:] = values[period:]
+        return out
+
+    block = max(1, int(math.log(_MIN_BLOCK_DECAY) / math.log(decay)))
+    powers = decay ** np.arange(1, block + 1)
+    previous = out[period - 1]
+    for start in range(period, count, block):
+        chunk = values[start:start + block]
+        scale = powers[:len(chunk)]
+        smoothed = scale * (previous + alpha * np.cumsum(chunk / scale))
+        out[start:start + len(chunk)] = smoothed
+        previous = smoothed[-1]
+    return out
+
+
+# ----------------------------
+# Streaming indicators
+# ----------------------------
+
+class EMA:
+    """Exponential moving average seeded with the SMA of the first `period` inputs."""
+
+    __slots__ = ("period", "alpha", "count", "_value")
+
+    def __init__(self, period: int, alpha: Optional[float] = None) -> None:
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.alpha = 2.0 / (period + 1) if alpha is None else alpha
+        self.count = 0
+        self._value = 0.0  # running sum until `period` inputs have been seen
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._value if self.count >= self.period else None
+
+    def update(self, x: float) -> Optional[float]:
+        self.count += 1
+        if self.count > self.period:
+            self._value += self.alpha * (x - self._value)
+            return self._value
+        self._value += x
+        if self.count < self.period:
+            return None
+        self._value /= self.period
+        return self._value
+
+    def warm_up(self, values) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        self._require_fresh()
+        out = _exponential_average(values, self.period, self.alpha)
+        self.count = len(values)
+        if self.count >= self.period:
+            self._value = float(out[-1])
+        elif self.count:
+            self._value = float(np.cumsum(values)[-1])
+        return out
+
+    def _require_fresh(self) -> None:
+        if self.count:
+            raise ValueError(f"{type(self).__name__}.warm_up needs a fresh instance ({self.count} inputs seen)")
+
+
+class WilderAverage(EMA):
+    """Wilder's smoothing: an EMA with alpha = 1 / period."""
+
+    __slots__ = ()
+
+    def __init__(self, period: int) -> None:
+        super().__init__(period, alpha=1.0 / period)
+
+
+class MACD:
+    """MACD line, signal line and histogram; `update` returns the histogram."""
+
+    __slots__ = ("fast", "slow", "signal", "line", "histogram")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        if fast >= slow:
+            raise ValueError(f"MACD fast period must be shorter than slow ({fast} >= {slow})")
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal = EMA(signal)
+        self.line: Optional[float] = None
+        self.histogram: Optional[float] = None
+
+    def update(self, close: float) -> Optional[float]:
+        fast = self.fast.update(close)
+        slow = self.slow.update(close)
+        if slow is None:
+            return None
+        self.line = fast - slow
+        signal = self.signal.update(self.line)
+        if signal is None:
+            return None
+        self.histogram = self.line - signal
+        return self.histogram
+
+    def warm_up(self, close) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns (line, signal, histogram) arrays."""
+
+        close = np.asarray(close, dtype=np.float64)
+        line = self.fast.warm_up(close) - self.slow.warm_up(close)
+        signal = np.full(len(close), np.nan)
+        first = self.slow.period - 1
+        if len(close) > first:
+            signal[first:] = self.signal.warm_up(line[first:])
+            self.line = float(line[-1])
+        histogram = line - signal
+        if self.signal.value is not None:
+            self.histogram = float(histogram[-1])
+        return line, signal, histogram
+
+
+def _relative_strength(gain: float, loss: float) -> float:
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else 50.0
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+class RSI:
+    """Wilder's relative strength index (0–100)."""
+
+    __slots__ = ("gain", "loss", "previous", "value")
+
+    def __init__(self, period: int = 14) -> None:
+        self.gain = WilderAverage(period)
+        self.loss = WilderAverage(period)
+        self.previous: Optional[float] = None
+        self.value: Optional[float] = None
+
+    def update(self, close: float) -> Optional[float]:
+        previous = self.previous
+        self.previous = close
+        if previous is None:
+            return None
+        change = close - previous
+        gain = self.gain.update(change if change > 0.0 else 0.0)
+        loss = self.loss.update(-change if change < 0.0 else 0.0)
+        if gain is None:
+            return None
+        self.value = _relative_strength(gain, loss)
+        return self.value
+
+    def warm_up(self, close) -> np.ndarray:
+        close = np.asarray(close, dtype=np.float64)
+        out = np.full(len(close), np.nan)
+        if len(close) == 0:
+            return out
+        change = np.diff(close)
+        gain = self.gain.warm_up(np.where(change > 0.0, change, 0.0))
+        loss = self.loss.warm_up(np.where(change < 0.0, -change, 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            strength = 100.0 - 100.0 / (1.0 + gain / loss)
+        strength = np.where(loss == 0.0, np.where(gain > 0.0, 100.0, 50.0), strength)
+        out[1:] = np.where(np.isnan(gain), np.nan, strength)
+        self.previous = float(close[-1])
+        if self.gain.value is not None:
+            self.value = float(out[-1])
+        return out
+
+
+class ATR:
+    """Wilder's average true range."""
+
+    __slots__ = ("average", "previous_close")
+
+    def __init__(self, period: int = 14) -> None:
+        self.average = WilderAverage(period)
+        self.previous_close: Optional[float] = None
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.average.value
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        previous = self.previous_close
+        self.previous_close = close
+        true_range = high - low
+        if previous is not None:
+            true_range = max(true_range, abs(high - previous), abs(low - previous))
+        return self.average.update(true_range)
+
+    def warm_up(self, high, low, close) -> np.ndarray:
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+        true_range = high - low
+        true_range[1:] = np.maximum(
+            true_range[1:],
+            np.maximum(np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])),
+        )
+        out = self.average.warm_up(true_range)
+        if len(close):
+            self.previous_close = float(close[-1])
+        return out
+
+
+class VWAP:
+    """Volume-weighted average price since the anchor (e.g. trading day) last changed."""
+
+    __slots__ = ("anchor", "price_volume", "volume", "value")
+
+    def __init__(self) -> None:
+        self.anchor = None
+        self.price_volume = 0.0
+        self.volume = 0
+        self.value: Optional[float] = None
+
+    def update(self, price: float, volume: float, anchor=None) -> Optional[float]:
+        if anchor != self.anchor:
+            self.anchor = anchor
+            self.price_volume = 0.0
+            self.volume = 0
+            self.value = None
+        self.price_volume += price * volume
+        self.volume += volume
+        if self.volume > 0:
+            self.value = self.price_volume / self.volume
+        return self.value
+
+    def warm_up(self, price, volume, anchors=None) -> np.ndarray:
+        price = np.asarray(price, dtype=np.float64)
+        volume = np.asarray(volume)
+        count = len(price)
+        out = np.full(count, np.nan)
+        if count == 0:
+            return out
+        if anchors is None:
+            starts = np.zeros(1, dtype=np.int64)
+        else:
+            anchors = np.asarray(anchors)
+            starts = np.flatnonzero(np.concatenate(([True], anchors[1:] != anchors[:-1])))
+        stops = np.append(starts[1:], count)
+        # One cumsum per anchor period so the sums match streaming order exactly
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            price_volume = np.cumsum(price[start:stop] * volume[start:stop])
+            cumulative_volume = np.cumsum(volume[start:stop])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                out[start:stop] = np.where(cumulative_volume > 0, price_volume / cumulative_volume, np.nan)
+        self.anchor = None if anchors is None else anchors[-1].item()
+        self.price_volume = float(price_volume[-1])
+        self.volume = cumulative_volume[-1].item()
+        self.value = None if np.isnan(out[-1]) else float(out[-1])
+        return out
+
+
+# ----------------------------
+# Batch functions (backtests)
+# ----------------------------
+
+def ema(values, period: int) -> np.ndarray:
+    return EMA(period).warm_up(values)
+
+
+def macd(close, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return MACD(fast, slow, signal).warm_up(close)
+
+
+def rsi(close, period: int = 14) -> np.ndarray:
+    return RSI(period).warm_up(close)
+
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    return ATR(period).warm_up(high, low, close)
+
+
+def vwap(price, volume, anchors=None) -> np.ndarray:
+    return VWAP().warm_up(price, volume, anchors)
+
+
+# ----------------------------
+# Per-symbol bundle
+# ----------------------------
+
+INDICATOR_FIELDS = (
+    "ema_fast", "ema_slow", "macd", "macd_signal", "macd_histogram", "rsi", "atr", "vwap",
+)
+
+
+class IndicatorSet:
+    """All configured indicators for one symbol and timeframe, updated per closed bar."""
+
+    __slots__ = ("ema_fast", "ema_slow", "macd", "rsi", "atr", "vwap", "close", "bar_count")
+
+    def __init__(
+        self,
+        ema_fast_period: int = INDICATOR_EMA_FAST_PERIOD,
+        ema_slow_period: int = INDICATOR_EMA_SLOW_PERIOD,
+        macd_periods: Tuple[int, int, int] = INDICATOR_MACD_PERIODS,
+        rsi_period: int = INDICATOR_RSI_PERIOD,
+        atr_period: int = INDICATOR_ATR_PERIOD,
+    ) -> None:
+        self.ema_fast = EMA(ema_fast_period)
+        self.ema_slow = EMA(ema_slow_period)
+        self.macd = MACD(*macd_periods)
+        self.rsi = RSI(rsi_period)
+        self.atr = ATR(atr_period)
+        self.vwap = VWAP()
+        self.close: Optional[float] = None
+        self.bar_count = 0
+
+    def update(self, bar: Bar) -> None:
+        close = bar.close
+        self.ema_fast.update(close)
+        self.ema_slow.update(close)
+        self.macd.update(close)
+        self.rsi.update(close)
+        self.atr.update(bar.high, bar.low, close)
+        self.vwap.update(typical_price(bar.high, bar.low, close), bar.volume, trading_day(bar.start_ns))
+        self.close = close
+        self.bar_count += 1
+
+    def warm_up(self, columns: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Backfill from bar columns (high, low, close, volume, start_ns — the
+        layout of bar_aggregator.resample_trades) and return every indicator
+        series keyed like `snapshot`.
+        """
+
+        high = np.asarray(columns["high"], dtype=np.float64)
+        low = np.asarray(columns["low"], dtype=np.float64)
+        close = np.asarray(columns["close"], dtype=np.float64)
+        line, signal, histogram = self.macd.warm_up(close)
+        series = {
+            "ema_fast": self.ema_fast.warm_up(close),
+            "ema_slow": self.ema_slow.warm_up(close),
+            "macd": line,
+            "macd_signal": signal,
+            "macd_histogram": histogram,
+            "rsi": self.rsi.warm_up(close),
+            "atr": self.atr.warm_up(high, low, close),
+            "vwap": self.vwap.warm_up(
+                typical_price(high, low, close),
+                np.asarray(columns["volume"]),
+                trading_day(np.asarray(columns["start_ns"], dtype=np.int64)),
+            ),
+        }
+        if len(close):
+            self.close = float(close[-1])
+        self.bar_count += len(close)
+        return series
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        return {
+            "ema_fast": self.ema_fast.value,
+            "ema_slow": self.ema_slow.value,
+            "macd": self.macd.line,
+            "macd_signal": self.macd.signal.value,
+            "macd_histogram": self.macd.histogram,
+            "rsi": self.rsi.value,
+            "atr": self.atr.value,
+            "vwap": self.vwap.value,
+        }
+
+
+class IndicatorEngine:
+    """IndicatorSets per (symbol, timeframe), fed by BarAggregator bar closes."""
+
+    def __init__(
+        self,
+        trend_timeframe_seconds: int = INDICATOR_TREND_TIMEFRAME_SECONDS,
+        volatility_risk_atr_percent: float = VOLATILITY_RISK_ATR_PERCENT,
+    ) -> None:
+        log.info(
+            "[BOOT] IndicatorEngine instantiated — trend from %ss bars, volatility risk at ATR >= %s%% of price",
+            trend_timeframe_seconds,
+            volatility_risk_atr_percent,
+        )
+        self.trend_timeframe_seconds = trend_timeframe_seconds
+        self.volatility_risk_atr_percent = volatility_risk_atr_percent
+        self._sets: Dict[Tuple[str, int], IndicatorSet] = {}
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+    def on_bar_close(self, bar: Bar) -> None:
+        """BarAggregator subscriber: fold the closed candle into its IndicatorSet."""
+
+        self._set_for(bar.symbol, bar.timeframe_seconds).update(bar)
+
+    def warm_up(self, symbol: str, timeframe_seconds: int, columns: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Replace the symbol's state with a vectorized backfill from historical bar columns."""
+
+        indicators = self._sets[(symbol, timeframe_seconds)] = IndicatorSet()
+        return indicators.warm_up(columns)
+
+    def indicators(self, symbol: str, timeframe_seconds: Optional[int] = None) -> Optional[IndicatorSet]:
+        return self._sets.get((symbol, timeframe_seconds or self.trend_timeframe_seconds))
+
+    def trend_context(self, symbol: str) -> Dict:
+        """
+        Scanner trend fields from the trend-timeframe indicators:
+
+        - trend_direction: UP when EMA fast > EMA slow and price is above VWAP,
+          DOWN when both point down, otherwise SIDEWAYS.
+        - trend_strength: EMA fast - EMA slow in ATRs (signed, 2 dp).
+        - volatility_risk_flag: ATR >= volatility_risk_atr_percent of price.
+
+        Fields stay None (N/A) until enough bars have closed.
+        """
+
+        context = {"trend_direction": None, "trend_strength": None, "volatility_risk_flag": None}
+        indicators = self.indicators(symbol)
+        if indicators is None:
+            return context
+        close = indicators.close
+        fast = indicators.ema_fast.value
+        slow = indicators.ema_slow.value
+        average_range = indicators.atr.value
+        vwap_value = indicators.vwap.value
+        if fast is not None and slow is not None and vwap_value is not None:
+            if fast > slow and close > vwap_value:
+                context["trend_direction"] = "UP"
+            elif fast < slow and close < vwap_value:
+                context["trend_direction"] = "DOWN"
+            else:
+                context["trend_direction"] = "SIDEWAYS"
+        if average_range is not None:
+            if fast is not None and slow is not None and average_range > 0:
+                context["trend_strength"] = round((fast - slow) / average_range, 2)
+            context["volatility_risk_flag"] = average_range * 100.0 >= self.volatility_risk_atr_percent * close
+        return context
+
+    def annotate(self, result: ScannerResult) -> ScannerResult:
+        """Fill trend_direction / trend_strength / volatility_risk_flag of a ScannerResult."""
+
+        for field_name, value in self.trend_context(result.symbol).items():
+            setattr(result, field_name, value)
+        return result
+
+    def forget_symbols(self, symbols: Iterable[str]) -> None:
+        dropped = set(symbols)
+        for key in [key for key in self._sets if key[0] in dropped]:
+            del self._sets[key]
+
+    def _set_for(self, symbol: str, timeframe_seconds: int) -> IndicatorSet:
+        key = (symbol, timeframe_seconds)
+        indicators = self._sets.get(key)
+        if indicators is None:
+            indicators = self._sets[key] = IndicatorSet()
+        return indicators
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from datetime import datetime, timezone
+
+    from market_data.bar_aggregator import NS_PER_SECOND, resample_trades, to_bars
+    from telemetry.logger import set_default_level
+
+    set_default_level("WARN")
+    # Five trading days of trades, 08:00 → 16:30 ET, resampled to 1m bars
+    rng = np.random.default_rng(23)
+    per_day = 40_000
+    timestamps, prices = [], []
+    price = 5.0
+    for day in (15, 16, 17, 18, 19):
+        day_start_ns = int(datetime(2025, 12, day, 13, 0, tzinfo=timezone.utc).timestamp()) * NS_PER_SECOND
+        timestamps.append(np.sort(day_start_ns + rng.integers(0, int(8.5 * 3600) * NS_PER_SECOND, per_day)))
+        steps = np.cumsum(rng.normal(0, 0.01, per_day))
+        prices.append(np.round(price + steps, 4))
+        price = float(prices[-1][-1])
+    timestamps = np.concatenate(timestamps)
+    prices = np.concatenate(prices)
+    sizes = rng.integers(1, 50, len(prices)).astype(np.float64) * 100
+    columns = resample_trades(timestamps, prices, sizes, 60)
+    bars = to_bars("DEMO", 60, columns)
+
+    started = time.perf_counter()
+    streaming = IndicatorSet()
+    streamed = {name: np.full(len(bars), np.nan) for name in INDICATOR_FIELDS}
+    for index, bar in enumerate(bars):
+        streaming.update(bar)
+        for name, value in streaming.snapshot().items():
+            if value is not None:
+                streamed[name][index] = value
+    streaming_us = (time.perf_counter() - started) * 1e6 / len(bars)
+
+    started = time.perf_counter()
+    batch = IndicatorSet().warm_up(columns)
+    batch_ms = (time.perf_counter() - started) * 1000
+
+    worst = max(
+        float(np.nanmax(np.abs(streamed[name] - batch[name]) / np.maximum(np.abs(batch[name]), 1.0)))
+        for name in INDICATOR_FIELDS
+    )
+    same_warm_up = all(np.array_equal(np.isnan(streamed[name]), np.isnan(batch[name])) for name in INDICATOR_FIELDS)
+
+    # Warm up on the first half with NumPy, stream the rest
+    half = len(bars) // 2
+    resumed = IndicatorSet()
+    resumed.warm_up({name: column[:half] for name, column in columns.items()})
+    for bar in bars[half:]:
+        resumed.update(bar)
+    resume_error = max(
+        abs(value - streaming.snapshot()[name]) for name, value in resumed.snapshot().items()
+    )
+
+    tracemalloc.start()
+    engine = IndicatorEngine()
+    for bar in bars[:60]:
+        for symbol_index in range(1000):
+            engine.on_bar_close(Bar(f"SYM{symbol_index:04d}", 60, bar.start_ns, bar.end_ns, bar.open,
+                                    bar.high, bar.low, bar.close, bar.volume, bar.trade_count, bar.session))
+    per_symbol_bytes = tracemalloc.get_traced_memory()[0] / len(engine)
+    tracemalloc.stop()
+
+    print(
+        f"[BENCH] {len(bars)} 1m bars | streaming {streaming_us:.1f}us/bar | batch {batch_ms:.1f}ms | "
+        f"max relative diff {worst:.1e} | same warm-up={same_warm_up} | warm_up+stream diff {resume_error:.1e}"
+    )
+    print(f"[BENCH] {len(engine)} symbols tracked, ~{per_symbol_bytes / 1024:.1f} KiB each")
+    # Trend context and snapshot of the same full DEMO series
+    engine.warm_up("DEMO", 60, columns)
+    print(f"[BENCH] DEMO: {engine.trend_context('DEMO')} "
+          f"{dict((k, round(v, 3)) for k, v in streaming.snapshot().items())}")
@@ -0,0 +1,106 @@
+"""
+Simulated tick feed for the event-driven runtime.
+
+Phase 5: core.event_runtime wakes the orchestrator on data events, but the
+teaching system has no market data connection, so nothing published a tick
+and EVENT_DRIVEN mode only ever woke on its heartbeat. TeachingTickFeed
+stands in for a real feed / broker callback until one exists:
+
+- A background thread publishes trade ticks through a callback (normally
+  EventDrivenRuntime.publish_tick), so ticks reach TickStore, BarAggregator
+  and IndicatorEngine and the runtime can measure event-to-intent latency.
+- Ticks arrive as a Poisson process with TEACHING_FEED_TICKS_PER_SECOND on
+  average, each on a random symbol of the universe.
+- Prices random-walk in one-cent steps from each symbol's reference price;
+  bid and ask sit one cent either side of the trade.
+- Symbols, prices and sizes are reproducible for a seed; only the wall-clock
+  timestamps differ between runs.
+
+A live data adapter replaces it by calling the same publish_* methods.
+
+Demo:
+    cd src && python -m market_data.teaching_feed
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from config.system_config import TEACHING_FEED_SEED, TEACHING_FEED_TICKS_PER_SECOND
+from market_data.tick_store import FLAG_QUOTE, FLAG_TRADE
+from telemetry.logger import get_logger
+
+log = get_logger("market_data.teaching_feed")
+
+
+class TeachingTickFeed:
+    """Publish simulated trade ticks for a fixed universe on a daemon thread."""
+
+    def __init__(
+        self,
+        publish_tick: Callable[..., None],
+        reference_prices: Dict[str, float],
+        ticks_per_second: float = TEACHING_FEED_TICKS_PER_SECOND,
+        seed: int = TEACHING_FEED_SEED,
+    ) -> None:
+        log.info(
+            "[BOOT] TeachingTickFeed instantiated — %s symbol(s), ~%s simulated tick(s)/sec",
+            len(reference_prices),
+            ticks_per_second,
+        )
+        self.publish_tick = publish_tick
+        self.ticks_per_second = ticks_per_second
+        self._symbols = sorted(reference_prices)
+        self._prices = {symbol: round(price, 2) for symbol, price in reference_prices.items()}
+        self._rng = random.Random(seed)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.ticks_published = 0
+
+    def start(self) -> "TeachingTickFeed":
+        if self._thread is None and self._symbols and self.ticks_per_second > 0:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="teaching-feed", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            log.info("[SHUTDOWN] TeachingTickFeed stopped — published=%s", self.ticks_published)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._rng.expovariate(self.ticks_per_second)):
+            self.publish_next()
+
+    def publish_next(self) -> None:
+        """Publish one simulated trade tick (also usable without the thread)."""
+
+        symbol = self._rng.choice(self._symbols)
+        last = max(round(self._prices[symbol] + self._rng.choice((-0.01, 0.0, 0.01)), 2), 0.01)
+        self._prices[symbol] = last
+        self.publish_tick(
+            symbol,
+            bid=round(last - 0.01, 2),
+            ask=round(last + 0.01, 2),
+            last=last,
+            size=float(self._rng.choice((100, 200, 500, 1000))),
+            flags=FLAG_TRADE | FLAG_QUOTE,
+            timestamp_ns=time.time_ns(),
+        )
+        self.ticks_published += 1
+
+
+if __name__ == "__main__":
+    received = []
+    feed = TeachingTickFeed(
+        lambda symbol, **payload: received.append((symbol, payload["last"])),
+        {"ABC": 4.20, "XYZ": 12.50},
+        ticks_per_second=200.0,
+    ).start()
+    time.sleep(0.5)
+    feed.stop()
+    print(f"[DEMO] {len(received)} ticks in 0.5s; first: {received[:3]}")
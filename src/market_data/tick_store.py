@@ -0,0 +1,298 @@
+"""
+Preallocated per-symbol tick ring buffers for quotes and trades.
+
+Phase 5: every cycle saw one snapshot dict per symbol, so pattern detection
+had no intraday history to look at. TickStore keeps the most recent ticks of
+each symbol in fixed-size NumPy columns:
+
+- timestamp_ns (int64), bid / ask / last / size (float64), flags (uint8).
+- `append` writes scalars into preallocated arrays: O(1), no allocation.
+- Each column is mirrored (every tick is written at `i` and `i + capacity`),
+  so the last n ≤ capacity ticks are always one contiguous slice and
+  `window` / `since` return zero-copy views instead of stitching the wrap.
+- Capacity per symbol (TICK_STORE_CAPACITY_PER_SYMBOL) fixes the memory
+  per symbol; at most TICK_STORE_MAX_SYMBOLS buffers exist at once.
+- `retain(symbols)` is called with each scan's symbols; a buffer whose
+  symbol has been missing for TICK_STORE_EVICT_AFTER_SCANS scans is evicted
+  and recycled for the next new symbol.
+
+Views read the live buffer: they stay valid until `capacity` more ticks of
+that symbol arrive, so consumers copy what they keep across cycles. There is
+one writer (the feed / event loop thread).
+
+Benchmark:
+    cd src && python -m market_data.tick_store
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from config.system_config import (
+    TICK_STORE_CAPACITY_PER_SYMBOL,
+    TICK_STORE_EVICT_AFTER_SCANS,
+    TICK_STORE_MAX_SYMBOLS,
+)
+from telemetry.logger import get_logger
+
+log = get_logger("market_data.tick_store")
+
+# Tick flags (bit field)
+FLAG_TRADE = 1
+FLAG_QUOTE = 2
+FLAG_AT_BID = 4
+FLAG_AT_ASK = 8
+
+TICK_COLUMNS = ("timestamp_ns", "bid", "ask", "last", "size", "flags")
+
+# Bytes per stored tick across all columns (int64 + 4 × float64 + uint8)
+BYTES_PER_TICK = 8 + 4 * 8 + 1
+
+
+class TickWindow(NamedTuple):
+    """Zero-copy, read-only views over a run of consecutive ticks."""
+
+    timestamp_ns: np.ndarray
+    bid: np.ndarray
+    ask: np.ndarray
+    last: np.ndarray
+    size: np.ndarray
+    flags: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp_ns)
+
+    def copy(self) -> "TickWindow":
+        return TickWindow(*(column.copy() for column in self))
+
+    def trades(self) -> "TickWindow":
+        """Trade prints only (boolean-mask copy, not a view)."""
+
+        mask = (self.flags & FLAG_TRADE) != 0
+        return TickWindow(*(column[mask] for column in self))
+
+
+class TickRing:
+    """Mirrored ring buffer holding the latest `capacity` ticks of one symbol."""
+
+    __slots__ = ("capacity", "count", "head", "timestamp_ns", "bid", "ask", "last", "size", "flags")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.count = 0  # ticks ever appended since (re)assignment
+        self.head = 0  # next write position in [0, capacity)
+        self.timestamp_ns = np.zeros(2 * capacity, dtype=np.int64)
+        self.bid = np.zeros(2 * capacity, dtype=np.float64)
+        self.ask = np.zeros(2 * capacity, dtype=np.float64)
+        self.last = np.zeros(2 * capacity, dtype=np.float64)
+        self.size = np.zeros(2 * capacity, dtype=np.float64)
+        self.flags = np.zeros(2 * capacity, dtype=np.uint8)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.head = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, timestamp_ns: int, bid: float, ask: float, last: float, size: float, flags: int) -> None:
+        head = self.head
+        mirror = head + self.capacity
+        self.timestamp_ns[head] = self.timestamp_ns[mirror] = timestamp_ns
+        self.bid[head] = self.bid[mirror] = bid
+        self.ask[head] = self.ask[mirror] = ask
+        self.last[head] = self.last[mirror] = last
+        self.size[head] = self.size[mirror] = size
+        self.flags[head] = self.flags[mirror] = flags
+        self.head = head + 1 if head + 1 < self.capacity else 0
+        self.count += 1
+
+    def window(self, n: Optional[int] = None) -> TickWindow:
+        """The last n ticks (all retained ticks when n is None), oldest first."""
+
+        available = len(self)
+        n = available if n is None else max(0, min(n, available))
+        # The newest tick sits at head - 1; its mirror copy at head + capacity - 1
+        # ends a run of `capacity` consecutive ticks, so any suffix is contiguous.
+        stop = self.head + self.capacity
+        start = stop - n
+        return TickWindow(*(self._view(column, start, stop) for column in self._columns()))
+
+    def since(self, timestamp_ns: int) -> TickWindow:
+        """Retained ticks with timestamp >= timestamp_ns (timestamps must be non-decreasing)."""
+
+        full = self.window()
+        skip = int(np.searchsorted(full.timestamp_ns, timestamp_ns, side="left"))
+        return TickWindow(*(column[skip:] for column in full))
+
+    def _columns(self):
+        return self.timestamp_ns, self.bid, self.ask, self.last, self.size, self.flags
+
+    @staticmethod
+    def _view(column: np.ndarray, start: int, stop: int) -> np.ndarray:
+        view = column[start:stop]
+        view.flags.writeable = False
+        return view
+
+
+class TickStore:
+    """Per-symbol TickRings with a bounded, recycled pool of buffers."""
+
+    def __init__(
+        self,
+        capacity_per_symbol: int = TICK_STORE_CAPACITY_PER_SYMBOL,
+        max_symbols: int = TICK_STORE_MAX_SYMBOLS,
+        evict_after_scans: int = TICK_STORE_EVICT_AFTER_SCANS,
+    ) -> None:
+        log.info(
+            "[BOOT] TickStore instantiated — %s ticks/symbol (%.1f KiB), up to %s symbol(s)",
+            capacity_per_symbol,
+            capacity_per_symbol * 2 * BYTES_PER_TICK / 1024,
+            max_symbols,
+        )
+        self.capacity_per_symbol = capacity_per_symbol
+        self.max_symbols = max_symbols
+        self.evict_after_scans = evict_after_scans
+        self._rings: Dict[str, TickRing] = {}
+        self._free: List[TickRing] = []
+        self._missed_scans: Dict[str, int] = {}
+        self.ticks_dropped = 0
+        self.evictions = 0
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rings
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    def symbols(self) -> List[str]:
+        return list(self._rings)
+
+    @property
+    def bytes_allocated(self) -> int:
+        return (len(self._rings) + len(self._free)) * self.capacity_per_symbol * 2 * BYTES_PER_TICK
+
+    # ----------------------------
+    # Writes
+    # ----------------------------
+
+    def append(
+        self,
+        symbol: str,
+        timestamp_ns: int,
+        bid: float = np.nan,
+        ask: float = np.nan,
+        last: float = np.nan,
+        size: float = 0.0,
+        flags: int = 0,
+    ) -> bool:
+        """Store one tick; False when the pool is full and the tick was dropped."""
+
+        ring = self._rings.get(symbol)
+        if ring is None:
+            ring = self._assign(symbol)
+            if ring is None:
+                return False
+        ring.append(timestamp_ns, bid, ask, last, size, flags)
+        return True
+
+    def _assign(self, symbol: str) -> Optional[TickRing]:
+        if self._free:
+            ring = self._free.pop()
+            ring.reset()
+        elif len(self._rings) < self.max_symbols:
+            ring = TickRing(self.capacity_per_symbol)
+        else:
+            self.ticks_dropped += 1
+            if self.ticks_dropped == 1:
+                log.warn(
+                    "[TICKS] Tick store full (%s symbols) — dropping ticks for new symbols such as %s",
+                    self.max_symbols,
+                    symbol,
+                )
+            return None
+        self._rings[symbol] = ring
+        self._missed_scans[symbol] = 0
+        return ring
+
+    # ----------------------------
+    # Reads (zero-copy)
+    # ----------------------------
+
+    def ring(self, symbol: str) -> Optional[TickRing]:
+        return self._rings.get(symbol)
+
+    def window(self, symbol: str, n: Optional[int] = None) -> Optional[TickWindow]:
+        ring = self._rings.get(symbol)
+        return ring.window(n) if ring is not None else None
+
+    def since(self, symbol: str, timestamp_ns: int) -> Optional[TickWindow]:
+        ring = self._rings.get(symbol)
+        return ring.since(timestamp_ns) if ring is not None else None
+
+    # ----------------------------
+    # Eviction
+    # ----------------------------
+
+    def retain(self, scanned_symbols: Iterable[str]) -> List[str]:
+        """
+        Record one scan's symbols and evict buffers whose symbol has been
+        absent from the last `evict_after_scans` scans. Returns the evicted symbols.
+        """
+
+        scanned = set(scanned_symbols)
+        evicted = []
+        for symbol in list(self._rings):
+            if symbol in scanned:
+                self._missed_scans[symbol] = 0
+                continue
+            self._missed_scans[symbol] += 1
+            if self._missed_scans[symbol] >= self.evict_after_scans:
+                self.evict(symbol)
+                evicted.append(symbol)
+        if evicted:
+            log.debug("[TICKS] Evicted %s tick buffer(s) no longer in the scan: %s", len(evicted), evicted)
+        return evicted
+
+    def evict(self, symbol: str) -> None:
+        ring = self._rings.pop(symbol, None)
+        self._missed_scans.pop(symbol, None)
+        if ring is not None:
+            self._free.append(ring)
+            self.evictions += 1
+
+
+if __name__ == "__main__":
+    import time
+
+    from telemetry.logger import set_default_level
+
+    set_default_level("WARN")
+    store = TickStore(max_symbols=500)
+    symbols = [f"SYM{index:03d}" for index in range(500)]
+    rng = np.random.default_rng(21)
+    prices = rng.uniform(2.0, 20.0, 200_000).tolist()
+    picks = rng.integers(0, len(symbols), 200_000).tolist()
+
+    started = time.perf_counter()
+    for tick, (pick, price) in enumerate(zip(picks, prices)):
+        store.append(symbols[pick], tick, price - 0.01, price + 0.01, price, 100.0, FLAG_TRADE)
+    append_ns = (time.perf_counter() - started) * 1e9 / len(prices)
+
+    started = time.perf_counter()
+    for symbol in symbols:
+        store.window(symbol, 300)
+    window_us = (time.perf_counter() - started) * 1e6 / len(symbols)
+
+    ring = store.ring("SYM007")
+    window = ring.window(300)
+    shares_memory = np.shares_memory(window.last, ring.last)
+    evicted = store.retain(symbols[:100])
+    for _ in range(TICK_STORE_EVICT_AFTER_SCANS - 1):
+        evicted = store.retain(symbols[:100])
+
+    print(
+        f"[BENCH] append {append_ns:.0f}ns/tick | window(300) {window_us:.1f}us/symbol "
+        f"zero-copy={shares_memory} | {store.bytes_allocated / 2**20:.1f} MiB for {len(store) + len(evicted)} symbols"
+    )
+    print(f"[BENCH] evicted {len(evicted)} symbol(s) absent from {TICK_STORE_EVICT_AFTER_SCANS} scans; {len(store)} kept")
@@ -8,6 +8,10 @@ to illustrate how information might flow between system stages.
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from telemetry.logger import get_logger
+
+log = get_logger("models")
+
 
 @dataclass
 class ScannerCandidate:
@@ -44,11 +48,31 @@ class ScannerResult:
     news_sentiment: Optional[float] = None
     news_regions: List[str] = field(default_factory=list)
     news_credibility_flag: Optional[bool] = None
+    trend_direction: Optional[str] = None
+    trend_strength: Optional[float] = None
+    volatility_risk_flag: Optional[bool] = None
     rationale_text: Optional[str] = None
     data_quality_flags: List[str] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        print(f"[INFO] ScannerResult instantiated for symbol={self.symbol} — skeleton container only")
+        log.debug("[INFO] ScannerResult instantiated for symbol=%s — skeleton container only", self.symbol)
+
+
+@dataclass
+class Bar:
+    """One closed OHLCV candle for a symbol and timeframe (market_data.bar_aggregator)."""
+
+    symbol: str  # Ticker the trades belong to.
+    timeframe_seconds: int  # Candle length, e.g. 10, 60 or 300.
+    start_ns: int  # UTC epoch nanoseconds at which the candle opens (inclusive).
+    end_ns: int  # UTC epoch nanoseconds at which it closes (exclusive); cut short at a session boundary.
+    open: float  # First trade price in the candle.
+    high: float  # Highest trade price.
+    low: float  # Lowest trade price.
+    close: float  # Last trade price.
+    volume: int  # Shares traded.
+    trade_count: int  # Number of trade prints.
+    session: str  # PRE, REGULAR or AFTER.
 
 
 @dataclass
@@ -123,11 +147,15 @@ class TradeRecord:
     strategy_output: List[TradeIntent] = field(default_factory=list)
     risk_output: List[RiskDecision] = field(default_factory=list)
     execution_output: List[ExecutionResult] = field(default_factory=list)
+    degradations: List[str] = field(default_factory=list)  # Optional work skipped to meet the cycle deadline.
 
     def __post_init__(self) -> None:
-        print(
+        log.debug(
             "[STORAGE] TradeRecord instantiated — capturing lists for each stage with "
-            f"{len(self.scanner_output)} scanner, {len(self.pattern_output)} patterns, "
-            f"{len(self.strategy_output)} intents, {len(self.risk_output)} risk decisions, "
-            f"{len(self.execution_output)} execution results."
+            "%s scanner, %s patterns, %s intents, %s risk decisions, %s execution results.",
+            len(self.scanner_output),
+            len(self.pattern_output),
+            len(self.strategy_output),
+            len(self.risk_output),
+            len(self.execution_output),
         )
@@ -3,18 +3,84 @@ Pattern engine skeleton illustrating how detected patterns might be evaluated.
 
 Phase 4: Deterministic, teaching-only pattern tagging based on scanner candidates.
 No real pattern recognition, indicators, or scoring logic is present.
+
+Phase 5: `evaluate_frame` applies the same rules to a columnar ScannerFrame
+with vectorized masks, building PatternResults only for matching rows.
+
+Phase 5: `on_bar_close` subscribes to market_data.bar_aggregator and keeps the
+last PATTERN_BAR_HISTORY closed candles per symbol and timeframe, so candle
+patterns can read 10s / 1m / 5m history through `recent_bars`.
 """
 
-from typing import List
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from config.system_config import PATTERN_BAR_HISTORY
+from models.data_models import Bar, PatternResult, ScannerCandidate
+from scanner.scanner_frame import ScannerFrame
+from telemetry.logger import get_logger
 
-from src.models.data_models import PatternResult, ScannerCandidate
+log = get_logger("patterns")
+
+GAP_AND_GO_NAME = "Gap and Go (Teaching)"
+GAP_AND_GO_CONFIDENCE = 0.82
+GAP_AND_GO_RATIONALE = (
+    "High gap paired with a relatively low float can fuel rapid moves; "
+    "tagging as a teaching-friendly gap-and-go scenario without claiming predictiveness."
+)
+MOMENTUM_NAME = "Momentum Continuation (Teaching)"
+MOMENTUM_CONFIDENCE = 0.58
+MOMENTUM_RATIONALE = (
+    "Moderate gap with higher float suggests continuation fueled by participation rather "
+    "than scarcity; labeling for classroom discussion of liquid momentum names."
+)
 
 
 class PatternEngine:
     """Minimal pattern engine placeholder with teaching-oriented logs."""
 
-    def __init__(self) -> None:
-        print("[BOOT] PatternEngine instantiated — phase 4 teaching placeholder (deterministic rules)")
+    def __init__(self, bar_history: int = PATTERN_BAR_HISTORY) -> None:
+        log.info("[BOOT] PatternEngine instantiated — phase 4 teaching placeholder (deterministic rules)")
+        self.bar_history = bar_history
+        self._bars: Dict[Tuple[str, int], Deque[Bar]] = {}
+
+    def on_bar_close(self, bar: Bar) -> None:
+        """BarAggregator subscriber: remember the closed candle for its symbol and timeframe."""
+
+        key = (bar.symbol, bar.timeframe_seconds)
+        history = self._bars.get(key)
+        if history is None:
+            history = self._bars[key] = deque(maxlen=self.bar_history)
+        history.append(bar)
+
+    def recent_bars(self, symbol: str, timeframe_seconds: int, count: int = 0) -> List[Bar]:
+        """Closed candles oldest → newest; the last `count` only when count > 0."""
+
+        history = self._bars.get((symbol, timeframe_seconds))
+        if not history:
+            return []
+        bars = list(history)
+        return bars[-count:] if count > 0 else bars
+
+    def bar_snapshot(self, symbols: Iterable[str]) -> Dict[Tuple[str, int], List[Bar]]:
+        """Candle history of `symbols` as plain lists, picklable for shard worker processes."""
+
+        wanted = set(symbols)
+        return {key: list(history) for key, history in self._bars.items() if key[0] in wanted}
+
+    def restore_bars(self, snapshot: Dict[Tuple[str, int], List[Bar]]) -> None:
+        """Replace all candle history with a bar_snapshot (shard workers, once per shard run)."""
+
+        self._bars = {key: deque(bars, maxlen=self.bar_history) for key, bars in snapshot.items()}
+
+    def forget_symbols(self, symbols: Iterable[str]) -> None:
+        """Drop candle history for symbols that left the scan."""
+
+        dropped = set(symbols)
+        for key in [key for key in self._bars if key[0] in dropped]:
+            del self._bars[key]
 
     def evaluate_patterns(self, scanner_candidates: List[ScannerCandidate]) -> List[PatternResult]:
         """
@@ -24,49 +90,45 @@ class PatternEngine:
         keep behavior transparent and repeatable.
         """
 
-        print(f"[PATTERN] Received {len(scanner_candidates)} scanner candidates for teaching evaluation")
+        log.info("[PATTERN] Received %s scanner candidates for teaching evaluation", len(scanner_candidates))
         pattern_results: List[PatternResult] = []
 
         for candidate in scanner_candidates:
-            print(
-                f"[PATTERN] Evaluating {candidate.symbol}: gap={candidate.gap_percent}% "
-                f"float={candidate.float_millions}M rVol={candidate.rvol} — {candidate.rationale}"
+            log.debug(
+                "[PATTERN] Evaluating %s: gap=%s%% float=%sM rVol=%s — %s",
+                candidate.symbol,
+                candidate.gap_percent,
+                candidate.float_millions,
+                candidate.rvol,
+                candidate.rationale,
             )
 
             pattern_assignment: PatternResult | None = None
 
             if candidate.gap_percent >= 8.0 and candidate.float_millions <= 50.0:
-                rationale = (
-                    "High gap paired with a relatively low float can fuel rapid moves; "
-                    "tagging as a teaching-friendly gap-and-go scenario without claiming predictiveness."
-                )
-                print(
+                log.debug(
                     "[PATTERN] Assigned 'Gap and Go (Teaching)' because the gap is at least 8% "
                     "and float is under or equal to 50M shares for a supply-driven move illustration."
                 )
                 pattern_assignment = PatternResult(
                     symbol=candidate.symbol,
-                    pattern_name="Gap and Go (Teaching)",
-                    confidence=0.82,
-                    rationale=rationale,
+                    pattern_name=GAP_AND_GO_NAME,
+                    confidence=GAP_AND_GO_CONFIDENCE,
+                    rationale=GAP_AND_GO_RATIONALE,
                 )
             elif 4.0 <= candidate.gap_percent < 8.0 and candidate.float_millions >= 100.0:
-                rationale = (
-                    "Moderate gap with higher float suggests continuation fueled by participation rather "
-                    "than scarcity; labeling for classroom discussion of liquid momentum names."
-                )
-                print(
+                log.debug(
                     "[PATTERN] Assigned 'Momentum Continuation (Teaching)' because the gap is between 4% and 8% "
                     "while float exceeds or equals 100M shares, highlighting liquidity-focused setups."
                 )
                 pattern_assignment = PatternResult(
                     symbol=candidate.symbol,
-                    pattern_name="Momentum Continuation (Teaching)",
-                    confidence=0.58,
-                    rationale=rationale,
+                    pattern_name=MOMENTUM_NAME,
+                    confidence=MOMENTUM_CONFIDENCE,
+                    rationale=MOMENTUM_RATIONALE,
                 )
             else:
-                print(
+                log.debug(
                     "[PATTERN] No pattern assigned — candidate does not meet teaching thresholds; "
                     "this models disciplined selectivity rather than prediction."
                 )
@@ -74,5 +136,33 @@ class PatternEngine:
             if pattern_assignment:
                 pattern_results.append(pattern_assignment)
 
-        print(f"[PATTERN] Completed evaluation — generated {len(pattern_results)} teaching pattern result(s)")
+        log.info("[PATTERN] Completed evaluation — generated %s teaching pattern result(s)", len(pattern_results))
+        return pattern_results
+
+    def evaluate_frame(self, frame: ScannerFrame) -> List[PatternResult]:
+        """
+        Vectorized twin of evaluate_patterns for a ScannerFrame.
+
+        Produces the same PatternResults in the same (row) order; only matching
+        rows are turned into Python objects.
+        """
+
+        log.info("[PATTERN] Received ScannerFrame with %s row(s) for vectorized evaluation", len(frame))
+        gap_and_go = (frame.gap_percent >= 8.0) & (frame.float_millions <= 50.0)
+        momentum = (frame.gap_percent >= 4.0) & (frame.gap_percent < 8.0) & (frame.float_millions >= 100.0)
+
+        rows = np.flatnonzero(gap_and_go | momentum)
+        # Convert the survivors to Python values in bulk; per-element NumPy
+        # indexing would dominate the cost of building the results.
+        pattern_results: List[PatternResult] = [
+            PatternResult(
+                symbol=symbol,
+                pattern_name=GAP_AND_GO_NAME if is_gap_and_go else MOMENTUM_NAME,
+                confidence=GAP_AND_GO_CONFIDENCE if is_gap_and_go else MOMENTUM_CONFIDENCE,
+                rationale=GAP_AND_GO_RATIONALE if is_gap_and_go else MOMENTUM_RATIONALE,
+            )
+            for symbol, is_gap_and_go in zip(frame.symbols[rows].tolist(), gap_and_go[rows].tolist())
+        ]
+
+        log.info("[PATTERN] Completed frame evaluation — generated %s teaching pattern result(s)", len(pattern_results))
         return pattern_results
@@ -8,6 +8,9 @@ from typing import Optional
 
 from core.active_trade_registry import ActiveTradeRegistry
 from models.data_models import RiskDecision, TradeIntent
+from telemetry.logger import get_logger
+
+log = get_logger("risk")
 
 
 class RiskEngine:
@@ -16,7 +19,7 @@ class RiskEngine:
     def __init__(
         self, trade_registry: Optional[ActiveTradeRegistry] = None
     ) -> None:
-        print("[BOOT] RiskEngine instantiated — phase 4 teaching rules active")
+        log.info("[BOOT] RiskEngine instantiated — phase 4 teaching rules active")
         self.trade_registry = trade_registry or ActiveTradeRegistry()
         self.strategy_limits = {
             "SCALPER": {
@@ -35,21 +38,24 @@ class RiskEngine:
         performing portfolio math, order routing, or broker interactions.
         """
 
-        print(f"[RISK] Evaluating TradeIntent for symbol={trade_intent.symbol}")
+        log.info("[RISK] Evaluating TradeIntent for symbol=%s", trade_intent.symbol)
 
         trader_type = getattr(trade_intent, "trader_type", "MANUAL").upper()
         current_active = self.trade_registry.count_active_by_trader(trader_type)
-        print(
-            f"[RISK:REGISTRY] Active trades for {trader_type} currently {current_active} "
-            "(registry single source of truth)"
+        log.debug(
+            "[RISK:REGISTRY] Active trades for %s currently %s (registry single source of truth)",
+            trader_type,
+            current_active,
         )
         strategy_limit = self.strategy_limits.get(trader_type)
         if strategy_limit:
             max_trades = strategy_limit.get("max_trades", 0)
             if current_active >= max_trades:
-                print(
-                    f"[RISK:STRATEGY] {trader_type} active={current_active} max={max_trades} "
-                    "→ BLOCKED (limit reached)"
+                log.info(
+                    "[RISK:STRATEGY] %s active=%s max=%s → BLOCKED (limit reached)",
+                    trader_type,
+                    current_active,
+                    max_trades,
                 )
                 rationale = (
                     f"Strategy {trader_type} reached its max active trades "
@@ -64,38 +70,40 @@ class RiskEngine:
                     trader_type=trader_type,
                 )
 
-            print(
-                f"[RISK:STRATEGY] {trader_type} active={current_active} max={max_trades} "
-                "→ ALLOW (within limit)"
+            log.info(
+                "[RISK:STRATEGY] %s active=%s max=%s → ALLOW (within limit)",
+                trader_type,
+                current_active,
+                max_trades,
             )
         else:
-            print(
-                f"[RISK:STRATEGY] {trader_type} has no configured limit — defaulting to ALLOW"
+            log.info(
+                "[RISK:STRATEGY] %s has no configured limit — defaulting to ALLOW", trader_type
             )
 
         allowed = True
         if trade_intent.direction.upper() == "LONG":
-            print("[RISK] Trade direction is LONG — teaching rule allows the idea to proceed")
+            log.debug("[RISK] Trade direction is LONG — teaching rule allows the idea to proceed")
             allowed = True
         else:
-            print(
+            log.debug(
                 "[RISK] Trade direction is not LONG — still allowed for teaching; "
                 "no blocking logic implemented"
             )
 
         max_position_size = 1
-        print("[RISK] Max position size capped at 1 share for safety and simplicity")
+        log.debug("[RISK] Max position size capped at 1 share for safety and simplicity")
 
         confidence = trade_intent.confidence
         if confidence >= 0.75:
             risk_level = "LOW"
-            print("[RISK] Confidence >= 0.75 — assigning risk level LOW for teaching clarity")
+            log.debug("[RISK] Confidence >= 0.75 — assigning risk level LOW for teaching clarity")
         elif confidence >= 0.50:
             risk_level = "MEDIUM"
-            print("[RISK] Confidence between 0.50 and 0.74 — assigning risk level MEDIUM")
+            log.debug("[RISK] Confidence between 0.50 and 0.74 — assigning risk level MEDIUM")
         else:
             risk_level = "HIGH"
-            print("[RISK] Confidence < 0.50 — assigning risk level HIGH to emphasize caution")
+            log.debug("[RISK] Confidence < 0.50 — assigning risk level HIGH to emphasize caution")
 
         rationale = (
             "Teaching-only decision: allow intent, cap size at 1 share, "
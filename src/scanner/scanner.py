@@ -5,32 +5,160 @@ Phase 3: Skeleton status only — this module contains placeholders for teaching
 No real scanning logic is implemented; outputs are empty for demonstration.
 """
 
-from typing import List
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Sequence
 
-from src.models.data_models import ScannerCandidate
+from config.system_config import SCANNER_PREFILTER_CRITERIA, SCANNER_PREFILTER_ENABLED
+from core.session_calendar import get_session_calendar
+from models.data_models import ScannerCandidate
+from scanner.scanner_frame import ScannerFrame
+from scanner.universe_index import UniverseIndex
+from telemetry.logger import DEBUG, get_logger
+
+log = get_logger("scanner")
+
+
+def select_top_ranked(candidates: List[ScannerCandidate], max_candidates: int) -> List[ScannerCandidate]:
+    """Keep the `max_candidates` best candidates by gap × rVol, preserving input order."""
+
+    ranked = sorted(candidates, key=lambda c: c.gap_percent * c.rvol, reverse=True)
+    keep = {id(candidate) for candidate in ranked[:max_candidates]}
+    return [candidate for candidate in candidates if id(candidate) in keep]
 
 
 class Scanner:
     """Minimal scanner placeholder with instructional logging."""
 
+    # Class-level defaults so subclasses that skip __init__ (replay, benchmarks)
+    # still have them.
+    prefilter_enabled: bool = SCANNER_PREFILTER_ENABLED
+    prefilter_criteria = SCANNER_PREFILTER_CRITERIA
+    _universe_index: Optional[UniverseIndex] = None
+
     def __init__(self) -> None:
-        print("[BOOT] Scanner instantiated — phase 4 teaching placeholder (static outputs)")
+        log.info("[BOOT] Scanner instantiated — phase 4 teaching placeholder (static outputs)")
+
+    def universe(self) -> List[str]:
+        """Return the symbols this scanner covers, in deterministic scan order."""
 
-    def run_scan_cycle(self) -> List[ScannerCandidate]:
+        return [candidate.symbol for candidate in self._teaching_candidates()]
+
+    def reference_data(self) -> List[Dict]:
         """
-        Demonstrate how a scan cycle would be invoked in a real system.
+        Slow-moving attributes per universe symbol, used to build the prefilter index.
 
-        Returns a deterministic list of hard-coded teaching candidates to let
-        downstream modules be exercised without touching real markets.
+        The teaching scanner derives previous close from price and gap; a real
+        scanner would load these from a reference-data source once per session.
         """
 
-        print("[SCAN] Teaching scan started — using static, fake symbols only")
-        print(
+        return [
+            {
+                "symbol": candidate.symbol,
+                "previous_close": round(candidate.price / (1.0 + candidate.gap_percent / 100.0), 2),
+                "float_millions": candidate.float_millions,
+                "avg_volume": None,
+            }
+            for candidate in self._teaching_candidates()
+        ]
+
+    def universe_index(self, session_date: Optional[date] = None) -> UniverseIndex:
+        """Return the prefilter index, rebuilding it when the trading date changes."""
+
+        if session_date is None:
+            session_date = datetime.now(get_session_calendar().tz).date()
+        if self._universe_index is None or self._universe_index.session_date != session_date:
+            self._universe_index = UniverseIndex.from_reference_rows(self.reference_data(), session_date)
+            log.info("[SCAN] Universe index rebuilt for %s — %s symbol(s)", session_date, len(self._universe_index))
+        return self._universe_index
+
+    def scan_universe(self) -> List[str]:
+        """Symbols that should reach enrichment this cycle: the prefilter survivors when enabled."""
+
+        if not self.prefilter_enabled:
+            return self.universe()
+        index = self.universe_index()
+        survivors = index.select(self.prefilter_criteria)
+        log.info("[SCAN] Prefilter kept %s of %s symbol(s)", len(survivors), len(index))
+        return survivors
+
+    def iter_scan_cycle(self, symbols: Optional[Sequence[str]] = None) -> Iterator[ScannerCandidate]:
+        """
+        Streaming variant of run_scan_cycle: yield each candidate as soon as it is produced.
+
+        Consumers can start pattern evaluation on the first symbol while the
+        rest of the universe is still being scanned. Symbol selection matches
+        run_scan_cycle; top-N degradation does not apply (ranking needs the
+        whole scan).
+        """
+
+        log.info("[SCAN] Teaching scan started — using static, fake symbols only")
+        log.debug(
             "[SCAN] These candidates are simulated for instruction; no live data, "
             "no randomness, no external calls"
         )
 
-        candidates: List[ScannerCandidate] = [
+        if symbols is None and self.prefilter_enabled:
+            symbols = self.scan_universe()
+
+        wanted = set(symbols) if symbols is not None else None
+        for candidate in self._teaching_candidates():
+            if wanted is None or candidate.symbol in wanted:
+                yield candidate
+
+    def run_scan_cycle(
+        self, max_candidates: Optional[int] = None, symbols: Optional[Sequence[str]] = None
+    ) -> List[ScannerCandidate]:
+        """
+        Demonstrate how a scan cycle would be invoked in a real system.
+
+        Returns a deterministic list of hard-coded teaching candidates to let
+        downstream modules be exercised without touching real markets. When
+        `symbols` is given (one shard of the universe) only those symbols are
+        scanned; otherwise the prefilter survivors are, when it is enabled.
+        When `max_candidates` is set (degraded cycles), only the top-ranked
+        candidates by gap × rVol are kept, in their original order.
+        """
+
+        candidates = list(self.iter_scan_cycle(symbols=symbols))
+
+        if max_candidates is not None and len(candidates) > max_candidates:
+            candidates = select_top_ranked(candidates, max_candidates)
+            log.info("[SCAN] Degraded scan — keeping top %s ranked candidates only", max_candidates)
+
+        if log.is_enabled_for(DEBUG):
+            for candidate in candidates:
+                log.debug(
+                    "[SCAN] Candidate %s: gap=%s%% rVol=%s float=%sM — %s",
+                    candidate.symbol,
+                    candidate.gap_percent,
+                    candidate.rvol,
+                    candidate.float_millions,
+                    candidate.rationale,
+                )
+
+        log.info("[SCAN] Returning static candidate list for downstream teaching modules")
+        return candidates
+
+    def run_scan_frame(
+        self, max_candidates: Optional[int] = None, symbols: Optional[Sequence[str]] = None
+    ) -> ScannerFrame:
+        """
+        Columnar variant of run_scan_cycle for vectorized downstream stages.
+
+        The teaching scanner builds its frame from the candidate list; a
+        market-data-backed scanner would fill the columns directly.
+        """
+
+        frame = ScannerFrame.from_candidates(self.run_scan_cycle(symbols=symbols))
+        if max_candidates is not None and len(frame) > max_candidates:
+            frame = frame.top_ranked(max_candidates)
+            log.info("[SCAN] Degraded frame scan — keeping top %s ranked rows only", max_candidates)
+        return frame
+
+    def _teaching_candidates(self) -> List[ScannerCandidate]:
+        """Build the static teaching candidates (fresh objects every cycle)."""
+
+        return [
             ScannerCandidate(
                 symbol="ABC",
                 price=12.35,
@@ -64,12 +192,3 @@ class Scanner:
                 rationale="Large-cap grinder with modest gap and steady rVol to illustrate higher-float behavior.",
             ),
         ]
-
-        for candidate in candidates:
-            print(
-                f"[SCAN] Candidate {candidate.symbol}: gap={candidate.gap_percent}% "
-                f"rVol={candidate.rvol} float={candidate.float_millions}M — {candidate.rationale}"
-            )
-
-        print("[SCAN] Returning static candidate list for downstream teaching modules")
-        return candidates
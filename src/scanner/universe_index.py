@@ -0,0 +1,186 @@
+"""
+Sorted-array prefilter index over the scanner universe.
+
+Phase 5: the momentum filters (price $1–$20, float under 20M, ...) discard
+well over 95% of a full-market universe, yet applying them meant visiting
+every symbol each cycle. The attributes they test — previous close, float,
+average volume — only change between sessions, so UniverseIndex sorts each
+of them once per session and answers a criterion with two binary searches:
+
+- `range_rows(column, low, high)` is O(log n) plus the size of the answer.
+- `query(criteria)` starts from the most selective range and checks the
+  remaining criteria on those rows only.
+
+Ranges follow ScannerFrame.where: low inclusive, high exclusive, None open.
+Missing values (NaN) never match a bounded or open range.
+
+Benchmark (synthetic universe):
+    cd src && python -m scanner.universe_index
+"""
+
+from datetime import date
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+INDEXED_COLUMNS = ("previous_close", "float_millions", "avg_volume")
+
+Criteria = Mapping[str, Tuple[Optional[float], Optional[float]]]
+
+
+class UniverseIndex:
+    """Per-session sorted views of the slow-moving reference attributes."""
+
+    __slots__ = ("symbols", "session_date", "_values", "_order", "_sorted", "_valid")
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        previous_close: Iterable[float],
+        float_millions: Iterable[float],
+        avg_volume: Optional[Iterable[float]] = None,
+        session_date: Optional[date] = None,
+    ) -> None:
+        self.symbols = np.asarray(symbols, dtype=object)
+        self.session_date = session_date
+        count = len(self.symbols)
+        columns = {
+            "previous_close": previous_close,
+            "float_millions": float_millions,
+            "avg_volume": np.full(count, np.nan) if avg_volume is None else avg_volume,
+        }
+        self._values: Dict[str, np.ndarray] = {}
+        self._order: Dict[str, np.ndarray] = {}
+        self._sorted: Dict[str, np.ndarray] = {}
+        self._valid: Dict[str, int] = {}
+        for name, values in columns.items():
+            column = np.asarray(values, dtype=np.float64)
+            # argsort puts NaN last, so the first `valid` sorted entries are real values.
+            order = np.argsort(column, kind="stable")
+            self._values[name] = column
+            self._order[name] = order
+            self._sorted[name] = column[order]
+            self._valid[name] = count - int(np.isnan(column).sum())
+
+    @classmethod
+    def from_reference_rows(cls, rows: Sequence[Mapping], session_date: Optional[date] = None) -> "UniverseIndex":
+        """Build from dicts with "symbol" plus any of the INDEXED_COLUMNS (missing → NaN)."""
+
+        def column(name: str) -> List[float]:
+            return [np.nan if row.get(name) is None else row[name] for row in rows]
+
+        return cls(
+            symbols=[row["symbol"] for row in rows],
+            previous_close=column("previous_close"),
+            float_millions=column("float_millions"),
+            avg_volume=column("avg_volume"),
+            session_date=session_date,
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __repr__(self) -> str:
+        return f"UniverseIndex(rows={len(self)}, session_date={self.session_date})"
+
+    # ----------------------------
+    # Range queries
+    # ----------------------------
+
+    def _bounds(self, name: str, low: Optional[float], high: Optional[float]) -> Tuple[int, int]:
+        if name not in INDEXED_COLUMNS:
+            raise KeyError(f"Unknown UniverseIndex column: {name}")
+        ordered = self._sorted[name]
+        valid = self._valid[name]
+        start = 0 if low is None else int(np.searchsorted(ordered[:valid], low, side="left"))
+        stop = valid if high is None else int(np.searchsorted(ordered[:valid], high, side="left"))
+        return start, max(start, stop)
+
+    def range_count(self, name: str, low: Optional[float] = None, high: Optional[float] = None) -> int:
+        start, stop = self._bounds(name, low, high)
+        return stop - start
+
+    def range_rows(self, name: str, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+        """Row ids with low <= column < high, in column order."""
+
+        start, stop = self._bounds(name, low, high)
+        return self._order[name][start:stop]
+
+    def query(self, criteria: Criteria) -> np.ndarray:
+        """Row ids matching every criterion, ascending (universe order)."""
+
+        if not criteria:
+            return np.arange(len(self), dtype=np.int64)
+        # Drive from the narrowest range; the others only see its rows.
+        driver = min(criteria, key=lambda name: self.range_count(name, *criteria[name]))
+        rows = self.range_rows(driver, *criteria[driver])
+        for name, (low, high) in criteria.items():
+            if name == driver or rows.size == 0:
+                continue
+            values = self._values[name][rows]
+            mask = ~np.isnan(values)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values < high
+            rows = rows[mask]
+        return np.sort(rows)
+
+    def select(self, criteria: Criteria) -> List[str]:
+        """Symbols matching every criterion, in universe order."""
+
+        return self.symbols[self.query(criteria)].tolist()
+
+
+def synthetic_reference_rows(size: int, seed: int = 11) -> List[Dict]:
+    """Deterministic full-market-like reference data used by benchmarks."""
+
+    rng = np.random.default_rng(seed)
+    previous_close = np.exp(rng.normal(3.2, 1.2, size)).round(2)
+    float_millions = np.exp(rng.normal(4.5, 1.5, size)).round(1)
+    avg_volume = np.exp(rng.normal(13.0, 1.5, size)).round(0)
+    return [
+        {
+            "symbol": f"SYM{index:06d}",
+            "previous_close": float(previous_close[index]),
+            "float_millions": float(float_millions[index]),
+            "avg_volume": float(avg_volume[index]),
+        }
+        for index in range(size)
+    ]
+
+
+if __name__ == "__main__":
+    import time
+
+    from config.system_config import SCANNER_PREFILTER_CRITERIA
+
+    for size in (10_000, 100_000):
+        rows = synthetic_reference_rows(size)
+
+        started = time.perf_counter()
+        index = UniverseIndex.from_reference_rows(rows)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        linear = [
+            row["symbol"]
+            for row in rows
+            if all(
+                row[name] is not None
+                and (low is None or row[name] >= low)
+                and (high is None or row[name] < high)
+                for name, (low, high) in SCANNER_PREFILTER_CRITERIA.items()
+            )
+        ]
+        linear_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        survivors = index.select(SCANNER_PREFILTER_CRITERIA)
+        query_ms = (time.perf_counter() - started) * 1000
+
+        print(
+            f"[BENCH] {size:,} symbols: build {build_ms:.2f}ms (once per session) | "
+            f"per-symbol filter {linear_ms:.2f}ms | index query {query_ms:.3f}ms | "
+            f"survivors {len(survivors):,} ({len(survivors) / size:.1%}) identical={survivors == linear}"
+        )
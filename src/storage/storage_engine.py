@@ -3,16 +3,26 @@ Storage engine skeleton illustrating where system activity would be persisted.
 
 Phase 3: Skeleton status only — this module is purely instructional.
 No database connections, file writes, or real persistence are implemented.
+
+Phase 5: DeferredStorageWriter lets the orchestrator hand a TradeRecord to a
+background thread when the cycle budget is nearly spent, so storage no longer
+sits on the intent path of a degraded cycle.
 """
 
+import queue
+import threading
+
 from models.data_models import TradeRecord
+from telemetry.logger import get_logger
+
+log = get_logger("storage")
 
 
 class StorageEngine:
     """Minimal storage engine placeholder with teaching-oriented logging."""
 
     def __init__(self) -> None:
-        print("[BOOT] StorageEngine instantiated — phase 3 skeleton only")
+        log.info("[BOOT] StorageEngine instantiated — phase 3 skeleton only")
 
     def store_trade_record(self, trade_record: TradeRecord) -> bool:
         """
@@ -22,7 +32,56 @@ class StorageEngine:
         occurs while providing clear instructional log messages.
         """
 
-        print("[STORAGE] Received TradeRecord for teaching-only storage flow")
-        print(f"[STORAGE] Record content (placeholder): {trade_record}")
-        print("[STORAGE] No data persisted — returning True as placeholder acknowledgement")
+        log.info("[STORAGE] Received TradeRecord for teaching-only storage flow")
+        log.debug("[STORAGE] Record content (placeholder): %s", trade_record)
+        log.debug("[STORAGE] No data persisted — returning True as placeholder acknowledgement")
         return True
+
+
+class DeferredStorageWriter:
+    """Write TradeRecords through a StorageEngine on a background thread."""
+
+    _STOP = object()
+
+    def __init__(self, storage_engine: StorageEngine) -> None:
+        log.info("[BOOT] DeferredStorageWriter instantiated — background storage for degraded cycles")
+        self.storage_engine = storage_engine
+        self._queue: queue.Queue = queue.Queue()
+        self.records_written = 0
+        self.records_failed = 0
+        self._thread = threading.Thread(target=self._drain, name="storage-deferred", daemon=True)
+        self._thread.start()
+
+    def submit(self, trade_record: TradeRecord) -> None:
+        """Queue a record for storage; returns immediately."""
+
+        self._queue.put(trade_record)
+        log.debug("[STORAGE] TradeRecord queued for deferred write (pending=%s)", self._queue.qsize())
+
+    def _drain(self) -> None:
+        while True:
+            trade_record = self._queue.get()
+            try:
+                if trade_record is self._STOP:
+                    return
+                self.storage_engine.store_trade_record(trade_record)
+                self.records_written += 1
+            except Exception as exc:
+                self.records_failed += 1
+                log.error("[ERROR] Deferred storage write failed: %s", exc)
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(self._STOP)
+        self._thread.join(timeout=5)
+        log.info(
+            "[SHUTDOWN] DeferredStorageWriter stopped — written=%s failed=%s",
+            self.records_written,
+            self.records_failed,
+        )
@@ -9,6 +9,9 @@ from typing import List
 
 from models.data_models import PatternResult, TradeIntent
 from strategy.base_strategy import BaseStrategy
+from telemetry.logger import get_logger
+
+log = get_logger("strategy.gap_and_go")
 
 
 class GapAndGoStrategy(BaseStrategy):
@@ -17,8 +20,8 @@ class GapAndGoStrategy(BaseStrategy):
     name = "GapAndGoStrategy"
 
     def evaluate(self, pattern_results: List[PatternResult]) -> List[TradeIntent]:
-        print(
-            f"[STRATEGY:GapAndGo] Evaluation start — received {len(pattern_results)} pattern(s) for review"
+        log.info(
+            "[STRATEGY:GapAndGo] Evaluation start — received %s pattern(s) for review", len(pattern_results)
         )
         trade_intents: List[TradeIntent] = []
         for pattern in pattern_results:
@@ -26,9 +29,11 @@ class GapAndGoStrategy(BaseStrategy):
                 rationale = (
                     f"{pattern.rationale} | Teaching note: translating 'Gap and Go' detection into a long SCALPER intent."
                 )
-                print(
+                log.debug(
                     "[STRATEGY:GapAndGo] Matched pattern — creating TradeIntent "
-                    f"for symbol={pattern.symbol} with confidence={pattern.confidence}"
+                    "for symbol=%s with confidence=%s",
+                    pattern.symbol,
+                    pattern.confidence,
                 )
                 trade_intents.append(
                     TradeIntent(
@@ -41,11 +46,13 @@ class GapAndGoStrategy(BaseStrategy):
                     )
                 )
             else:
-                print(
+                log.debug(
                     "[STRATEGY:GapAndGo] Skipped pattern — not a Gap and Go label "
-                    f"for symbol={pattern.symbol} (pattern='{pattern.pattern_name}')"
+                    "for symbol=%s (pattern='%s')",
+                    pattern.symbol,
+                    pattern.pattern_name,
                 )
-        print(
-            f"[STRATEGY:GapAndGo] Evaluation complete — generated {len(trade_intents)} TradeIntent(s)"
+        log.info(
+            "[STRATEGY:GapAndGo] Evaluation complete — generated %s TradeIntent(s)", len(trade_intents)
         )
         return trade_intents
@@ -11,6 +11,9 @@ from typing import List
 
 from models.data_models import PatternResult, TradeIntent
 from strategy.base_strategy import BaseStrategy
+from telemetry.logger import get_logger
+
+log = get_logger("strategy.momentum_continuation")
 
 
 class MomentumContinuationStrategy(BaseStrategy):
@@ -19,8 +22,8 @@ class MomentumContinuationStrategy(BaseStrategy):
     name = "MomentumContinuationStrategy"
 
     def evaluate(self, pattern_results: List[PatternResult]) -> List[TradeIntent]:
-        print(
-            f"[STRATEGY:Momentum] Evaluation start — received {len(pattern_results)} pattern(s) for review"
+        log.info(
+            "[STRATEGY:Momentum] Evaluation start — received %s pattern(s) for review", len(pattern_results)
         )
         trade_intents: List[TradeIntent] = []
         for pattern in pattern_results:
@@ -28,9 +31,11 @@ class MomentumContinuationStrategy(BaseStrategy):
                 rationale = (
                     f"{pattern.rationale} | Teaching note: translating 'Momentum Continuation' detection into a long MOMENTUM intent."
                 )
-                print(
+                log.debug(
                     "[STRATEGY:Momentum] Matched pattern — creating TradeIntent "
-                    f"for symbol={pattern.symbol} with confidence={pattern.confidence}"
+                    "for symbol=%s with confidence=%s",
+                    pattern.symbol,
+                    pattern.confidence,
                 )
                 trade_intents.append(
                     TradeIntent(
@@ -43,11 +48,13 @@ class MomentumContinuationStrategy(BaseStrategy):
                     )
                 )
             else:
-                print(
+                log.debug(
                     "[STRATEGY:Momentum] Skipped pattern — not a Momentum Continuation label "
-                    f"for symbol={pattern.symbol} (pattern='{pattern.pattern_name}')"
+                    "for symbol=%s (pattern='%s')",
+                    pattern.symbol,
+                    pattern.pattern_name,
                 )
-        print(
-            f"[STRATEGY:Momentum] Evaluation complete — generated {len(trade_intents)} TradeIntent(s)"
+        log.info(
+            "[STRATEGY:Momentum] Evaluation complete — generated %s TradeIntent(s)", len(trade_intents)
         )
         return trade_intents
@@ -6,6 +6,9 @@ from config.trading_config import ENABLED_STRATEGIES
 from models.data_models import PatternResult, TradeIntent
 from strategy.gap_and_go_strategy import GapAndGoStrategy
 from strategy.momentum_continuation_strategy import MomentumContinuationStrategy
+from telemetry.logger import get_logger
+
+log = get_logger("strategy")
 
 
 class StrategyRunner:
@@ -26,35 +29,35 @@ class StrategyRunner:
                     if strategy_name in ENABLED_STRATEGIES
                     else "missing from ENABLED_STRATEGIES; defaulting to DISABLED"
                 )
-                print(
-                    f"[BOOT] Strategy '{strategy_name}' DISABLED via config "
-                    f"({reason}); skipping."
+                log.info(
+                    "[BOOT] Strategy '%s' DISABLED via config (%s); skipping.", strategy_name, reason
                 )
                 continue
 
             strategy = strategy_class()
             self.strategies.append(strategy)
-            print(f"[BOOT] Strategy '{strategy_name}' ENABLED via config and registered.")
+            log.info("[BOOT] Strategy '%s' ENABLED via config and registered.", strategy_name)
 
         registered = ", ".join(strategy.name for strategy in self.strategies)
-        print(f"[BOOT] StrategyRunner instantiated with strategies: {registered}")
+        log.info("[BOOT] StrategyRunner instantiated with strategies: %s", registered)
 
     def generate_trade_intents(self, pattern_results: List[PatternResult]) -> List[TradeIntent]:
         """Call each registered strategy and aggregate their TradeIntent outputs."""
 
-        print(f"[STRATEGY] Dispatching {len(self.strategies)} strategy(ies)")
+        log.info("[STRATEGY] Dispatching %s strategy(ies)", len(self.strategies))
         all_intents: List[TradeIntent] = []
         for strategy in self.strategies:
-            print(
-                f"[STRATEGY] Evaluating strategy '{strategy.name}' with "
-                f"{len(pattern_results)} pattern result(s)"
+            log.debug(
+                "[STRATEGY] Evaluating strategy '%s' with %s pattern result(s)",
+                strategy.name,
+                len(pattern_results),
             )
             intents = strategy.evaluate(pattern_results)
-            print(
-                f"[STRATEGY] Strategy '{strategy.name}' returned {len(intents)} TradeIntent(s)"
+            log.debug(
+                "[STRATEGY] Strategy '%s' returned %s TradeIntent(s)", strategy.name, len(intents)
             )
             all_intents.extend(intents)
-        print(f"[STRATEGY] Aggregated TradeIntents from all strategies: {len(all_intents)} total")
+        log.info("[STRATEGY] Aggregated TradeIntents from all strategies: %s total", len(all_intents))
         return all_intents
 
     def generate_trade_intent(self, pattern_results: List[PatternResult]) -> List[TradeIntent]:
@@ -0,0 +1,316 @@
+"""
+Structured, asynchronous logging for the trading system.
+
+Phase 5: built on the `Logger` design from logging_framework_v01.py
+(STEP_23_OUTCOME_LOGGING_AND_TELEMETRY), replacing `print()` on the hot path.
+
+What changes compared to `print(f"...")`:
+- Lazy formatting: messages use %-style arguments, and the level check happens
+  before any formatting, so a disabled DEBUG line costs one comparison.
+- Per-module levels: `get_logger("scanner")` resolves its level from
+  LOG_MODULE_LEVELS (dotted names inherit from their parent, e.g.
+  "strategy.gap_and_go" falls back to "strategy") and then LOG_DEFAULT_LEVEL.
+- Non-blocking sink: enabled records are pushed onto a bounded queue and a
+  background thread does the stdout/file I/O. If the queue is full the record
+  is dropped and counted rather than stalling a cycle.
+- Structured output: LOG_OUTPUT_FORMAT = "JSON" writes one JSON object per line
+  (ts, level, module, tag, message, context) instead of plain text.
+
+The teaching-style `[TAG]` prefix stays part of every message; in JSON mode it
+is also split out into the "tag" field.
+"""
+
+import atexit
+import json
+import os
+import queue
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, TextIO
+
+from config.system_config import (
+    LOG_DEFAULT_LEVEL,
+    LOG_FILE_PATH,
+    LOG_MODULE_LEVELS,
+    LOG_OUTPUT_FORMAT,
+    LOG_QUEUE_MAXSIZE,
+    LOG_SINK,
+)
+
+DEBUG = 10
+INFO = 20
+WARN = 30
+ERROR = 40
+
+LEVELS: Dict[str, int] = {"DEBUG": DEBUG, "INFO": INFO, "WARN": WARN, "ERROR": ERROR}
+_LEVEL_NAMES: Dict[int, str] = {value: name for name, value in LEVELS.items()}
+
+_TAG_PATTERN = re.compile(r"^\[([^\]]+)\]\s*")
+
+
+# ================================
+# Sinks
+# ================================
+
+class _RecordWriter:
+    """Render a record as text or JSON and write it to the configured stream."""
+
+    def __init__(self, output_format: str, file_path: Optional[str]) -> None:
+        self.output_format = output_format.upper()
+        self._file: Optional[TextIO] = open(file_path, "a", encoding="utf-8") if file_path else None
+
+    def _stream(self) -> TextIO:
+        # sys.stdout is looked up per write so redirection after boot still works.
+        return self._file if self._file is not None else sys.stdout
+
+    def render(self, record: tuple) -> str:
+        timestamp, level, module, message, context = record
+        if self.output_format == "JSON":
+            match = _TAG_PATTERN.match(message)
+            entry = {
+                "ts": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
+                "level": _LEVEL_NAMES.get(level, str(level)),
+                "module": module,
+                "tag": match.group(1) if match else None,
+                "message": message[match.end():] if match else message,
+            }
+            if context:
+                entry["context"] = context
+            return json.dumps(entry, default=str)
+        return f"{message} | {context}" if context else message
+
+    def write(self, records: List[tuple]) -> None:
+        stream = self._stream()
+        stream.write("".join(self.render(record) + "\n" for record in records))
+        stream.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SyncLogSink:
+    """Write each record immediately on the calling thread (debugging / tests)."""
+
+    def __init__(self, writer: _RecordWriter) -> None:
+        self._writer = writer
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def submit(self, record: tuple) -> None:
+        with self._lock:
+            self._writer.write([record])
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class AsyncLogSink:
+    """Queue-backed sink; a daemon thread drains the queue and performs the I/O."""
+
+    _STOP = object()
+
+    def __init__(self, writer: _RecordWriter, maxsize: int = LOG_QUEUE_MAXSIZE) -> None:
+        self._writer = writer
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._drain, name="log-sink", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: tuple) -> None:
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = []
+            stop = item is self._STOP
+            if not stop:
+                batch.append(item)
+            # Write whatever else is already queued in one go.
+            while not stop:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            if batch:
+                try:
+                    self._writer.write(batch)
+                except Exception:
+                    pass
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(self._STOP)
+        self._thread.join(timeout=5)
+        self._writer.close()
+        if self.dropped:
+            sys.stderr.write(f"[WARNING] Log sink dropped {self.dropped} record(s) (queue full)\n")
+
+
+# ================================
+# Logger
+# ================================
+
+class Logger:
+    """
+    Logger
+    ------
+    Centralized, human-readable logger bound to one module name.
+
+    Messages keep their teaching `[TAG]` prefix; arguments are applied with
+    %-formatting only when the level is enabled.
+    """
+
+    def __init__(self, name: str, level: int) -> None:
+        self.name = name
+        self.level = level
+
+    def is_enabled_for(self, level: int) -> bool:
+        return level >= self.level
+
+    def debug(self, message: str, *args, context: Optional[dict] = None) -> None:
+        if DEBUG >= self.level:
+            self._emit(DEBUG, message, args, context)
+
+    def info(self, message: str, *args, context: Optional[dict] = None) -> None:
+        if INFO >= self.level:
+            self._emit(INFO, message, args, context)
+
+    def warn(self, message: str, *args, context: Optional[dict] = None) -> None:
+        if WARN >= self.level:
+            self._emit(WARN, message, args, context)
+
+    def error(self, message: str, *args, context: Optional[dict] = None) -> None:
+        if ERROR >= self.level:
+            self._emit(ERROR, message, args, context)
+
+    def recovery(self, message: str, *args, context: Optional[dict] = None) -> None:
+        if WARN >= self.level:
+            self._emit(WARN, message, args, context)
+
+    def pattern(self, message: str, *args, context: Optional[dict] = None) -> None:
+        if INFO >= self.level:
+            self._emit(INFO, message, args, context)
+
+    def _emit(self, level: int, message: str, args: tuple, context: Optional[dict]) -> None:
+        text = message % args if args else message
+        _get_sink().submit((_now(), level, self.name, text, context))
+
+
+def _now() -> float:
+    return datetime.now(timezone.utc).timestamp()
+
+
+# ================================
+# Registry & configuration
+# ================================
+
+_registry_lock = threading.Lock()
+_loggers: Dict[str, Logger] = {}
+_module_levels: Dict[str, int] = {name: LEVELS[level.upper()] for name, level in LOG_MODULE_LEVELS.items()}
+_default_level: int = LEVELS[LOG_DEFAULT_LEVEL.upper()]
+_sink = None
+
+
+def _resolve_level(name: str) -> int:
+    parts = name.split(".")
+    while parts:
+        level = _module_levels.get(".".join(parts))
+        if level is not None:
+            return level
+        parts.pop()
+    return _default_level
+
+
+def _get_sink():
+    global _sink
+    if _sink is None:
+        with _registry_lock:
+            if _sink is None:
+                writer = _RecordWriter(LOG_OUTPUT_FORMAT, LOG_FILE_PATH)
+                _sink = AsyncLogSink(writer) if LOG_SINK.upper() == "ASYNC" else SyncLogSink(writer)
+                atexit.register(shutdown_logging)
+    return _sink
+
+
+def _reset_after_fork() -> None:
+    # A forked child (e.g. a scan shard worker) inherits the parent's sink but
+    # not its writer thread; drop it so the child lazily builds its own.
+    global _registry_lock, _sink
+    _registry_lock = threading.Lock()
+    _sink = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_logger(name: str) -> Logger:
+    """Return the shared Logger for a module name, creating it on first use."""
+
+    logger = _loggers.get(name)
+    if logger is None:
+        with _registry_lock:
+            logger = _loggers.get(name)
+            if logger is None:
+                logger = Logger(name, _resolve_level(name))
+                _loggers[name] = logger
+    return logger
+
+
+def set_module_level(name: str, level: str) -> None:
+    """Change a module's level at runtime; child modules without their own level follow it."""
+
+    with _registry_lock:
+        _module_levels[name] = LEVELS[level.upper()]
+        for logger in _loggers.values():
+            logger.level = _resolve_level(logger.name)
+
+
+def set_default_level(level: str) -> None:
+    """Change the level used by every module without an explicit override."""
+
+    global _default_level
+    with _registry_lock:
+        _default_level = LEVELS[level.upper()]
+        for logger in _loggers.values():
+            logger.level = _resolve_level(logger.name)
+
+
+def flush_logging() -> None:
+    """Wait until every queued record has been written."""
+
+    if _sink is not None:
+        _sink.flush()
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the sink; called automatically at interpreter exit."""
+
+    global _sink
+    with _registry_lock:
+        sink, _sink = _sink, None
+    if sink is not None:
+        sink.close()
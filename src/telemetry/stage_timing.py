@@ -0,0 +1,229 @@
+"""
+Per-stage latency histograms for the Core Orchestrator.
+
+Phase 5: the `[SUMMARY]` line only counts what a cycle produced; it cannot say
+which stage consumed the cycle budget. This module times every stage with
+`time.perf_counter_ns` and keeps rolling HDR-style histograms so p50/p90/p99/max
+can be printed on demand or exported periodically as JSON lines.
+
+Design notes:
+- Buckets are log-linear (HDR style): exact below 2**SIGNIFICANT_BITS ns, then
+  each power of two is split into 2**(SIGNIFICANT_BITS-1) = 128 sub-buckets, so
+  a reported value is at most 1/128 (~0.78%) above the true sample, with a
+  fixed, small array of counters.
+- Recording is an integer bucket computation plus one list increment; no
+  allocation or sorting happens on the hot path.
+- "Rolling" means the histogram is split into time slots; slots older than the
+  window are cleared as time moves on, and reports merge the live slots.
+- Plain counters (e.g. "degraded.storage_deferred") sit alongside the
+  histograms for events that have a count but no duration.
+- One recorder is shared by the pipeline's stage threads, so recording,
+  counting and snapshots take a single (uncontended in run_once) lock.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from config.system_config import (
+    STAGE_TIMING_ENABLED,
+    STAGE_TIMING_EXPORT_INTERVAL_SECONDS,
+    STAGE_TIMING_EXPORT_PATH,
+    STAGE_TIMING_WINDOW_SECONDS,
+)
+from telemetry.logger import get_logger
+
+log = get_logger("telemetry.stage_timing")
+
+SIGNIFICANT_BITS = 8
+_SUB_BUCKETS = 1 << SIGNIFICANT_BITS
+_HALF_SUB_BUCKETS = _SUB_BUCKETS >> 1
+# Largest tracked value is ~2**42 ns (~73 minutes); longer samples are clamped.
+_MAX_SHIFT = 42 - SIGNIFICANT_BITS
+_BUCKET_COUNT = _HALF_SUB_BUCKETS * (_MAX_SHIFT + 1) + _HALF_SUB_BUCKETS
+
+REPORTED_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+def _bucket_index(value_ns: int) -> int:
+    if value_ns < _SUB_BUCKETS:
+        return value_ns if value_ns > 0 else 0
+    shift = value_ns.bit_length() - SIGNIFICANT_BITS
+    if shift > _MAX_SHIFT:
+        return _BUCKET_COUNT - 1
+    return _HALF_SUB_BUCKETS * shift + (value_ns >> shift)
+
+
+def _bucket_upper_value(index: int) -> int:
+    """Highest value that maps to a bucket (HDR "highest equivalent value")."""
+
+    if index < _SUB_BUCKETS:
+        return index
+    shift = index // _HALF_SUB_BUCKETS - 1
+    sub_bucket = index - _HALF_SUB_BUCKETS * shift
+    return ((sub_bucket + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Rolling log-linear histogram of nanosecond samples."""
+
+    def __init__(self, window_seconds: float = STAGE_TIMING_WINDOW_SECONDS, slots: int = 6) -> None:
+        self._slot_ns = max(int(window_seconds * 1_000_000_000 / slots), 1)
+        self._slots: List[List[int]] = [[0] * _BUCKET_COUNT for _ in range(slots)]
+        self._slot_max: List[int] = [0] * slots
+        self._slot_epoch: List[int] = [-1] * slots
+
+    def record(self, value_ns: int, now_ns: Optional[int] = None) -> None:
+        epoch = (now_ns if now_ns is not None else time.perf_counter_ns()) // self._slot_ns
+        slot = epoch % len(self._slots)
+        if self._slot_epoch[slot] != epoch:
+            # Slot last held samples from an expired window; reuse it.
+            self._slots[slot] = [0] * _BUCKET_COUNT
+            self._slot_max[slot] = 0
+            self._slot_epoch[slot] = epoch
+        self._slots[slot][_bucket_index(value_ns)] += 1
+        if value_ns > self._slot_max[slot]:
+            self._slot_max[slot] = value_ns
+
+    def summary(self, now_ns: Optional[int] = None) -> Dict[str, float]:
+        """Merge live slots and return count, p50/p90/p99 and max in milliseconds."""
+
+        epoch = (now_ns if now_ns is not None else time.perf_counter_ns()) // self._slot_ns
+        oldest_live = epoch - len(self._slots) + 1
+        merged = [0] * _BUCKET_COUNT
+        max_ns = 0
+        for slot, counts in enumerate(self._slots):
+            if self._slot_epoch[slot] < oldest_live:
+                continue
+            for i, count in enumerate(counts):
+                if count:
+                    merged[i] += count
+            max_ns = max(max_ns, self._slot_max[slot])
+
+        total = sum(merged)
+        stats: Dict[str, float] = {"count": total}
+        thresholds = [(pct, max(1, math.ceil(total * pct / 100.0))) for pct in REPORTED_PERCENTILES]
+        running = 0
+        pending = list(thresholds)
+        for index, count in enumerate(merged):
+            if not count:
+                continue
+            running += count
+            while pending and running >= pending[0][1]:
+                pct, _ = pending.pop(0)
+                stats[f"p{int(pct)}_ms"] = min(_bucket_upper_value(index), max_ns) / 1_000_000
+            if not pending:
+                break
+        for pct, _ in pending:
+            stats[f"p{int(pct)}_ms"] = 0.0
+        stats["max_ms"] = max_ns / 1_000_000
+        return stats
+
+
+class StageTimingRecorder:
+    """
+    Collect stage timings for the orchestrator.
+
+    Usage:
+        with recorder.stage("scan"):
+            ...
+    """
+
+    def __init__(
+        self,
+        enabled: bool = STAGE_TIMING_ENABLED,
+        export_path: Optional[str] = STAGE_TIMING_EXPORT_PATH,
+        export_interval_seconds: float = STAGE_TIMING_EXPORT_INTERVAL_SECONDS,
+    ) -> None:
+        self.enabled = enabled
+        self.export_path = export_path
+        self.export_interval_ns = int(export_interval_seconds * 1_000_000_000)
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._last_export_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            finished_ns = time.perf_counter_ns()
+            self.record_ns(name, finished_ns - started_ns, finished_ns)
+
+    def record_ns(self, name: str, elapsed_ns: int, now_ns: Optional[int] = None) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(elapsed_ns, now_ns)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Bump a named counter (cumulative since start, not windowed)."""
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    # ----------------------------
+    # Reporting
+    # ----------------------------
+
+    def counters(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            now_ns = time.perf_counter_ns()
+            return {name: hist.summary(now_ns) for name, hist in self._histograms.items()}
+
+    def format_report(self) -> List[str]:
+        lines = []
+        for name, stats in self.snapshot().items():
+            lines.append(
+                f"[TIMING] stage={name} count={stats['count']} "
+                f"p50={stats['p50_ms']:.3f}ms p90={stats['p90_ms']:.3f}ms "
+                f"p99={stats['p99_ms']:.3f}ms max={stats['max_ms']:.3f}ms"
+            )
+        for name, count in sorted(self.counters().items()):
+            lines.append(f"[TIMING] counter={name} count={count}")
+        return lines
+
+    def dump(self) -> None:
+        """Log the current rolling report (on demand, e.g. from a signal handler)."""
+
+        lines = self.format_report()
+        if not lines:
+            log.info("[TIMING] No stage timings recorded yet.")
+        for line in lines:
+            log.info(line)
+
+    def maybe_export(self) -> bool:
+        """Append a JSON-lines snapshot to export_path once per export interval."""
+
+        if not self.enabled or not self.export_path:
+            return False
+        now_ns = time.perf_counter_ns()
+        with self._lock:
+            if now_ns - self._last_export_ns < self.export_interval_ns:
+                return False
+            self._last_export_ns = now_ns
+        self.export(self.export_path)
+        return True
+
+    def export(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        record = {"exported_at": time.time(), "stages": self.snapshot(), "counters": self.counters()}
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+        log.debug("[TIMING] Stage timing snapshot exported to %s", path)